@@ -0,0 +1,79 @@
+"""Import-time profile of the server, taken with `python -X importtime`."""
+
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from loguru import logger
+
+SERVER_MODULE = "src.app.bootstrap.server"
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportTime]:
+    """Parse the `-X importtime` lines of a stderr output."""
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            # Header line
+            continue
+        rows.append(ImportTime(fields[2].strip(), self_us, cumulative_us))
+    return rows
+
+
+def time_by_package(rows: List[ImportTime]) -> Dict[str, int]:
+    """Sum the self time of modules by top-level package, in microseconds."""
+    totals: Dict[str, int] = defaultdict(int)
+    for row in rows:
+        totals[row.module.split(".", 1)[0]] += row.self_us
+    return dict(totals)
+
+
+def profile_imports(
+    module: str = SERVER_MODULE, timeout: float = 300
+) -> List[ImportTime]:
+    """Import a module in a fresh interpreter and get the time of each import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        logger.warning(f"Importing {module} for the import profile failed")
+    return parse_importtime(result.stderr)
+
+
+def log_import_profile(module: str = SERVER_MODULE, top: int = 15) -> None:
+    """Log the total import time of a module and its slowest packages."""
+    try:
+        rows = profile_imports(module)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning(f"Import profile failed: {e}")
+        return
+    if not rows:
+        logger.warning("Import profile is empty")
+        return
+
+    total_us = sum(row.self_us for row in rows)
+    logger.info(
+        f"Importing {module} takes {total_us / 1e6:.2f}s ({len(rows)} modules). Slowest packages:"
+    )
+    packages = sorted(
+        time_by_package(rows).items(), key=lambda item: item[1], reverse=True
+    )
+    for package, package_us in packages[:top]:
+        logger.info(f"  {package_us / 1e6:7.3f}s  {package}")
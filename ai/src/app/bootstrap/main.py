@@ -2,6 +2,7 @@ import os
 import sys
 import atexit
 import asyncio
+import time
 import os
 import argparse
 from pathlib import Path
@@ -10,6 +11,9 @@ import uvicorn
 from loguru import logger
 from dotenv import load_dotenv
 
+from src.app.bootstrap.workers import run_workers, worker_ports
+from src.app.bootstrap.import_profile import log_import_profile
+
 # Load environment variables
 load_dotenv()
 
@@ -57,6 +61,11 @@ def parse_args():
     parser.add_argument(
         "--hf_mirror", action="store_true", help="Use Hugging Face mirror"
     )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Log the import time of the server and its slowest packages before starting",
+    )
     return parser.parse_args()
 
 
@@ -97,10 +106,13 @@ def free_port(port: int):
 
 
 @logger.catch
-def run(console_log_level: str):
+def run(console_log_level: str, profile_imports: bool = False):
     init_logger(console_log_level)
     logger.info(f"Open-LLM-VTuber, version v{get_version()}")
 
+    if profile_imports:
+        log_import_profile()
+
     atexit.register(WebSocketServer.clean_cache)
 
     # Load configurations from yaml file
@@ -113,14 +125,24 @@ def run(console_log_level: str):
     if server_config.enable_proxy:
         logger.info("Proxy mode enabled - /proxy-ws endpoint will be available")
 
+    if server_config.workers > 1:
+        for port in worker_ports(config):
+            free_port(port)
+        logger.info(f"Starting {server_config.workers} workers")
+        run_workers(config, console_log_level)
+        return
+
     # Initialize the WebSocket server (synchronous part)
     server = WebSocketServer(config=config)
 
     # Perform asynchronous initialization (loading context, etc.)
     logger.info("Initializing server context...")
     try:
+        start = time.perf_counter()
         asyncio.run(server.initialize())
-        logger.info("Server context initialized successfully.")
+        logger.info(
+            f"Server context initialized successfully in {time.perf_counter() - start:.1f}s."
+        )
     except Exception as e:
         logger.error(f"Failed to initialize server context: {e}")
         sys.exit(1)  # Exit if initialization fails
@@ -146,4 +168,4 @@ if __name__ == "__main__":
         )
     if args.hf_mirror:
         os.environ["HF_ENDPOINT"] = "https://hf-mirror.com"
-    run(console_log_level=console_log_level)
+    run(console_log_level=console_log_level, profile_imports=args.profile_imports)
@@ -6,6 +6,7 @@ the WebSocket connections, serves static files, and manages the web tool.
 It uses FastAPI for the server and Starlette for static file serving.
 """
 
+import asyncio
 import os
 import shutil
 
@@ -14,9 +15,18 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import Response
 from starlette.staticfiles import StaticFiles as StarletteStaticFiles
 
-from .routes import init_client_ws_route, init_proxy_route, init_analysis_routes, init_report_routes
+from .routes import (
+    init_client_ws_route,
+    init_proxy_route,
+    init_analysis_routes,
+    init_report_routes,
+    init_metrics_routes,
+)
 from .service_context import ServiceContext
+from .mcpp.mcp_runtime import MCPRuntime
+from .agent.rag.jd_crawler import JDCrawler
 from .config_manager.utils import Config
+from .utils.turn_trace import TurnTracer
 
 
 # Create a custom StaticFiles class that adds CORS headers
@@ -88,6 +98,14 @@ class WebSocketServer:
             allow_headers=["*"],
         )
 
+        # Stop the MCP server processes shared by all sessions
+        self.app.add_event_handler("shutdown", MCPRuntime.get_instance().aclose)
+        # Close the pooled HTTP client of the JD crawler
+        self.app.add_event_handler("shutdown", JDCrawler.get_instance().aclose)
+        # Build lazily created engines once the server is up
+        self._warm_up_task: asyncio.Task | None = None
+        self.app.add_event_handler("startup", self._start_warm_up)
+
         # Include routes, passing the context instance
         # The context will be populated during the initialize step
         self.app.include_router(
@@ -99,6 +117,9 @@ class WebSocketServer:
         self.app.include_router(
             init_report_routes(service_context=self.default_context_cache)
         )
+        # Turn latency histograms, and traces to a file if configured
+        TurnTracer.get_instance().configure(config.system_config.turn_trace_file)
+        self.app.include_router(init_metrics_routes())
 
         # Initialize and include proxy routes if proxy is enabled
         system_config = config.system_config
@@ -142,6 +163,13 @@ class WebSocketServer:
         Calling this function is needed if default_context_cache was not provided to the constructor."""
         await self.default_context_cache.load_from_config(self.config)
 
+    async def _start_warm_up(self):
+        system_config = self.config.system_config
+        if system_config.lazy_engines and system_config.warm_up_engines:
+            self._warm_up_task = asyncio.create_task(
+                self.default_context_cache.warm_up()
+            )
+
     @staticmethod
     def clean_cache():
         """Clean the cache directory by removing and recreating it."""
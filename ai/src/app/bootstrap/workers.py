@@ -0,0 +1,349 @@
+"""
+Multi-process worker mode
+=========================
+With `system_config.workers` > 1 the server runs that many worker processes,
+each a complete server on 127.0.0.1:(port + 1 + i), behind a sticky router on
+host:port.
+
+Client UIDs carry the worker that created them (`w<worker>-<uuid>`). The
+router sends requests naming a client UID (`X-Client-Uid` header, `client_uid`
+query parameter or `/interview/report/<uid>`) to that worker, so per-client
+state (service contexts, interview sessions) stays in one process. New
+connections go to the worker with the fewest open connections. A WebSocket
+stays on its worker for its whole life; plain HTTP requests are sent with
+`Connection: close`, so each one is routed on its own.
+
+Chat groups only span clients of the same worker.
+
+With `system_config.preload_models`, the parent loads the models once and forks
+the workers afterwards, so model weights are shared copy-on-write instead of
+being loaded by each worker. The supervisor logs the memory of each worker
+every MEMORY_REPORT_INTERVAL_S seconds.
+"""
+
+import asyncio
+import gc
+import multiprocessing
+import os
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+from loguru import logger
+
+WORKER_ID_ENV = "OLV_WORKER_ID"
+# Longest request head the router reads before picking a worker
+MAX_HEAD_BYTES = 64 * 1024
+RESTART_CHECK_INTERVAL_S = 1.0
+MEMORY_REPORT_INTERVAL_S = 300.0
+
+
+def new_client_uid() -> str:
+    """Create a client UID, tagged with the worker of this process if any."""
+    worker_id = os.environ.get(WORKER_ID_ENV)
+    if worker_id is None:
+        return str(uuid4())
+    return f"w{worker_id}-{uuid4()}"
+
+
+def worker_of(client_uid: str, workers: int) -> int:
+    """Get the worker serving a client UID."""
+    prefix, sep, _ = client_uid.partition("-")
+    if sep and prefix[:1] == "w" and prefix[1:].isdigit():
+        worker_id = int(prefix[1:])
+        if worker_id < workers:
+            return worker_id
+    # UIDs from elsewhere still map to one worker consistently
+    return zlib.crc32(client_uid.encode("utf-8")) % workers
+
+
+def affinity_key(target: str, headers: Dict[str, str]) -> Optional[str]:
+    """Get the client UID a request is about, if any.
+
+    Args:
+        target: Request target (path and query).
+        headers: Request headers with lower-case names.
+    """
+    if headers.get("x-client-uid"):
+        return headers["x-client-uid"]
+    url = urlsplit(target)
+    client_uid = parse_qs(url.query).get("client_uid")
+    if client_uid:
+        return client_uid[0]
+    if url.path.startswith("/interview/report/"):
+        return url.path.rsplit("/", 1)[-1] or None
+    return None
+
+
+def parse_head(head: bytes) -> Tuple[str, List[str], Dict[str, str]]:
+    """Split a request head into its target, header lines and headers."""
+    lines = head.decode("latin-1").split("\r\n")
+    request_line, header_lines = lines[0], [line for line in lines[1:] if line]
+    parts = request_line.split(" ")
+    target = parts[1] if len(parts) >= 2 else "/"
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return target, [request_line] + header_lines, headers
+
+
+class StickyRouter:
+    """TCP-level router in front of the worker processes.
+
+    Args:
+        host: Public host to listen on.
+        port: Public port to listen on.
+        worker_ports: Port of each worker on 127.0.0.1.
+    """
+
+    def __init__(self, host: str, port: int, worker_ports: List[int]):
+        self.host = host
+        self.port = port
+        self.worker_ports = worker_ports
+        # Open connections per worker
+        self.active = [0] * len(worker_ports)
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_HEAD_BYTES
+        )
+
+    async def close(self) -> None:
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+    def pick_worker(self, key: Optional[str]) -> int:
+        if key:
+            return worker_of(key, len(self.worker_ports))
+        return min(range(len(self.worker_ports)), key=self.active.__getitem__)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=30)
+        except (
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            ConnectionError,
+        ):
+            writer.close()
+            return
+
+        target, lines, headers = parse_head(head)
+        if headers.get("upgrade", "").lower() != "websocket":
+            # One request per connection, so the next one is routed on its own
+            lines = [
+                line
+                for line in lines
+                if line.partition(":")[0].strip().lower()
+                not in ("connection", "keep-alive")
+            ] + ["Connection: close"]
+            head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        worker_id = self.pick_worker(affinity_key(target, headers))
+        try:
+            up_reader, up_writer = await asyncio.open_connection(
+                "127.0.0.1", self.worker_ports[worker_id]
+            )
+        except OSError as e:
+            logger.error(f"Worker {worker_id} is unreachable: {e}")
+            writer.write(
+                b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n"
+            )
+            await self._close(writer)
+            return
+
+        self.active[worker_id] += 1
+        try:
+            up_writer.write(head)
+            to_worker = asyncio.create_task(self._pipe(reader, up_writer))
+            try:
+                await self._pipe(up_reader, writer)
+            finally:
+                to_worker.cancel()
+                await asyncio.gather(to_worker, return_exceptions=True)
+        finally:
+            self.active[worker_id] -= 1
+            await self._close(up_writer)
+            await self._close(writer)
+
+    @staticmethod
+    async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while data := await reader.read(65536):
+                writer.write(data)
+                await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+        except (ConnectionError, OSError):
+            pass
+
+    @staticmethod
+    async def _close(writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+def process_memory(pid: int) -> Dict[str, int]:
+    """Get the memory of a process in bytes: rss, pss, shared and private.
+
+    Empty where /proc/<pid>/smaps_rollup is not available (non-Linux).
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == "kB":
+                    fields[name] = int(parts[0]) * 1024
+    except OSError:
+        return {}
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def format_memory(memory: Dict[str, int]) -> str:
+    return ", ".join(f"{name} {value / 2**20:.0f} MB" for name, value in memory.items())
+
+
+def preload_server(config):
+    """Load the models in this process, to be inherited by forked workers."""
+    from .server import WebSocketServer
+
+    async def load():
+        await server.initialize()
+        # Lazy engines too, workers should inherit them built
+        await server.default_context_cache.warm_up()
+
+    start = time.perf_counter()
+    server = WebSocketServer(config=config)
+    asyncio.run(load())
+    # Keep the garbage collector from writing to the inherited objects,
+    # which would copy their pages into every worker
+    gc.collect()
+    gc.freeze()
+    memory = process_memory(os.getpid())
+    logger.info(
+        f"Preloaded models in {time.perf_counter() - start:.1f}s"
+        + (f" ({format_memory(memory)})" if memory else "")
+    )
+    return server
+
+
+def run_worker(
+    worker_id: int, port: int, config, console_log_level: str, server=None
+) -> None:
+    """Entry point of a worker process: a complete server on 127.0.0.1:port.
+
+    Args:
+        server: WebSocketServer preloaded by the parent, loaded here if None.
+    """
+    import uvicorn
+
+    os.environ[WORKER_ID_ENV] = str(worker_id)
+    if server is None:
+        from .server import WebSocketServer
+
+        server = WebSocketServer(config=config)
+        asyncio.run(server.initialize())
+    logger.info(f"Worker {worker_id} (pid {os.getpid()}) serving on 127.0.0.1:{port}")
+    uvicorn.run(
+        app=server.app,
+        host="127.0.0.1",
+        port=port,
+        log_level=console_log_level.lower(),
+    )
+
+
+def worker_ports(config) -> List[int]:
+    system_config = config.system_config
+    return [system_config.port + 1 + i for i in range(system_config.workers)]
+
+
+def run_workers(config, console_log_level: str) -> None:
+    """Run the worker processes behind a sticky router until interrupted.
+
+    Workers that exit are restarted, from the preloaded models if any.
+    """
+    system_config = config.system_config
+    ports = worker_ports(config)
+    can_fork = hasattr(os, "fork")
+    mp = multiprocessing.get_context("fork" if can_fork else "spawn")
+    processes: Dict[int, multiprocessing.Process] = {}
+
+    server = None
+    if system_config.preload_models:
+        if can_fork:
+            server = preload_server(config)
+        else:
+            logger.warning(
+                "preload_models needs fork, each worker loads its own models"
+            )
+
+    def start(worker_id: int) -> None:
+        process = mp.Process(
+            target=run_worker,
+            args=(worker_id, ports[worker_id], config, console_log_level, server),
+            name=f"olv-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        processes[worker_id] = process
+
+    def report_memory(router: StickyRouter) -> None:
+        for worker_id, process in sorted(processes.items()):
+            memory = process_memory(process.pid)
+            if memory:
+                logger.info(
+                    f"Worker {worker_id} (pid {process.pid}): {format_memory(memory)}, "
+                    f"{router.active[worker_id]} connections"
+                )
+
+    async def supervise() -> None:
+        router = StickyRouter(system_config.host, system_config.port, ports)
+        await router.start()
+        logger.info(
+            f"Routing {system_config.host}:{system_config.port} to {len(ports)} workers on ports {ports}"
+        )
+        next_report = time.monotonic() + MEMORY_REPORT_INTERVAL_S
+        try:
+            while True:
+                await asyncio.sleep(RESTART_CHECK_INTERVAL_S)
+                if time.monotonic() >= next_report:
+                    next_report += MEMORY_REPORT_INTERVAL_S
+                    report_memory(router)
+                for worker_id, process in list(processes.items()):
+                    if not process.is_alive():
+                        logger.warning(
+                            f"Worker {worker_id} exited with code {process.exitcode}, restarting"
+                        )
+                        start(worker_id)
+        finally:
+            await router.close()
+
+    for worker_id in range(len(ports)):
+        start(worker_id)
+    try:
+        asyncio.run(supervise())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes.values():
+            process.terminate()
+        for process in processes.values():
+            process.join(timeout=10)
@@ -1,9 +1,16 @@
 from typing import Dict, List, Optional, Set, Tuple, Callable, Any
 from dataclasses import dataclass
 from fastapi import WebSocket
+import asyncio
 import json
 from loguru import logger
 
+from .send_queue import ConnectionSender
+
+# Broadcast messages a lagging member can miss: forwarded audio only mirrors
+# another member's speech (display text and lip-sync volumes)
+DROPPABLE_BROADCAST_TYPES = {"audio"}
+
 
 @dataclass
 class Group:
@@ -185,14 +192,12 @@ async def handle_group_operation(
                     # Send group update to the newly invited member
                     await send_group_update(client_connections[target_uid], target_uid)
                     # Notify the invited member
-                    await client_connections[target_uid].send_text(
-                        json.dumps(
-                            {
-                                "type": "group-operation-result",
-                                "success": True,
-                                "message": f"You have been invited to the group by {client_uid}",
-                            }
-                        )
+                    await client_connections[target_uid].send_json(
+                        {
+                            "type": "group-operation-result",
+                            "success": True,
+                            "message": f"You have been invited to the group by {client_uid}",
+                        }
                     )
                 except Exception as e:
                     logger.error(f"Failed to update invited member {target_uid}: {e}")
@@ -203,14 +208,12 @@ async def handle_group_operation(
             )
 
         # Send operation result to the initiator
-        await client_connections[client_uid].send_text(
-            json.dumps(
-                {
-                    "type": "group-operation-result",
-                    "success": success,
-                    "message": message,
-                }
-            )
+        await client_connections[client_uid].send_json(
+            {
+                "type": "group-operation-result",
+                "success": success,
+                "message": message,
+            }
         )
 
         if success:
@@ -218,14 +221,12 @@ async def handle_group_operation(
             if operation != "add-client-to-group" and target_uid in client_connections:
                 try:
                     await send_group_update(client_connections[target_uid], target_uid)
-                    await client_connections[target_uid].send_text(
-                        json.dumps(
-                            {
-                                "type": "group-operation-result",
-                                "success": True,
-                                "message": "You have been removed from the group",
-                            }
-                        )
+                    await client_connections[target_uid].send_json(
+                        {
+                            "type": "group-operation-result",
+                            "success": True,
+                            "message": "You have been removed from the group",
+                        }
                     )
                 except Exception as e:
                     logger.error(f"Failed to update removed member {target_uid}: {e}")
@@ -242,18 +243,16 @@ async def handle_group_operation(
                             client_connections[member_uid], member_uid
                         )
                         if member_uid != client_uid:
-                            await client_connections[member_uid].send_text(
-                                json.dumps(
-                                    {
-                                        "type": "group-operation-result",
-                                        "success": True,
-                                        "message": (
-                                            f"Member {target_uid} was "
-                                            f"{'added to' if operation == 'add-client-to-group' else 'removed from'} "
-                                            "the group"
-                                        ),
-                                    }
-                                )
+                            await client_connections[member_uid].send_json(
+                                {
+                                    "type": "group-operation-result",
+                                    "success": True,
+                                    "message": (
+                                        f"Member {target_uid} was "
+                                        f"{'added to' if operation == 'add-client-to-group' else 'removed from'} "
+                                        "the group"
+                                    ),
+                                }
                             )
                     except Exception as e:
                         logger.error(f"Failed to update member {member_uid}: {e}")
@@ -273,14 +272,12 @@ async def handle_client_disconnect(
     for member_uid in old_group_members:
         if member_uid != client_uid and member_uid in client_connections:
             await send_group_update(client_connections[member_uid], member_uid)
-            await client_connections[member_uid].send_text(
-                json.dumps(
-                    {
-                        "type": "group-operation-result",
-                        "success": True,
-                        "message": f"Member {client_uid} disconnected",
-                    }
-                )
+            await client_connections[member_uid].send_json(
+                {
+                    "type": "group-operation-result",
+                    "success": True,
+                    "message": f"Member {client_uid} disconnected",
+                }
             )
 
 
@@ -290,10 +287,36 @@ async def broadcast_to_group(
     client_connections: Dict[str, WebSocket],
     exclude_uid: Optional[str] = None,
 ) -> None:
-    """Broadcasts a message to all members in a group except the sender"""
+    """Broadcasts a message to all members in a group except the sender
+
+    The message is serialized to JSON once, if a member needs it; members
+    using a binary wire format get the dict for their own encoder. Members
+    connected through a ConnectionSender get it queued without waiting,
+    other connections are sent to concurrently, so a slow member does not
+    delay the others.
+    """
+    frame = None
+    droppable = message.get("type") in DROPPABLE_BROADCAST_TYPES
+
+    direct_sends = []
     for member_uid in group_members:
-        if member_uid != exclude_uid and member_uid in client_connections:
-            try:
-                await client_connections[member_uid].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to broadcast to {member_uid}: {e}")
+        if member_uid == exclude_uid or member_uid not in client_connections:
+            continue
+        connection = client_connections[member_uid]
+        binary = isinstance(connection, ConnectionSender) and connection.encoder.binary
+        if not binary and frame is None:
+            frame = json.dumps(message)
+        if isinstance(connection, ConnectionSender):
+            payload = message if binary else frame
+            if not connection.send_frame(payload, droppable=droppable):
+                logger.error(f"Failed to broadcast to {member_uid}: connection closed")
+        else:
+            direct_sends.append((member_uid, connection.send_text(frame)))
+
+    if direct_sends:
+        results = await asyncio.gather(
+            *(send for _, send in direct_sends), return_exceptions=True
+        )
+        for (member_uid, _), result in zip(direct_sends, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to broadcast to {member_uid}: {result}")
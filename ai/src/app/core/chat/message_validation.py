@@ -0,0 +1,57 @@
+"""Validation of incoming client messages.
+
+Each message type with fields its handler relies on gets a validator, built
+once from MESSAGE_FIELDS. A validator only checks the types of the fields that
+are present; handlers already treat missing fields as no-ops.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+FieldTypes = Union[Type, Tuple[Type, ...]]
+# Returns an error message, or None if the message is valid
+Validator = Callable[[Dict[str, Any]], Optional[str]]
+
+MESSAGE_FIELDS: Dict[str, Dict[str, FieldTypes]] = {
+    "add-client-to-group": {"invitee_uid": str},
+    "remove-client-from-group": {"target_uid": str},
+    "fetch-and-set-history": {"history_uid": str},
+    "delete-history": {"history_uid": str},
+    "interrupt-signal": {"text": str},
+    "mic-audio-data": {"audio": list},
+    "raw-audio-data": {"audio": list},
+    "text-input": {"text": str, "images": list},
+    "switch-config": {"file": str},
+    "audio-play-start": {"display_text": dict},
+    "init-interview-session": {"jd": str, "resume": str, "style": str},
+    "update-interview-phase": {"phase": str},
+    "behavior-data": {"data": dict},
+}
+
+# Frequent messages no one waits for through message_handler
+TELEMETRY_TYPES = frozenset(
+    {"behavior-data", "mic-audio-data", "raw-audio-data", "heartbeat"}
+)
+
+
+def compile_validator(msg_type: str, fields: Dict[str, FieldTypes]) -> Validator:
+    """Build the validator of one message type."""
+    checks = tuple(fields.items())
+
+    def validate(data: Dict[str, Any]) -> Optional[str]:
+        for name, types in checks:
+            value = data.get(name)
+            if value is not None and not isinstance(value, types):
+                return f"Invalid '{name}' in {msg_type} message"
+        return None
+
+    return validate
+
+
+def compile_validators(
+    message_fields: Dict[str, Dict[str, FieldTypes]] = MESSAGE_FIELDS,
+) -> Dict[str, Validator]:
+    """Build the validators of all message types."""
+    return {
+        msg_type: compile_validator(msg_type, fields)
+        for msg_type, fields in message_fields.items()
+    }
@@ -0,0 +1,174 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from fastapi import WebSocket
+from loguru import logger
+
+from .wire_format import JSONWireEncoder, Message
+
+# Close code for clients that cannot keep up ("try again later")
+LAGGING_CLOSE_CODE = 1013
+
+
+class ConnectionSender:
+    """Sends messages to one websocket from a dedicated writer task.
+
+    Messages are queued and written in order, so callers never wait on a slow
+    socket. The queue holds at most `max_queue` messages; when it is full the
+    oldest droppable message (e.g. a forwarded audio/volume frame) is
+    discarded. A client whose queue is full of messages that cannot be
+    dropped, or whose socket accepts no frame for `max_lag_s` seconds, is
+    disconnected.
+
+    The `encoder` turns queued messages into frames (see wire_format). With a
+    coalescing encoder, batchable messages queued while the writer was busy or
+    within the same event-loop tick are sent as one frame.
+
+    The sender can be used in place of the websocket for sending: it provides
+    `send_text` and `send_json`.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        client_uid: str,
+        max_queue: int = 256,
+        max_lag_s: float = 10.0,
+        encoder=None,
+        max_batch: int = 64,
+    ):
+        self.websocket = websocket
+        self.client_uid = client_uid
+        self.max_queue = max_queue
+        self.max_lag_s = max_lag_s
+        self.encoder = encoder or JSONWireEncoder()
+        self.max_batch = max_batch
+
+        self.dropped = 0
+        self.closed = False
+        # (message, droppable)
+        self._queue: Deque[Tuple[Message, bool]] = deque()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def send_frame(self, frame: Message, droppable: bool = False) -> bool:
+        """Queue a serialized JSON frame or a message dict without waiting.
+
+        Returns:
+            bool: False if the connection is closed or was dropped for lagging.
+        """
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue:
+            if not self._drop_oldest_droppable():
+                if droppable:
+                    self.dropped += 1
+                    return True
+                self._disconnect(f"send queue full ({self.max_queue} frames)")
+                return False
+
+        self._queue.append((self.encoder.prepare(frame), droppable))
+        self._idle.clear()
+        self._wakeup.set()
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+        return True
+
+    async def send_text(self, data: str) -> None:
+        """Queue a serialized JSON frame. Raises RuntimeError if the connection is closed."""
+        if not self.send_frame(data):
+            raise RuntimeError(f"Connection to {self.client_uid} is closed")
+
+    async def send_json(self, data: Dict[str, Any]) -> None:
+        """Queue a message dict. Raises RuntimeError if the connection is closed.
+
+        The dict is serialized by the encoder when it is written, so it must
+        not be changed after it was sent.
+        """
+        if not self.send_frame(data):
+            raise RuntimeError(f"Connection to {self.client_uid} is closed")
+
+    async def flush(self) -> None:
+        """Wait until every queued frame was written."""
+        if not self.closed:
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the writer task, discarding frames not sent yet."""
+        self.closed = True
+        self._queue.clear()
+        self._idle.set()
+        if self._writer:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+
+    def _drop_oldest_droppable(self) -> bool:
+        for index, (_, droppable) in enumerate(self._queue):
+            if droppable:
+                del self._queue[index]
+                self.dropped += 1
+                if self.dropped % 50 == 1:
+                    logger.warning(
+                        f"Send queue of {self.client_uid} is full, dropped {self.dropped} frames so far"
+                    )
+                return True
+        return False
+
+    def _disconnect(self, reason: str) -> None:
+        logger.warning(f"Disconnecting lagging client {self.client_uid}: {reason}")
+        self.closed = True
+        self._queue.clear()
+        self._idle.set()
+        # The receive loop of the connection sees the close and cleans up
+        asyncio.create_task(self._close_websocket())
+
+    async def _close_websocket(self) -> None:
+        try:
+            await self.websocket.close(code=LAGGING_CLOSE_CODE)
+        except Exception as e:
+            logger.debug(f"Closing websocket of {self.client_uid} failed: {e}")
+
+    async def _write_loop(self) -> None:
+        while not self.closed:
+            if not self._queue:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            frame = self.encoder.encode(self._next_batch())
+            send = (
+                self.websocket.send_bytes
+                if self.encoder.binary
+                else self.websocket.send_text
+            )
+            try:
+                await asyncio.wait_for(send(frame), self.max_lag_s)
+            except asyncio.TimeoutError:
+                self._disconnect(f"no frame accepted for {self.max_lag_s}s")
+            except Exception as e:
+                logger.debug(f"Send to {self.client_uid} failed, stopping writer: {e}")
+                self.closed = True
+                self._queue.clear()
+                self._idle.set()
+
+    def _next_batch(self) -> List[Message]:
+        message, _ = self._queue.popleft()
+        batch = [message]
+        if not (self.encoder.coalesce and self.encoder.batchable(message)):
+            return batch
+        while (
+            self._queue
+            and len(batch) < self.max_batch
+            and self.encoder.batchable(self._queue[0][0])
+        ):
+            batch.append(self._queue.popleft()[0])
+        return batch
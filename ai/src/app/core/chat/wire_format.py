@@ -0,0 +1,116 @@
+"""Outbound wire formats of the client websocket.
+
+A client picks its format when it connects (`/client-ws?wire=msgpack`):
+
+- `json` (default): one JSON text frame per message.
+- `msgpack`: binary frames, each a MessagePack array of messages. Small
+  messages queued within one event-loop tick share a frame, `audio` messages
+  get a frame of their own. In `audio` messages the audio is raw bytes
+  instead of base64, and `volumes` are bytes (uint8, volume * 255) instead of
+  a float list.
+
+Incoming text frames are JSON, incoming binary frames MessagePack, whatever
+the outbound format is.
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Union
+
+import orjson
+import ormsgpack
+from loguru import logger
+
+# A queued message: a serialized JSON frame or a message dict
+Message = Union[str, Dict[str, Any]]
+
+DEFAULT_WIRE_FORMAT = "json"
+# Messages that are sent in a frame of their own, never coalesced
+UNBATCHED_TYPES = {"audio"}
+
+
+def decode_message(frame: Union[str, bytes]) -> Dict[str, Any]:
+    """Decode an incoming frame.
+
+    Raises:
+        ValueError: If the frame is not a JSON or MessagePack object.
+    """
+    # Both decode errors are ValueErrors
+    if isinstance(frame, str):
+        message = orjson.loads(frame)
+    else:
+        message = ormsgpack.unpackb(frame)
+    if not isinstance(message, dict):
+        raise ValueError("Message is not an object")
+    return message
+
+
+def quantize_volumes(volumes: List[float]) -> bytes:
+    """Quantize normalized volumes (0.0 - 1.0) to one byte each."""
+    return bytes(min(255, max(0, round(volume * 255))) for volume in volumes)
+
+
+def compact_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Get a copy of a message with audio and volumes in their binary form."""
+    if message.get("type") != "audio":
+        return message
+    compact = dict(message)
+    if compact.get("audio"):
+        compact["audio"] = base64.b64decode(compact["audio"])
+    if compact.get("volumes") is not None:
+        compact["volumes"] = quantize_volumes(compact["volumes"])
+    return compact
+
+
+class JSONWireEncoder:
+    """Sends every message as a JSON text frame of its own."""
+
+    name = "json"
+    binary = False
+    coalesce = False
+
+    def prepare(self, message: Message) -> Message:
+        return message
+
+    def batchable(self, message: Message) -> bool:
+        return False
+
+    def encode(self, messages: List[Message]) -> str:
+        (message,) = messages
+        return message if isinstance(message, str) else json.dumps(message)
+
+
+class MsgpackWireEncoder:
+    """Sends messages as MessagePack arrays, coalescing small messages."""
+
+    name = "msgpack"
+    binary = True
+    coalesce = True
+
+    def prepare(self, message: Message) -> Dict[str, Any]:
+        if isinstance(message, str):
+            # Callers that still send serialized JSON frames
+            message = json.loads(message)
+        return compact_message(message)
+
+    def batchable(self, message: Dict[str, Any]) -> bool:
+        return message.get("type") not in UNBATCHED_TYPES
+
+    def encode(self, messages: List[Dict[str, Any]]) -> bytes:
+        return ormsgpack.packb(messages)
+
+
+WIRE_ENCODERS = {
+    JSONWireEncoder.name: JSONWireEncoder,
+    MsgpackWireEncoder.name: MsgpackWireEncoder,
+}
+
+
+def get_wire_encoder(name: str | None = None):
+    """Get the encoder of a wire format, falling back to JSON for unknown names."""
+    name = name or DEFAULT_WIRE_FORMAT
+    encoder_class = WIRE_ENCODERS.get(name)
+    if encoder_class is None:
+        logger.warning(f"Unknown wire format '{name}', using {DEFAULT_WIRE_FORMAT}")
+        encoder_class = WIRE_ENCODERS[DEFAULT_WIRE_FORMAT]
+    return encoder_class()
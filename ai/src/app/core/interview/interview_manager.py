@@ -2,13 +2,9 @@ from typing import Dict, List, Optional, Any
 from loguru import logger
 import json
 import asyncio
+from functools import cached_property
 from pydantic import BaseModel
 
-from ..agent.rag.vector_store import VectorStoreManager
-from ..agent.rag.resume_analyzer import ResumeAnalyzer
-from ..agent.rag.question_generator import QuestionGenerator
-from ..agent.rag.feedback_agent import FeedbackAgent
-
 class InterviewSession(BaseModel):
     client_uid: str
     jd_text: str
@@ -42,27 +38,50 @@ class InterviewManager:
             from ..config_manager.rag import RAGConfig
             self.config = RAGConfig()
 
-        # RAG 컴포넌트 초기화
-        self.vector_store = VectorStoreManager(
+        # RAG 컴포넌트(Chroma, 임베딩, LLM 클라이언트)는 처음 사용할 때 생성됩니다.
+        logger.info(f"InterviewManager가 초기화되었습니다. (Model: {self.config.llm_model})")
+
+    # ==== RAG 컴포넌트 (지연 생성)
+
+    @cached_property
+    def vector_store(self):
+        from ..agent.rag.vector_store import VectorStoreManager
+        return VectorStoreManager(
             persist_directory=self.config.vector_db_path,
             embedding_model=self.config.embedding_model
         )
-        self.resume_analyzer = ResumeAnalyzer(
+
+    @cached_property
+    def resume_analyzer(self):
+        from ..agent.rag.resume_analyzer import ResumeAnalyzer
+        return ResumeAnalyzer(
             model_name=self.config.llm_model
         )
-        self.question_generator = QuestionGenerator(
+
+    @cached_property
+    def question_generator(self):
+        from ..agent.rag.question_generator import QuestionGenerator
+        return QuestionGenerator(
             vector_store=self.vector_store,
             resume_analyzer=self.resume_analyzer,
             model_name=self.config.llm_model,
             temperature=self.config.temperature_question
         )
-        self.feedback_agent = FeedbackAgent(
+
+    @cached_property
+    def feedback_agent(self):
+        from ..agent.rag.feedback_agent import FeedbackAgent
+        return FeedbackAgent(
             vector_store=self.vector_store,
             model_name=self.config.llm_model,
             temperature=self.config.temperature_feedback
         )
 
-        logger.info(f"InterviewManager가 RAG 컴포넌트와 함께 초기화되었습니다. (Model: {self.config.llm_model})")
+    def warm_up(self) -> None:
+        """RAG 컴포넌트를 미리 생성합니다. (블로킹, 스레드에서 호출)"""
+        self.question_generator
+        self.feedback_agent
+        logger.info("InterviewManager RAG 컴포넌트 준비 완료")
 
     def create_session(self, client_uid: str, jd_text: str, resume_text: str, style: str = "professional") -> InterviewSession:
         session = InterviewSession(
@@ -87,7 +106,9 @@ class InterviewManager:
 
         try:
             # 이력서 분석 및 질문 생성 (경로 또는 텍스트 지원)
-            generated_questions = await self.question_generator.generate_questions(session.resume_text)
+            # 첫 사용 시 컴포넌트 생성이 이벤트 루프를 막지 않도록 스레드에서 가져옵니다.
+            question_generator = await asyncio.to_thread(lambda: self.question_generator)
+            generated_questions = await question_generator.generate_questions(session.resume_text)
             session.questions = [{"type": "Generated", "question": q, "reason": "Resume Based"} for q in generated_questions]
             logger.info(f"세션 준비 완료. {len(generated_questions)}개의 질문이 생성되었습니다.")
             session.status = "ready"
@@ -188,7 +209,8 @@ class InterviewManager:
              session.current_question_index += 1
 
     async def generate_feedback(self, client_uid: str, question: str, answer: str) -> Dict[str, str]:
-        return await self.feedback_agent.generate_feedback(question, answer)
+        feedback_agent = await asyncio.to_thread(lambda: self.feedback_agent)
+        return await feedback_agent.generate_feedback(question, answer)
 
     def generate_report(self, client_uid: str) -> Dict[str, Any]:
         """
@@ -0,0 +1,100 @@
+"""Engines that are built on first use instead of at startup."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+class LazyEngine:
+    """Stands in for an engine until the engine is first used.
+
+    Attribute access builds the engine with `factory` (once, also when several
+    threads ask at the same time) and is then forwarded to it, so sessions can
+    hold the LazyEngine wherever they would hold the engine. `warm_up` builds
+    it ahead of time without blocking the event loop.
+
+    Building blocks the calling thread, also while another thread (e.g. the
+    warm-up) is building, so code on the event loop gets the engine with
+    `resolve_engine` first. A factory that fails is not called again: later
+    uses raise the same error until the engine is replaced.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        # Set through __dict__, __getattr__ must not see them missing
+        self.__dict__["name"] = name
+        self.__dict__["_factory"] = factory
+        self.__dict__["_engine"] = None
+        self.__dict__["_error"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._engine is not None
+
+    def get(self) -> Any:
+        """Get the engine, building it if needed.
+
+        Raises:
+            RuntimeError: If building the engine failed, now or before.
+        """
+        engine = self._engine
+        if engine is not None:
+            return engine
+        with self._lock:
+            if self._engine is None:
+                self._build()
+            return self._engine
+
+    async def aget(self) -> Any:
+        """Get the engine, building it in a worker thread if needed."""
+        if self._engine is not None:
+            return self._engine
+        return await asyncio.to_thread(self.get)
+
+    def _build(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"{self.name} engine failed to build") from self._error
+        logger.info(f"Building {self.name} engine on first use...")
+        start = time.perf_counter()
+        try:
+            self.__dict__["_engine"] = self._factory()
+        except Exception as e:
+            self.__dict__["_error"] = e
+            raise RuntimeError(f"{self.name} engine failed to build: {e}") from e
+        logger.info(
+            f"Built {self.name} engine ({type(self._engine).__name__}) in {time.perf_counter() - start:.2f}s"
+        )
+
+    async def warm_up(self) -> Optional[Any]:
+        """Build the engine in a worker thread. Errors are logged, not raised."""
+        try:
+            return await asyncio.to_thread(self.get)
+        except Exception as e:
+            logger.error(f"Warm-up of {self.name} engine failed: {e}")
+            return None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.get(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.get(), attr, value)
+
+    def __repr__(self) -> str:
+        if self.built:
+            state = type(self._engine).__name__
+        else:
+            state = "failed" if self._error is not None else "not built"
+        return f"LazyEngine({self.name}: {state})"
+
+
+async def resolve_engine(engine: Any) -> Any:
+    """Get the engine behind a LazyEngine without blocking the event loop.
+
+    Other engines are returned as they are.
+    """
+    if isinstance(engine, LazyEngine):
+        return await engine.aget()
+    return engine
@@ -1,4 +1,5 @@
 import re
+import time
 from typing import List, Tuple, AsyncIterator, Optional, Union, Dict, Any
 import pysbd
 from loguru import logger
@@ -6,6 +7,8 @@ from langdetect import detect
 from enum import Enum
 from dataclasses import dataclass
 
+from .tts_latency import TTSLatencyTracker
+
 # Constants for additional checks
 COMMAS = [
     ",",
@@ -141,6 +144,31 @@ def comma_splitter(text: str) -> Tuple[str, str]:
     return text, ""
 
 
+def budget_splitter(text: str, max_chars: int, min_chars: int) -> Tuple[str, str]:
+    """
+    Split unpunctuated text into a first chunk of at most max_chars characters.
+    Splits at the last whitespace so that no word is cut, and falls back to a
+    hard cut for text without spaces (e.g. Chinese or Japanese).
+
+    Args:
+        text: Text to split
+        max_chars: Maximum length of the first chunk
+        min_chars: Minimum length of the first chunk when splitting at whitespace
+
+    Returns:
+        Tuple[str, str]: (first chunk, remaining text), first chunk is empty
+            if the text can't be split yet
+    """
+    stripped = text.strip()
+    # The last word may still be streaming in, so only split before it
+    split_pos = stripped.rfind(" ", 0, max_chars + 1)
+    if split_pos >= min_chars:
+        return stripped[:split_pos].strip(), stripped[split_pos:].strip()
+    if " " not in stripped and len(stripped) >= max_chars:
+        return stripped[:max_chars], stripped[max_chars:]
+    return "", text
+
+
 def has_punctuation(text: str) -> bool:
     """
     Check if the text is a punctuation mark.
@@ -304,19 +332,33 @@ class SentenceDivider:
         faster_first_response: bool = True,
         segment_method: str = "pysbd",
         valid_tags: List[str] = None,
+        first_chunk_wait_ms: float = 500,
+        first_chunk_min_chars: int = 8,
+        first_chunk_max_chars: int = 40,
     ):
         """
         Initialize the SentenceDivider.
 
         Args:
-            faster_first_response: Whether to split first sentence at commas
+            faster_first_response: Whether to split first sentence at commas,
+                or by length/time budget when no comma comes in time
             segment_method: Method for segmenting sentences
             valid_tags: List of valid tag names to detect
+            first_chunk_wait_ms: Time without punctuation after which the first
+                chunk is emitted as soon as it reaches first_chunk_min_chars,
+                0 to disable
+            first_chunk_min_chars: Minimum length of a budget-split first chunk
+            first_chunk_max_chars: Maximum length of a budget-split first chunk,
+                the actual size is picked from the measured TTS latency
         """
         self.faster_first_response = faster_first_response
         self.segment_method = segment_method
         self.valid_tags = valid_tags or ["think"]
+        self.first_chunk_wait_ms = first_chunk_wait_ms
+        self.first_chunk_min_chars = first_chunk_min_chars
+        self.first_chunk_max_chars = first_chunk_max_chars
         self._is_first_sentence = True
+        self._first_text_time: Optional[float] = None
         self._buffer = ""
         # Replace active_tags dict with a stack to handle nesting
         self._tag_stack = []
@@ -506,6 +548,23 @@ class SentenceDivider:
                         processed_something = True
                         continue  # Restart processing loop
 
+                # No comma yet: emit the first chunk once it is over budget
+                if (
+                    self._is_first_sentence
+                    and self.faster_first_response
+                    and not contains_end_punctuation(self._buffer)
+                ):
+                    sentence, remaining = self._split_first_chunk()
+                    if sentence:
+                        yield SentenceWithTags(
+                            text=sentence,
+                            tags=current_tags or [TagInfo("", TagState.NONE)],
+                        )
+                        self._buffer = remaining
+                        self._is_first_sentence = False
+                        processed_something = True
+                        continue  # Restart processing loop
+
                 # Process normal sentences based on end punctuation
                 if contains_end_punctuation(self._buffer):
                     sentences, remaining = self._segment_text(self._buffer)
@@ -525,6 +584,39 @@ class SentenceDivider:
             if not processed_something:
                 break
 
+    def _split_first_chunk(self) -> Tuple[str, str]:
+        """
+        Split the first chunk off the buffer if it is over its length or time budget.
+        The length budget is sized so that the chunk's audio lasts about as long
+        as generating the next chunk takes, see TTSLatencyTracker.
+
+        Returns:
+            Tuple[str, str]: (first chunk, remaining text), first chunk is empty
+                if the buffer is still within budget
+        """
+        text_len = len(self._buffer.strip())
+        if text_len < self.first_chunk_min_chars:
+            return "", self._buffer
+
+        max_chars = TTSLatencyTracker.get_instance().first_chunk_chars(
+            self.first_chunk_min_chars, self.first_chunk_max_chars
+        )
+        if text_len <= max_chars:
+            waited_ms = (time.monotonic() - self._first_text_time) * 1000
+            if self.first_chunk_wait_ms <= 0 or waited_ms < self.first_chunk_wait_ms:
+                return "", self._buffer
+            # Waited long enough, take whatever complete words we have
+            max_chars = text_len
+
+        sentence, remaining = budget_splitter(
+            self._buffer, max_chars, self.first_chunk_min_chars
+        )
+        if sentence:
+            logger.debug(
+                f"Emitting first chunk by budget ({max_chars} chars): '{sentence}'"
+            )
+        return sentence, remaining
+
     async def _flush_buffer(self) -> AsyncIterator[SentenceWithTags]:
         """
         Process and yield all remaining content in the buffer at the end of the stream.
@@ -573,6 +665,8 @@ class SentenceDivider:
                 # Now yield the dictionary
                 yield item
             elif isinstance(item, str):
+                if self._first_text_time is None and item.strip():
+                    self._first_text_time = time.monotonic()
                 self._buffer += item
                 # Process the buffer incrementally as string chunks arrive
                 async for sentence in self._process_buffer():
@@ -604,5 +698,6 @@ class SentenceDivider:
     def reset(self):
         """Reset the divider state for a new conversation"""
         self._is_first_sentence = True
+        self._first_text_time = None
         self._buffer = ""
         self._tag_stack = []
@@ -0,0 +1,74 @@
+"""Process-wide measurements of TTS latency, used to size the first TTS chunk."""
+
+from typing import ClassVar, Optional
+
+# Rough speaking rate of TTS voices, in characters of text per second of audio
+SPEECH_CHARS_PER_SECOND = 12.0
+# First chunk size used before any TTS latency has been measured
+DEFAULT_FIRST_CHUNK_CHARS = 20
+
+
+class TTSLatencyTracker:
+    """Tracks an exponential moving average of TTS generation latency.
+
+    The first TTS chunk of a turn should be short so audio starts early, but
+    long enough that its playback covers the generation of the next chunk.
+    Otherwise the user hears the first clause followed by a gap.
+    """
+
+    _instance: ClassVar[Optional["TTSLatencyTracker"]] = None
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            alpha: Weight of the newest sample in the moving average
+        """
+        self.alpha = alpha
+        self._latency_s: Optional[float] = None
+
+    @classmethod
+    def get_instance(cls) -> "TTSLatencyTracker":
+        """Get the tracker of this process, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @property
+    def latency_s(self) -> Optional[float]:
+        """Average TTS generation latency in seconds, None if not measured yet."""
+        return self._latency_s
+
+    def record(self, seconds: float) -> None:
+        """
+        Record the duration of one TTS generation.
+
+        Args:
+            seconds: Time taken to generate the audio
+        """
+        if self._latency_s is None:
+            self._latency_s = seconds
+        else:
+            self._latency_s = self.alpha * seconds + (1 - self.alpha) * self._latency_s
+
+    def first_chunk_chars(self, min_chars: int, max_chars: int) -> int:
+        """
+        Get the target length of the first TTS chunk.
+
+        Args:
+            min_chars: Lower bound of the chunk length
+            max_chars: Upper bound of the chunk length
+
+        Returns:
+            int: Number of characters whose audio lasts about one TTS latency
+        """
+        if self._latency_s is None:
+            chars = DEFAULT_FIRST_CHUNK_CHARS
+        else:
+            chars = round(self._latency_s * SPEECH_CHARS_PER_SECOND)
+        return max(min_chars, min(max_chars, chars))
+
+    def reset(self) -> None:
+        """Forget all measurements, e.g. after switching TTS engines."""
+        self._latency_s = None
@@ -0,0 +1,336 @@
+"""
+Latency tracing of conversation turns
+=====================================
+Each turn of a single-user conversation gets a TurnTrace. Stages of the turn
+mark spans on it as they happen:
+
+    vad.end_of_speech   VAD processing of the chunk that ended the speech
+    asr                 transcription of the user audio
+    llm.first_token     LLM request to its first token
+    llm.first_sentence  LLM request to the first sentence out of the transformers
+    tts.first_audio     first TTS request to the first audio generated
+    ws.first_payload    turn start to the first audio payload sent
+    playback.start      first payload sent to the frontend starting playback
+    playback.complete   first payload sent to the frontend finishing playback
+
+The turn starts when the VAD detects the end of speech, or when the frontend
+triggers the conversation if the VAD runs there. Finished turns are recorded
+in per-stage latency histograms, rendered in the Prometheus text format for
+`/metrics`, and appended to an OTLP JSON file if one is configured.
+"""
+
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import (
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from loguru import logger
+
+T = TypeVar("T")
+
+STAGES = (
+    "vad.end_of_speech",
+    "asr",
+    "llm.first_token",
+    "llm.first_sentence",
+    "tts.first_audio",
+    "ws.first_payload",
+    "playback.start",
+    "playback.complete",
+)
+TURN_SPAN = "turn"
+# Upper bounds of the histogram buckets, in seconds
+LATENCY_BUCKETS_S = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 30.0)
+# An end of speech older than this is not the start of the next turn
+PENDING_MAX_AGE_S = 10.0
+SERVICE_NAME = "open-llm-vtuber"
+
+_current_turn: contextvars.ContextVar[Optional["TurnTrace"]] = contextvars.ContextVar(
+    "current_turn", default=None
+)
+
+
+def current_turn() -> Optional["TurnTrace"]:
+    """Get the trace of the turn being processed by this task, if any."""
+    return _current_turn.get()
+
+
+class TurnTrace:
+    """Spans of one conversation turn, timed with the monotonic clock."""
+
+    def __init__(self, client_uid: str, start_ns: Optional[int] = None) -> None:
+        self.client_uid = client_uid
+        self.trace_id = secrets.token_hex(16)
+        self.start_ns = time.perf_counter_ns() if start_ns is None else start_ns
+        # Offset from the monotonic clock to the Unix epoch, for the export
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._stage_starts: Dict[str, int] = {}
+        self.spans: Dict[str, Tuple[int, int]] = {}
+        self.end_ns: Optional[int] = None
+
+    def begin(self, stage: str) -> None:
+        """Remember when a stage started, for spans marked `since` it."""
+        self._stage_starts.setdefault(stage, time.perf_counter_ns())
+
+    def mark(self, name: str, since: Optional[str] = None) -> None:
+        """
+        End a span now, if it was not marked yet.
+
+        Args:
+            name: Span name
+            since: Stage the span starts at (see `begin`), or the span of that
+                name if there is one. The turn start if None or unknown.
+        """
+        if name in self.spans:
+            return
+        start_ns = self.start_ns
+        if since in self._stage_starts:
+            start_ns = self._stage_starts[since]
+        elif since in self.spans:
+            start_ns = self.spans[since][1]
+        self.spans[name] = (start_ns, time.perf_counter_ns())
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a span."""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.spans.setdefault(name, (start_ns, time.perf_counter_ns()))
+
+    def duration_s(self, name: str) -> Optional[float]:
+        span = self.spans.get(name)
+        return (span[1] - span[0]) / 1e9 if span else None
+
+    def to_otlp(self) -> Dict:
+        """Export the trace as an OTLP/JSON ExportTraceServiceRequest."""
+        root_id = secrets.token_hex(8)
+        end_ns = self.end_ns or time.perf_counter_ns()
+        spans = [self._otlp_span(TURN_SPAN, root_id, None, self.start_ns, end_ns)]
+        for name, (start_ns, stop_ns) in self.spans.items():
+            spans.append(
+                self._otlp_span(name, secrets.token_hex(8), root_id, start_ns, stop_ns)
+            )
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_attribute("service.name", SERVICE_NAME)]
+                    },
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+                }
+            ]
+        }
+
+    def _otlp_span(
+        self,
+        name: str,
+        span_id: str,
+        parent_id: Optional[str],
+        start_ns: int,
+        end_ns: int,
+    ) -> Dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": span_id,
+            "name": name,
+            # SPAN_KIND_INTERNAL
+            "kind": 1,
+            # 64-bit integers are strings in OTLP/JSON
+            "startTimeUnixNano": str(start_ns + self._epoch_offset_ns),
+            "endTimeUnixNano": str(end_ns + self._epoch_offset_ns),
+            "attributes": [_attribute("client.uid", self.client_uid)],
+        }
+        if parent_id:
+            span["parentSpanId"] = parent_id
+        return span
+
+
+def _attribute(key: str, value: str) -> Dict:
+    return {"key": key, "value": {"stringValue": value}}
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed buckets, as in Prometheus."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_S) -> None:
+        self.buckets = buckets
+        # One count per bucket, plus +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Get the (upper bound, count) pairs of the Prometheus buckets."""
+        rows, total = [], 0
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self.counts):
+            total += count
+            rows.append((bound, total))
+        return rows
+
+
+class OTLPFileSink:
+    """Appends traces to a file, one OTLP/JSON request per line.
+
+    This is the format of the OpenTelemetry Collector file exporter, so the
+    file can be read by its `otlpjsonfile` receiver or any OTLP/JSON tool.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, trace: TurnTrace) -> None:
+        line = json.dumps(trace.to_otlp(), separators=(",", ":")) + "\n"
+        # One write per line, so worker processes can share the file
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class TurnTracer:
+    """Keeps the traces of ongoing turns and the latency histograms."""
+
+    _instance: ClassVar[Optional["TurnTracer"]] = None
+
+    def __init__(self, sink: Optional[OTLPFileSink] = None) -> None:
+        self.sink = sink
+        self.histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram() for name in (TURN_SPAN, *STAGES)
+        }
+        # Ended speech waiting for its turn, and turns in progress, per client
+        self._pending: Dict[str, TurnTrace] = {}
+        self._active: Dict[str, TurnTrace] = {}
+
+    @classmethod
+    def get_instance(cls) -> "TurnTracer":
+        """Get the tracer of this process, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def configure(self, trace_file: Optional[str]) -> None:
+        """Export finished turns to `trace_file`, or nowhere if None."""
+        self.sink = OTLPFileSink(trace_file) if trace_file else None
+        if self.sink:
+            logger.info(f"Exporting turn traces to {trace_file}")
+
+    def end_of_speech(self, client_uid: str, vad_start_ns: int) -> None:
+        """
+        Record that the VAD detected the end of speech of a client.
+
+        Args:
+            client_uid: Client identifier
+            vad_start_ns: perf_counter_ns() when the VAD got the last chunk
+        """
+        trace = TurnTrace(client_uid, start_ns=vad_start_ns)
+        trace.mark("vad.end_of_speech")
+        self._pending[client_uid] = trace
+
+    def start_turn(self, client_uid: str) -> TurnTrace:
+        """Start the trace of a turn, and make it current for this task."""
+        trace = self._pending.pop(client_uid, None)
+        if (
+            trace is None
+            or time.perf_counter_ns() - trace.start_ns > PENDING_MAX_AGE_S * 1e9
+        ):
+            trace = TurnTrace(client_uid)
+        self._active[client_uid] = trace
+        _current_turn.set(trace)
+        return trace
+
+    def get(self, client_uid: str) -> Optional[TurnTrace]:
+        """Get the trace of the turn in progress for a client."""
+        return self._active.get(client_uid)
+
+    def finish(self, trace: TurnTrace, record: bool = True) -> None:
+        """
+        End a trace, record its spans and export it.
+
+        Args:
+            trace: Trace of the turn
+            record: Whether to record the trace, False to only drop it
+        """
+        if self._active.get(trace.client_uid) is trace:
+            del self._active[trace.client_uid]
+        if not record or trace.end_ns is not None:
+            return
+        trace.end_ns = time.perf_counter_ns()
+        self.histograms[TURN_SPAN].observe((trace.end_ns - trace.start_ns) / 1e9)
+        for name in trace.spans:
+            self.histograms.setdefault(name, LatencyHistogram()).observe(
+                trace.duration_s(name)
+            )
+        logger.info(
+            "⏱️ Turn latency: "
+            + ", ".join(
+                f"{name} {trace.duration_s(name) * 1000:.0f} ms"
+                for name in STAGES
+                if name in trace.spans
+            )
+        )
+        if self.sink:
+            try:
+                self.sink.export(trace)
+            except OSError as e:
+                logger.warning(f"Could not export turn trace: {e}")
+
+    def discard(self, client_uid: str) -> None:
+        """Drop the traces of a client, e.g. when it disconnects."""
+        self._pending.pop(client_uid, None)
+        self._active.pop(client_uid, None)
+
+    def render_metrics(self) -> str:
+        """Render the histograms in the Prometheus text exposition format."""
+        lines = [
+            "# HELP olv_turn_stage_seconds Latency of the stages of conversation turns.",
+            "# TYPE olv_turn_stage_seconds histogram",
+        ]
+        for stage, histogram in self.histograms.items():
+            for bound, count in histogram.cumulative():
+                lines.append(
+                    f'olv_turn_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}'
+                )
+            lines.append(
+                f'olv_turn_stage_seconds_sum{{stage="{stage}"}} {histogram.sum}'
+            )
+            lines.append(
+                f'olv_turn_stage_seconds_count{{stage="{stage}"}} {histogram.count}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+async def trace_first_token(
+    stream: AsyncIterator[T], trace: TurnTrace
+) -> AsyncIterator[T]:
+    """Pass a token stream through, marking llm.first_token on the first text token."""
+    async for item in stream:
+        if isinstance(item, str) and item:
+            trace.mark("llm.first_token", since="llm")
+            yield item
+            break
+        yield item
+    async for item in stream:
+        yield item
@@ -8,6 +8,7 @@ import aiohttp
 from starlette.websockets import WebSocketDisconnect
 
 from .proxy_message_queue import ProxyMessageQueue
+from ...core.chat.send_queue import ConnectionSender
 
 
 class ProxyHandler:
@@ -25,7 +26,8 @@ class ProxyHandler:
         """
         self.server_url = server_url
         self.server_ws: Optional[aiohttp.ClientWebSocketResponse] = None
-        self.clients: Dict[str, WebSocket] = {}
+        # Outbound side of each client connection
+        self.clients: Dict[str, ConnectionSender] = {}
         self.connected = False
         self.server_task: Optional[asyncio.Task] = None
         self.lock = asyncio.Lock()
@@ -100,7 +102,7 @@ class ProxyHandler:
 
         # Generate a unique client ID
         client_id = str(uuid.uuid4())
-        self.clients[client_id] = websocket
+        self.clients[client_id] = ConnectionSender(websocket, client_id)
         logger.info(
             f"Client {client_id} connected to proxy. Total clients: {len(self.clients)}"
         )
@@ -151,7 +153,9 @@ class ProxyHandler:
         Args:
             client_id: The ID of the disconnected client
         """
-        self.clients.pop(client_id, None)
+        sender = self.clients.pop(client_id, None)
+        if sender:
+            await sender.close()
         logger.info(
             f"Client {client_id} removed. Remaining clients: {len(self.clients)}"
         )
@@ -278,15 +282,15 @@ class ProxyHandler:
 
         logger.debug(f"Broadcasting to clients (excluding {exclude_client}): {log_msg}")
 
-        for client_id, websocket in self.clients.items():
+        # Serialize once, each client's writer task sends at its own pace
+        frame = json.dumps(message)
+        for client_id, sender in self.clients.items():
             # Skip the excluded client
             if exclude_client and client_id == exclude_client:
                 continue
 
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending to client {client_id}: {e}")
+            if not sender.send_frame(frame):
+                logger.error(f"Error sending to client {client_id}: connection closed")
                 disconnected_clients.append(client_id)
 
         # Clean up disconnected clients
@@ -2,10 +2,6 @@ from typing import Type, Literal
 from loguru import logger
 
 from .agents.agent_interface import AgentInterface
-from .agents.basic_memory_agent import BasicMemoryAgent
-from .stateless_llm_factory import LLMFactory as StatelessLLMFactory
-from .agents.hume_ai import HumeAIAgent
-from .agents.letta_agent import LettaAgent
 
 from ..mcpp.tool_manager import ToolManager
 from ..mcpp.tool_executor import ToolExecutor
@@ -36,7 +32,11 @@ class AgentFactory:
         """
         logger.info(f"Initializing agent: {conversation_agent_choice}")
 
+        # Agents are imported when chosen, each pulls in its own SDKs
         if conversation_agent_choice == "basic_memory_agent":
+            from .agents.basic_memory_agent import BasicMemoryAgent
+            from .stateless_llm_factory import LLMFactory as StatelessLLMFactory
+
             # Get the LLM provider choice from agent settings
             basic_memory_settings: dict = agent_settings.get("basic_memory_agent", {})
             llm_provider: str = basic_memory_settings.get("llm_provider")
@@ -76,6 +76,12 @@ class AgentFactory:
                 faster_first_response=basic_memory_settings.get(
                     "faster_first_response", True
                 ),
+                first_chunk_wait_ms=basic_memory_settings.get(
+                    "first_chunk_wait_ms", 500
+                ),
+                first_chunk_max_chars=basic_memory_settings.get(
+                    "first_chunk_max_chars", 40
+                ),
                 segment_method=basic_memory_settings.get("segment_method", "pysbd"),
                 use_mcpp=basic_memory_settings.get("use_mcpp", False),
                 interrupt_method=interrupt_method,
@@ -108,6 +114,8 @@ class AgentFactory:
             )
 
         elif conversation_agent_choice == "hume_ai_agent":
+            from .agents.hume_ai import HumeAIAgent
+
             settings = agent_settings.get("hume_ai_agent", {})
             return HumeAIAgent(
                 api_key=settings.get("api_key"),
@@ -117,6 +125,8 @@ class AgentFactory:
             )
 
         elif conversation_agent_choice == "letta_agent":
+            from .agents.letta_agent import LettaAgent
+
             settings = agent_settings.get("letta_agent", {})
             return LettaAgent(
                 live2d_model=live2d_model,
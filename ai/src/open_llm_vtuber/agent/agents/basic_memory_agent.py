@@ -42,6 +42,8 @@ class BasicMemoryAgent(AgentInterface):
         live2d_model,
         tts_preprocessor_config: TTSPreprocessorConfig = None,
         faster_first_response: bool = True,
+        first_chunk_wait_ms: float = 500,
+        first_chunk_max_chars: int = 40,
         segment_method: str = "pysbd",
         use_mcpp: bool = False,
         interrupt_method: Literal["system", "user"] = "user",
@@ -56,6 +58,8 @@ class BasicMemoryAgent(AgentInterface):
         self._live2d_model = live2d_model
         self._tts_preprocessor_config = tts_preprocessor_config
         self._faster_first_response = faster_first_response
+        self._first_chunk_wait_ms = first_chunk_wait_ms
+        self._first_chunk_max_chars = first_chunk_max_chars
         self._segment_method = segment_method
         self._use_mcpp = use_mcpp
         self.interrupt_method = interrupt_method
@@ -192,6 +196,14 @@ class BasicMemoryAgent(AgentInterface):
                 logger.warning(f"Skipping invalid message from history: {msg}")
         logger.info(f"Loaded {len(self._memory)} messages from history.")
 
+    def memory_checkpoint(self) -> int:
+        """Mark the current end of memory, to roll back to later."""
+        return len(self._memory)
+
+    def rollback_memory(self, checkpoint: int) -> None:
+        """Drop the messages added to memory since the checkpoint."""
+        del self._memory[checkpoint:]
+
     def handle_interrupt(self, heard_response: str) -> None:
         """Handle user interruption."""
         if self._interrupt_handled:
@@ -590,6 +602,8 @@ class BasicMemoryAgent(AgentInterface):
             faster_first_response=self._faster_first_response,
             segment_method=self._segment_method,
             valid_tags=["think"],
+            first_chunk_wait_ms=self._first_chunk_wait_ms,
+            first_chunk_max_chars=self._first_chunk_max_chars,
         )
         async def chat_with_memory(
             input_data: BatchInput,
@@ -6,6 +6,8 @@ from loguru import logger
 from pydantic import BaseModel, Field
 from typing import List
 
+from .jd_extractors import MAX_JD_CHARS
+
 class JobAnalysis(BaseModel):
     company: str = Field(description="Name of the company")
     position: str = Field(description="Job position title")
@@ -50,9 +52,9 @@ class JDAnalyzer:
     async def analyze(self, jd_text: str) -> dict:
         logger.info("🔍 Analyzing JD Text...")
         try:
-            # Simple truncation to avoid context limits if crawler got garbage
-            if len(jd_text) > 20000:
-                jd_text = jd_text[:20000]
+            # The crawler already extracts and bounds the JD, this only guards other callers
+            if len(jd_text) > MAX_JD_CHARS:
+                jd_text = jd_text[:MAX_JD_CHARS]
 
             result = await self.chain.ainvoke({"jd_text": jd_text})
             logger.info("✅ JD Analysis complete")
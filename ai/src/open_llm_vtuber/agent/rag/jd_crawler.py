@@ -0,0 +1,147 @@
+"""Process-level job description crawler shared by all requests."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import ClassVar, Dict, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+from .jd_extractors import extract_jd_text
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class JDCrawlError(Exception):
+    """Raised when a job description page cannot be fetched."""
+
+
+class JDCrawler:
+    """Fetches job description pages in-process and extracts their text.
+
+    All requests share one pooled HTTP client. Extracted text is cached by URL
+    for `cache_ttl` seconds, concurrent requests for the same URL share one
+    fetch, and at most `max_concurrency` pages are fetched at once. A shared
+    fetch runs in a task of the crawler, so a cancelled request only stops
+    waiting; the fetch is cancelled once no request is waiting for it.
+    """
+
+    _instance: ClassVar[Optional["JDCrawler"]] = None
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        cache_ttl: float = 3600.0,
+        cache_size: int = 256,
+        timeout: float = 10.0,
+    ) -> None:
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.timeout = timeout
+
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # url -> (expires_at, text)
+        self._cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Fetch task -> number of requests waiting for it
+        self._waiters: Dict[asyncio.Task, int] = {}
+
+    @classmethod
+    def get_instance(cls) -> "JDCrawler":
+        """Get the crawler of this process, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def crawl(self, url: str) -> str:
+        """Get the job description text of a URL.
+
+        Args:
+            url: Job description page URL.
+
+        Returns:
+            str: Extracted text.
+
+        Raises:
+            JDCrawlError: If the page cannot be fetched.
+        """
+        cached = self._cache.get(url)
+        if cached is not None:
+            expires_at, text = cached
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(url)
+                logger.debug(f"JD cache hit: {url}")
+                return text
+            del self._cache[url]
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache(url))
+            self._inflight[url] = task
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    task.cancel()
+
+    async def _fetch_and_cache(self, url: str) -> str:
+        try:
+            text = await self._fetch(url)
+        finally:
+            del self._inflight[url]
+        self._cache[url] = (time.monotonic() + self.cache_ttl, text)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    async def _fetch(self, url: str) -> str:
+        logger.info(f"🕸️ Crawling JD URL: {url}")
+        start = time.perf_counter()
+        async with self._semaphore:
+            try:
+                response = await self._get_client().get(url)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"❌ Failed to crawl JD: {e}")
+                raise JDCrawlError(f"Error crawling URL: {e}") from e
+
+        # Parsing is CPU bound, keep it off the event loop
+        text = await asyncio.to_thread(
+            extract_jd_text, response.content, str(response.url)
+        )
+        logger.info(
+            f"✅ Extracted {len(text)} chars from JD in {time.perf_counter() - start:.2f}s"
+        )
+        return text
+
+    def invalidate(self, url: str | None = None) -> None:
+        """Drop the cached text of a URL, or of all URLs."""
+        if url is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(url, None)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,444 @@
+"""Extract compact, structured text from job description pages.
+
+Structured data embedded in the page is preferred: schema.org `JobPosting`
+JSON-LD, then Next.js `__NEXT_DATA__` payloads, which most Korean job boards
+ship. Pages without either fall back to a readability-style density
+heuristic that keeps the main content block and drops navigation, footers
+and recommendation lists.
+"""
+
+import json
+import re
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup, Tag
+from loguru import logger
+
+MAX_JD_CHARS = 8000
+# Main content shorter than this is probably a wrong pick, use the whole page
+MIN_MAIN_CONTENT_CHARS = 100
+
+# An extractor turns a parsed page into JD text, or None if it does not apply
+Extractor = Callable[[BeautifulSoup], Optional[str]]
+
+NOISE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "iframe",
+    "svg",
+    "nav",
+    "footer",
+    "header",
+    "aside",
+    "form",
+    "button",
+]
+BLOCK_TAGS = [
+    "div",
+    "section",
+    "article",
+    "main",
+    "ul",
+    "ol",
+    "table",
+    "p",
+    "pre",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+]
+PARAGRAPH_TAGS = ["p", "li", "pre", "td", "dd"]
+
+POSITIVE_HINTS = re.compile(
+    r"content|article|detail|descr|job|recruit|posting|position|\bjd\b|main|body|view",
+    re.I,
+)
+NEGATIVE_HINTS = re.compile(
+    r"comment|sidebar|footer|banner|related|recommend|similar|share|sns|menu|nav|popup|modal|login|advert|\bad\b|cookie",
+    re.I,
+)
+
+# JD sections, matched against keys with everything but letters and digits removed.
+# Order matters: "preferredRequirements" is a preference, not a requirement.
+SECTION_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("Introduction", re.compile(r"intro|overview|jobdescription|^description$")),
+    ("Preferred", re.compile(r"prefer|niceto|bonuspoint")),
+    ("Main tasks", re.compile(r"maintask|responsibilit|duties|^tasks?$")),
+    ("Requirements", re.compile(r"requirement|qualification")),
+    ("Tech stack", re.compile(r"skill|techstack|^stacks?$")),
+    ("Benefits", re.compile(r"benefit|welfare|perk")),
+    ("Hiring process", re.compile(r"hireround|hiringprocess|recruitprocess|procedure")),
+]
+SECTION_ORDER = [
+    "Introduction",
+    "Main tasks",
+    "Requirements",
+    "Preferred",
+    "Tech stack",
+    "Benefits",
+    "Hiring process",
+]
+TITLE_KEYS = ["position", "title", "jobTitle", "positionName"]
+COMPANY_KEYS = ["company", "companyName", "hiringOrganization"]
+LOCATION_KEYS = ["location", "address", "workLocation"]
+
+
+def _normalize_key(key: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", key.lower())
+
+
+def _section_label(key: str) -> Optional[str]:
+    normalized = _normalize_key(key)
+    for label, pattern in SECTION_PATTERNS:
+        if pattern.search(normalized):
+            return label
+    return None
+
+
+def clean_lines(text: str) -> str:
+    """Strip lines, split on runs of spaces, drop blanks and repeated lines."""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    result = []
+    for chunk in chunks:
+        if not chunk or (result and result[-1] == chunk):
+            continue
+        if result and result[-1] == "-":
+            # List marker of an item that starts with a block
+            result[-1] = f"- {chunk}"
+        else:
+            result.append(chunk)
+    return "\n".join(result)
+
+
+def tag_text(tag: Tag) -> str:
+    """Text of a tag with one line per block and list items marked."""
+    for br in tag.find_all("br"):
+        br.replace_with("\n")
+    for block in tag.find_all(BLOCK_TAGS + ["li", "dt", "dd", "tr"]):
+        block.insert_before("\n- " if block.name == "li" else "\n")
+        block.append("\n")
+    return clean_lines(tag.get_text())
+
+
+def _html_to_text(value: str) -> str:
+    if "<" in value and ">" in value:
+        return tag_text(BeautifulSoup(value, "html.parser"))
+    return clean_lines(value)
+
+
+def _scalar(value) -> Optional[str]:
+    """Render a JSON value as one line, using the name of named objects."""
+    if isinstance(value, str):
+        return _html_to_text(value).replace("\n", " ") or None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    if isinstance(value, dict):
+        for key in ("name", "title", "text", "keyword", "full_location"):
+            if isinstance(value.get(key), str) and value[key].strip():
+                return value[key].strip()
+        # e.g. a schema.org Place holding a PostalAddress
+        parts = [
+            _scalar(v)
+            for k, v in value.items()
+            if not k.startswith("@")
+            and not (isinstance(v, str) and v.startswith("http"))
+        ]
+        return ", ".join(p for p in parts if p) or None
+    if isinstance(value, list):
+        parts = [p for p in (_scalar(v) for v in value) if p]
+        return ", ".join(dict.fromkeys(parts)) or None
+    return None
+
+
+def _section_text(value) -> Optional[str]:
+    if isinstance(value, str):
+        return _html_to_text(value) or None
+    if isinstance(value, list):
+        items = [item for item in (_scalar(v) for v in value) if item]
+        if not items:
+            return None
+        # Short items such as skill names read better on one line
+        if all(len(item) <= 30 for item in items):
+            return ", ".join(dict.fromkeys(items))
+        return "\n".join(f"- {item}" for item in items)
+    return _scalar(value)
+
+
+def format_jd(
+    fields: List[Tuple[str, Optional[str]]], sections: List[Tuple[str, Optional[str]]]
+) -> str:
+    """Render header fields and sections as compact text."""
+    lines = [f"{label}: {value}" for label, value in fields if value]
+    for label, text in sections:
+        if text:
+            lines.append(f"\n[{label}]\n{text}")
+    return "\n".join(lines).strip()
+
+
+def _walk_json(data) -> Iterator[dict]:
+    """Yield every dict of a JSON document, parents before children."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+# ==== JSON-LD
+
+
+def _is_job_posting(node: dict) -> bool:
+    types = node.get("@type")
+    if isinstance(types, str):
+        types = [types]
+    return isinstance(types, list) and "JobPosting" in types
+
+
+def extract_json_ld(soup: BeautifulSoup) -> Optional[str]:
+    """Extract a schema.org JobPosting from JSON-LD scripts."""
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+
+        for node in _walk_json(data):
+            if not _is_job_posting(node):
+                continue
+
+            sections = [
+                ("Introduction", _section_text(node.get("description"))),
+                ("Main tasks", _section_text(node.get("responsibilities"))),
+                ("Requirements", _section_text(node.get("qualifications"))),
+                ("Experience", _section_text(node.get("experienceRequirements"))),
+                ("Education", _section_text(node.get("educationRequirements"))),
+                ("Tech stack", _section_text(node.get("skills"))),
+                ("Benefits", _section_text(node.get("jobBenefits"))),
+            ]
+            if not any(text for _, text in sections):
+                continue
+
+            fields = [
+                ("Position", _scalar(node.get("title"))),
+                ("Company", _scalar(node.get("hiringOrganization"))),
+                ("Location", _scalar(node.get("jobLocation"))),
+                ("Employment", _scalar(node.get("employmentType"))),
+                ("Posted", _scalar(node.get("datePosted"))),
+                ("Deadline", _scalar(node.get("validThrough"))),
+            ]
+            return format_jd(fields, sections)
+    return None
+
+
+# ==== Next.js
+
+
+def _job_sections(node: dict) -> Dict[str, str]:
+    """Sections of a JSON object, looking one level into nested objects."""
+    sections: Dict[str, str] = {}
+    items = list(node.items())
+    for value in node.values():
+        if isinstance(value, dict):
+            items.extend(value.items())
+
+    for key, value in items:
+        label = _section_label(key)
+        if label and label not in sections and isinstance(value, (str, list)):
+            text = _section_text(value)
+            if text:
+                sections[label] = text
+    return sections
+
+
+def _first_scalar(node: dict, keys: List[str]) -> Optional[str]:
+    for key in keys:
+        if key in node:
+            value = _scalar(node[key])
+            if value:
+                return value
+    return None
+
+
+def extract_next_data(soup: BeautifulSoup) -> Optional[str]:
+    """Extract the job object of a Next.js `__NEXT_DATA__` payload.
+
+    The job is the object with the most JD-like sections (main tasks,
+    requirements, preferred, ...), so no per-site schema is needed.
+    """
+    script = soup.find("script", id="__NEXT_DATA__")
+    if script is None:
+        return None
+    try:
+        data = json.loads(script.string or "")
+    except ValueError:
+        return None
+
+    best, best_sections = None, {}
+    for node in _walk_json(data.get("props", data)):
+        sections = _job_sections(node)
+        # Parents come first, so a job object wins over its nested detail object
+        if len(sections) > len(best_sections):
+            best, best_sections = node, sections
+
+    if best is None or len(best_sections) < 2:
+        return None
+
+    fields = [
+        ("Position", _first_scalar(best, TITLE_KEYS)),
+        ("Company", _first_scalar(best, COMPANY_KEYS)),
+        ("Location", _first_scalar(best, LOCATION_KEYS)),
+    ]
+    sections = [(label, best_sections.get(label)) for label in SECTION_ORDER]
+    return format_jd(fields, sections)
+
+
+# ==== Main content density
+
+
+def _hint_weight(tag: Tag) -> int:
+    hints = " ".join(tag.get("class") or []) + " " + (tag.get("id") or "")
+    weight = 0
+    if POSITIVE_HINTS.search(hints):
+        weight += 25
+    if NEGATIVE_HINTS.search(hints):
+        weight -= 25
+    return weight
+
+
+def _link_density(tag: Tag) -> float:
+    text_length = len(tag.get_text(strip=True))
+    if not text_length:
+        return 1.0
+    link_length = sum(len(a.get_text(strip=True)) for a in tag.find_all("a"))
+    return link_length / text_length
+
+
+def _paragraphs(root: Tag) -> Iterator[Tag]:
+    """Paragraph-like nodes: paragraph tags and divs without block children."""
+    for node in root.find_all(PARAGRAPH_TAGS + ["div"]):
+        if node.name == "div" and node.find(BLOCK_TAGS):
+            continue
+        yield node
+
+
+def extract_main_content(soup: BeautifulSoup) -> Optional[str]:
+    """Extract the densest content block of the page.
+
+    Each paragraph scores its parent fully and its grandparent by half, with
+    longer and comma-rich paragraphs scoring higher. The best block, discounted
+    by link density and weighted by class/id hints, is kept together with
+    siblings that score comparably.
+    """
+    root = soup.body or soup
+    for tag in root(NOISE_TAGS):
+        tag.decompose()
+
+    scores: Dict[int, List] = {}
+    for paragraph in _paragraphs(root):
+        text = paragraph.get_text(" ", strip=True)
+        if len(text) < 20:
+            continue
+        score = 1 + text.count(",") + text.count("·") + min(len(text) // 100, 3)
+
+        ancestor = paragraph.parent
+        for divisor in (1, 2):
+            if not isinstance(ancestor, Tag) or ancestor.name in ("[document]", "html"):
+                break
+            entry = scores.setdefault(id(ancestor), [ancestor, _hint_weight(ancestor)])
+            entry[1] += score / divisor
+            ancestor = ancestor.parent
+
+    if not scores:
+        return None
+
+    ranked = {
+        key: (tag, score * (1 - _link_density(tag)))
+        for key, (tag, score) in scores.items()
+    }
+    best, best_score = max(ranked.values(), key=lambda item: item[1])
+
+    threshold = max(10, best_score * 0.2)
+    parts = []
+    siblings = best.parent.find_all(recursive=False) if best.parent else [best]
+    for sibling in siblings:
+        entry = ranked.get(id(sibling))
+        if sibling is best or (entry and entry[1] >= threshold):
+            parts.append(tag_text(sibling))
+
+    text = clean_lines("\n".join(parts))
+    if len(text) < MIN_MAIN_CONTENT_CHARS:
+        return None
+    return text
+
+
+# ==== Engine
+
+DEFAULT_EXTRACTORS: List[Extractor] = [
+    extract_json_ld,
+    extract_next_data,
+    extract_main_content,
+]
+# Extractors tried before the defaults, by host suffix
+SITE_EXTRACTORS: Dict[str, List[Extractor]] = {
+    "wanted.co.kr": [extract_next_data],
+    "jumpit.saramin.co.kr": [extract_next_data],
+    "saramin.co.kr": [extract_json_ld],
+    "jobkorea.co.kr": [extract_json_ld],
+}
+
+
+def register_extractor(host: str, extractor: Extractor) -> None:
+    """Try `extractor` first for pages on `host` and its subdomains."""
+    SITE_EXTRACTORS.setdefault(host, []).insert(0, extractor)
+
+
+def _extractors_for(url: str) -> List[Extractor]:
+    host = (urlparse(url).hostname or "").lower()
+    site = []
+    # Longest suffix first, so subdomain rules beat domain rules
+    for suffix in sorted(SITE_EXTRACTORS, key=len, reverse=True):
+        if host == suffix or host.endswith("." + suffix):
+            site.extend(SITE_EXTRACTORS[suffix])
+    return list(dict.fromkeys(site + DEFAULT_EXTRACTORS))
+
+
+def extract_jd_text(html: bytes | str, url: str = "") -> str:
+    """Extract the job description of a page as compact text.
+
+    Args:
+        html: Raw page content.
+        url: Page URL, used to pick site-specific extractors.
+
+    Returns:
+        str: Structured JD text, truncated to MAX_JD_CHARS.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    text = None
+    for extractor in _extractors_for(url):
+        try:
+            text = extractor(soup)
+        except Exception as e:
+            logger.warning(f"JD extractor {extractor.__name__} failed: {e}")
+            continue
+        if text:
+            logger.debug(f"JD extracted with {extractor.__name__}: {len(text)} chars")
+            break
+
+    if not text:
+        root = soup.body or soup
+        for tag in root(NOISE_TAGS):
+            tag.decompose()
+        text = tag_text(root)
+
+    if len(text) > MAX_JD_CHARS:
+        text = text[:MAX_JD_CHARS] + "...(truncated)"
+    return text
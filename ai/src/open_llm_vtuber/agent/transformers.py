@@ -6,6 +6,7 @@ from ..live2d_model import Live2dModel
 from ..config_manager import TTSPreprocessorConfig
 from ..utils.sentence_divider import SentenceDivider
 from ..utils.sentence_divider import SentenceWithTags, TagState
+from ..utils.turn_trace import current_turn, trace_first_token
 from loguru import logger
 
 
@@ -13,6 +14,8 @@ def sentence_divider(
     faster_first_response: bool = True,
     segment_method: str = "pysbd",
     valid_tags: List[str] = None,
+    first_chunk_wait_ms: float = 500,
+    first_chunk_max_chars: int = 40,
 ):
     """
     Decorator that transforms token stream into sentences with tags
@@ -21,6 +24,8 @@ def sentence_divider(
         faster_first_response: bool - Whether to enable faster first response
         segment_method: str - Method for sentence segmentation
         valid_tags: List[str] - List of valid tags to process
+        first_chunk_wait_ms: float - Time without punctuation before the first chunk is emitted
+        first_chunk_max_chars: int - Maximum length of the first chunk
     """
 
     def decorator(
@@ -38,8 +43,13 @@ def sentence_divider(
                 faster_first_response=faster_first_response,
                 segment_method=segment_method,
                 valid_tags=valid_tags or [],
+                first_chunk_wait_ms=first_chunk_wait_ms,
+                first_chunk_max_chars=first_chunk_max_chars,
             )
             stream_from_func = func(*args, **kwargs)
+            trace = current_turn()
+            if trace is not None:
+                stream_from_func = trace_first_token(stream_from_func, trace)
 
             # Process the mixed stream using the updated SentenceDivider
             async for item in divider.process_stream(stream_from_func):
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from typing import List, Optional, Literal, get_args
 
 class NonVerbalData(BaseModel):
     """프론트엔드에서 전송되는 1초 단위 비언어적 데이터"""
@@ -8,6 +8,40 @@ class NonVerbalData(BaseModel):
     pose_status: Literal["good", "bad"]
     face_visible: bool
 
+    @classmethod
+    def from_payload(cls, payload: dict) -> "NonVerbalData":
+        """
+        매초 수신되는 데이터용 경량 생성자. 필드를 직접 검사한 뒤
+        pydantic 검증 없이 모델을 만듭니다. 잘못된 데이터는 ValueError.
+        """
+        try:
+            timestamp = payload["timestamp"]
+            gaze_direction = payload["gaze_direction"]
+            pose_status = payload["pose_status"]
+            face_visible = payload["face_visible"]
+        except KeyError as e:
+            raise ValueError(f"Missing behavior data field: {e}") from None
+
+        if isinstance(timestamp, bool) or not isinstance(timestamp, (int, float)):
+            raise ValueError(f"Invalid timestamp: {timestamp!r}")
+        if not isinstance(gaze_direction, str) or gaze_direction not in GAZE_DIRECTIONS:
+            raise ValueError(f"Invalid gaze_direction: {gaze_direction!r}")
+        if not isinstance(pose_status, str) or pose_status not in POSE_STATUSES:
+            raise ValueError(f"Invalid pose_status: {pose_status!r}")
+        if not isinstance(face_visible, bool):
+            raise ValueError(f"Invalid face_visible: {face_visible!r}")
+
+        return cls.model_construct(
+            timestamp=float(timestamp),
+            gaze_direction=gaze_direction,
+            pose_status=pose_status,
+            face_visible=face_visible,
+        )
+
+# from_payload가 검사하는 허용 값, 모델의 Literal 타입에서 가져옵니다
+GAZE_DIRECTIONS = frozenset(get_args(NonVerbalData.model_fields["gaze_direction"].annotation))
+POSE_STATUSES = frozenset(get_args(NonVerbalData.model_fields["pose_status"].annotation))
+
 class AnalysisSessionResult(BaseModel):
     """면접 세션 종료 후 생성되는 최종 분석 리포트 데이터"""
     session_id: str
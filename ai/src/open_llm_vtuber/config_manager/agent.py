@@ -30,6 +30,8 @@ class BasicMemoryAgentConfig(I18nMixin, BaseModel):
     ] = Field(..., alias="llm_provider")
 
     faster_first_response: Optional[bool] = Field(True, alias="faster_first_response")
+    first_chunk_wait_ms: Optional[float] = Field(500, alias="first_chunk_wait_ms")
+    first_chunk_max_chars: Optional[int] = Field(40, alias="first_chunk_max_chars")
     segment_method: Literal["regex", "pysbd"] = Field("pysbd", alias="segment_method")
     use_mcpp: Optional[bool] = Field(False, alias="use_mcpp")
     mcp_enabled_servers: Optional[List[str]] = Field([], alias="mcp_enabled_servers")
@@ -43,6 +45,14 @@ class BasicMemoryAgentConfig(I18nMixin, BaseModel):
             en="Whether to respond as soon as encountering a comma in the first sentence to reduce latency (default: True)",
             zh="是否在第一句回应时遇上逗号就直接生成音频以减少首句延迟（默认：True）",
         ),
+        "first_chunk_wait_ms": Description(
+            en="With faster_first_response, milliseconds without punctuation after which the first words are sent to TTS, 0 to disable (default: 500)",
+            zh="启用快速首句时，若超过该毫秒数仍未遇到标点，则将已收到的词语先送去生成音频，0 为禁用（默认：500）",
+        ),
+        "first_chunk_max_chars": Description(
+            en="With faster_first_response, maximum length of the first chunk sent to TTS without punctuation; the actual length follows the measured TTS latency (default: 40)",
+            zh="启用快速首句时，无标点首段送去生成音频的最大长度，实际长度根据测得的 TTS 延迟调整（默认：40）",
+        ),
         "segment_method": Description(
             en="Method for segmenting sentences: 'regex' or 'pysbd' (default: 'pysbd')",
             zh="分割句子的方法：'regex' 或 'pysbd'（默认：'pysbd'）",
@@ -1,6 +1,6 @@
 # config_manager/system.py
 from pydantic import Field, model_validator
-from typing import Dict, ClassVar
+from typing import Dict, ClassVar, Optional
 from .i18n import I18nMixin, Description
 
 
@@ -13,6 +13,12 @@ class SystemConfig(I18nMixin):
     config_alts_dir: str = Field(..., alias="config_alts_dir")
     tool_prompts: Dict[str, str] = Field(..., alias="tool_prompts")
     enable_proxy: bool = Field(False, alias="enable_proxy")
+    pipeline_group_turns: bool = Field(False, alias="pipeline_group_turns")
+    workers: int = Field(1, alias="workers")
+    preload_models: bool = Field(False, alias="preload_models")
+    lazy_engines: bool = Field(False, alias="lazy_engines")
+    warm_up_engines: bool = Field(True, alias="warm_up_engines")
+    turn_trace_file: Optional[str] = Field(None, alias="turn_trace_file")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "conf_version": Description(en="Configuration version", zh="配置文件版本"),
@@ -29,6 +35,30 @@ class SystemConfig(I18nMixin):
             en="Enable proxy mode for multiple clients",
             zh="启用代理模式以支持多个客户端使用一个 ws 连接",
         ),
+        "pipeline_group_turns": Description(
+            en="In group conversations, let the next AI generate the first sentence of its response while the current one is speaking",
+            zh="群聊时，在当前 AI 说话期间让下一个 AI 提前生成回复的第一句",
+        ),
+        "workers": Description(
+            en="Number of worker processes. Above 1, a sticky router on host:port forwards each client to one of the workers listening on port+1 and up",
+            zh="工作进程数。大于 1 时，host:port 上的粘性路由会把每个客户端转发到监听 port+1 起端口的某个工作进程",
+        ),
+        "preload_models": Description(
+            en="With multiple workers, load the models once before forking the workers so they share the model memory (Linux/macOS)",
+            zh="多工作进程时，在创建工作进程前只加载一次模型，使各进程共享模型内存（Linux/macOS）",
+        ),
+        "lazy_engines": Description(
+            en="Build the ASR, TTS, VAD and analysis engines on first use instead of before the server starts",
+            zh="在首次使用时才创建 ASR、TTS、VAD 和分析引擎，而不是在服务器启动前创建",
+        ),
+        "warm_up_engines": Description(
+            en="With lazy_engines, build the engines in the background once the server accepts connections",
+            zh="启用 lazy_engines 时，在服务器开始接受连接后于后台创建引擎",
+        ),
+        "turn_trace_file": Description(
+            en="File to append the latency trace of each conversation turn to, in OTLP/JSON (OpenTelemetry). Disabled if empty",
+            zh="以 OTLP/JSON（OpenTelemetry）格式追加每轮对话延迟追踪的文件。为空时不导出",
+        ),
     }
 
     @model_validator(mode="after")
@@ -36,4 +66,6 @@ class SystemConfig(I18nMixin):
         port = values.port
         if port < 0 or port > 65535:
             raise ValueError("Port must be between 0 and 65535")
+        if values.workers < 1:
+            raise ValueError("Workers must be at least 1")
         return values
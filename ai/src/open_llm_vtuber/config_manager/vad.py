@@ -14,6 +14,7 @@ class SileroVADConfig(I18nMixin):
     required_hits: int = Field(..., alias="required_hits")  # 3 * (0.032) = 0.1s
     required_misses: int = Field(..., alias="required_misses")  # 24 * (0.032) = 0.8s
     smoothing_window: int = Field(..., alias="smoothing_window")  # 5
+    onnx: bool = Field(False, alias="onnx")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "orig_sr": Description(en="Original Audio Sample Rate", zh="原始音频采样率"),
@@ -35,6 +36,10 @@ class SileroVADConfig(I18nMixin):
         "smoothing_window": Description(
             en="Smoothing window size for VAD", zh="语音活动检测的平滑窗口大小"
         ),
+        "onnx": Description(
+            en="Run the ONNX model with onnxruntime instead of torch, so torch is not loaded",
+            zh="使用 onnxruntime 运行 ONNX 模型而非 torch，从而不加载 torch",
+        ),
     }
 
 
@@ -1,5 +1,4 @@
 import asyncio
-import json
 from typing import Dict, Optional, Callable
 
 import numpy as np
@@ -54,13 +53,11 @@ async def handle_conversation_trigger(
             "skip_history": True,  # Skip storing in local conversation history
         }
 
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "full-text",
-                    "text": "AI wants to speak something...",
-                }
-            )
+        await websocket.send_json(
+            {
+                "type": "full-text",
+                "text": "AI wants to speak something...",
+            }
         )
     elif msg_type == "text-input":
         user_input = data.get("text", "")
@@ -99,7 +96,7 @@ async def handle_conversation_trigger(
         current_conversation_tasks[client_uid] = asyncio.create_task(
             process_single_conversation(
                 context=context,
-                websocket_send=websocket.send_text,
+                websocket_send=websocket.send_json,
                 client_uid=client_uid,
                 user_input=user_input,
                 images=images,
@@ -1,8 +1,8 @@
 import asyncio
 import re
+from contextlib import nullcontext
 from typing import Optional, Union, Any, List, Dict
 import numpy as np
-import json
 from loguru import logger
 
 from ..message_handler import message_handler
@@ -14,6 +14,8 @@ from ..asr.asr_interface import ASRInterface
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
 from ..utils.stream_audio import prepare_audio_payload
+from ..utils.turn_trace import current_turn
+from ..utils.lazy_engine import resolve_engine
 
 
 # Convert class methods to standalone functions
@@ -73,9 +75,7 @@ async def process_agent_output(
     except Exception as e:
         logger.error(f"Error processing agent output: {e}")
         await websocket_send(
-            json.dumps(
-                {"type": "error", "message": f"Error processing response: {str(e)}"}
-            )
+            {"type": "error", "message": f"Error processing response: {str(e)}"}
         )
 
     return full_response
@@ -126,21 +126,19 @@ async def handle_audio_output(
             display_text=display_text,
             actions=actions.to_dict() if actions else None,
         )
-        await websocket_send(json.dumps(audio_payload))
+        await websocket_send(audio_payload)
     return full_response
 
 
 async def send_conversation_start_signals(websocket_send: WebSocketSend) -> None:
     """Send initial conversation signals"""
     await websocket_send(
-        json.dumps(
-            {
-                "type": "control",
-                "text": "conversation-chain-start",
-            }
-        )
+        {
+            "type": "control",
+            "text": "conversation-chain-start",
+        }
     )
-    await websocket_send(json.dumps({"type": "full-text", "text": "Thinking..."}))
+    await websocket_send({"type": "full-text", "text": "Thinking..."})
 
 
 async def process_user_input(
@@ -151,10 +149,11 @@ async def process_user_input(
     """Process user input, converting audio to text if needed"""
     if isinstance(user_input, np.ndarray):
         logger.info("Transcribing audio input...")
-        input_text = await asr_engine.async_transcribe_np(user_input)
-        await websocket_send(
-            json.dumps({"type": "user-input-transcription", "text": input_text})
-        )
+        trace = current_turn()
+        with trace.span("asr") if trace else nullcontext():
+            asr_engine = await resolve_engine(asr_engine)
+            input_text = await asr_engine.async_transcribe_np(user_input)
+        await websocket_send({"type": "user-input-transcription", "text": input_text})
         return input_text
     return user_input
 
@@ -168,7 +167,7 @@ async def finalize_conversation_turn(
     """Finalize a conversation turn"""
     if tts_manager.task_list:
         await asyncio.gather(*tts_manager.task_list)
-        await websocket_send(json.dumps({"type": "backend-synth-complete"}))
+        await websocket_send({"type": "backend-synth-complete"})
 
         response = await message_handler.wait_for_response(
             client_uid, "frontend-playback-complete"
@@ -177,8 +176,11 @@ async def finalize_conversation_turn(
         if not response:
             logger.warning(f"No playback completion response from {client_uid}")
             return
+        trace = current_turn()
+        if trace:
+            trace.mark("playback.complete", since="ws.first_payload")
 
-    await websocket_send(json.dumps({"type": "force-new-message"}))
+    await websocket_send({"type": "force-new-message"})
 
     if broadcast_ctx and broadcast_ctx.broadcast_func:
         await broadcast_ctx.broadcast_func(
@@ -201,7 +203,7 @@ async def send_conversation_end_signal(
         "text": "conversation-chain-end",
     }
 
-    await websocket_send(json.dumps(chain_end_msg))
+    await websocket_send(chain_end_msg)
 
     if broadcast_ctx and broadcast_ctx.broadcast_func and broadcast_ctx.group_members:
         await broadcast_ctx.broadcast_func(
@@ -1,6 +1,16 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from dataclasses import dataclass, field
 import asyncio
-import json
 from loguru import logger
 from fastapi import WebSocket
 import numpy as np
@@ -21,13 +31,69 @@ from .types import (
     BroadcastContext,
     WebSocketSend,
 )
-from ..service_context import ServiceContext
 from ..chat_history_manager import store_message
 from .tts_manager import TTSTaskManager
 
+if TYPE_CHECKING:
+    from ..service_context import ServiceContext
+
+
+class TurnGate:
+    """Holds back the messages of a speculative turn until it is committed.
+
+    Calls made through `wrap`ped send/broadcast functions are queued while
+    the gate is closed and replayed in order by `open()`. The turn itself
+    waits on `wait_open()` after its first sentence, so only that much is
+    generated and synthesized ahead of time.
+    """
+
+    def __init__(self, is_open: bool = True) -> None:
+        self.is_open = is_open
+        self._pending: List[Tuple[Callable[..., Awaitable[None]], tuple]] = []
+        self._opened = asyncio.Event()
+        if is_open:
+            self._opened.set()
+
+    def wrap(
+        self, func: Callable[..., Awaitable[None]]
+    ) -> Callable[..., Awaitable[None]]:
+        async def gated(*args) -> None:
+            if self.is_open:
+                await func(*args)
+            else:
+                self._pending.append((func, args))
+
+        return gated
+
+    async def open(self) -> None:
+        # Calls queued while replaying are replayed too, so order is kept
+        while self._pending:
+            func, args = self._pending.pop(0)
+            await func(*args)
+        self.is_open = True
+        self._opened.set()
+
+    async def wait_open(self) -> None:
+        await self._opened.wait()
+
+
+@dataclass
+class MemberTurn:
+    """A member's turn whose response is being generated.
+
+    `memory_checkpoint` is set while the turn is speculative, to roll the
+    member's agent memory back if the turn is never committed.
+    """
+
+    member_uid: str
+    gate: TurnGate
+    tts_manager: TTSTaskManager
+    generation: Optional[asyncio.Task] = field(default=None)
+    memory_checkpoint: Optional[int] = field(default=None)
+
 
 async def process_group_conversation(
-    client_contexts: Dict[str, ServiceContext],
+    client_contexts: Dict[str, "ServiceContext"],
     client_connections: Dict[str, WebSocket],
     broadcast_func: BroadcastFunc,
     group_members: List[str],
@@ -36,9 +102,18 @@ async def process_group_conversation(
     images: Optional[List[Dict[str, Any]]] = None,
     session_emoji: str = np.random.choice(EMOJI_LIST),
     metadata: Optional[Dict[str, Any]] = None,
+    pipelined: Optional[bool] = None,
 ) -> None:
     """Process group conversation
 
+    In pipelined mode, the next member starts generating its response (LLM
+    stream and TTS of its first sentence) while the current member's audio
+    is still playing. Its messages are held back until the current turn
+    completes, the rest of the response is generated from then on, and an
+    interrupt cancels the conversation before they are ever sent. The
+    member's agent memory is then rolled back, so it doesn't remember a
+    response nobody heard.
+
     Args:
         client_contexts: Dictionary of client contexts
         client_connections: Dictionary of client WebSocket connections
@@ -49,9 +124,10 @@ async def process_group_conversation(
         images: Optional list of image data
         session_emoji: Emoji identifier for the conversation
         metadata: Optional metadata for special processing flags
+        pipelined: Overlap turns, defaults to system_config.pipeline_group_turns
     """
-    # Create TTSTaskManager for each member
-    tts_managers = {uid: TTSTaskManager() for uid in group_members}
+    current_turn: Optional[MemberTurn] = None
+    next_turn: Optional[MemberTurn] = None
 
     try:
         logger.info(f"Group Conversation Chain {session_emoji} started!")
@@ -76,12 +152,18 @@ async def process_group_conversation(
             if initiator_context
             else "Human"
         )
+        if pipelined is None:
+            pipelined = bool(
+                initiator_context
+                and initiator_context.system_config
+                and initiator_context.system_config.pipeline_group_turns
+            )
 
         # Process initial input
         input_text = await process_group_input(
             user_input=user_input,
             initiator_context=initiator_context,
-            initiator_ws_send=client_connections[initiator_client_uid].send_text,
+            initiator_ws_send=client_connections[initiator_client_uid].send_json,
             broadcast_func=broadcast_func,
             group_members=group_members,
             initiator_client_uid=initiator_client_uid,
@@ -117,16 +199,54 @@ async def process_group_conversation(
                     current_metadata = metadata
                     is_first_responder = False
 
-                await handle_group_member_turn(
-                    current_member_uid=current_member_uid,
+                if next_turn and next_turn.member_uid != current_member_uid:
+                    # The queue changed under the speculative turn, drop it
+                    await cancel_member_turn(next_turn, client_contexts, session_emoji)
+                    next_turn = None
+
+                if next_turn:
+                    # Commit the speculative turn: send what it held back
+                    current_turn, next_turn = next_turn, None
+                    current_turn.memory_checkpoint = None
+                else:
+                    current_turn = start_member_turn(
+                        member_uid=current_member_uid,
+                        state=state,
+                        client_contexts=client_contexts,
+                        client_connections=client_connections,
+                        broadcast_func=broadcast_func,
+                        group_members=group_members,
+                        images=images,
+                        metadata=current_metadata,
+                    )
+
+                state.current_speaker_uid = current_member_uid
+                await current_turn.gate.open()
+                full_response = await current_turn.generation
+                record_member_response(
+                    current_member_uid, full_response, state, client_contexts
+                )
+
+                if pipelined and state.group_queue:
+                    next_turn = start_member_turn(
+                        member_uid=state.group_queue[0],
+                        state=state,
+                        client_contexts=client_contexts,
+                        client_connections=client_connections,
+                        broadcast_func=broadcast_func,
+                        group_members=group_members,
+                        images=images,
+                        speculative=True,
+                    )
+
+                await complete_member_turn(
+                    turn=current_turn,
+                    full_response=full_response,
                     state=state,
                     client_contexts=client_contexts,
                     client_connections=client_connections,
                     broadcast_func=broadcast_func,
                     group_members=group_members,
-                    images=images,
-                    tts_manager=tts_managers[current_member_uid],
-                    metadata=current_metadata,
                 )
             except Exception as e:
                 logger.error(f"Error in group member turn: {e}")
@@ -146,9 +266,10 @@ async def process_group_conversation(
         )
         raise
     finally:
-        # Cleanup all TTS managers
-        for tts_manager in tts_managers.values():
-            cleanup_conversation(tts_manager, session_emoji)
+        # A speculative turn is dropped, nothing of it was sent
+        for turn in (current_turn, next_turn):
+            if turn is not None:
+                await cancel_member_turn(turn, client_contexts, session_emoji)
         # Clean up
         GroupConversationState.remove_state(state.group_id)
 
@@ -166,7 +287,7 @@ def init_group_conversation_state(
 
 
 def init_group_conversation_contexts(
-    client_contexts: Dict[str, ServiceContext],
+    client_contexts: Dict[str, "ServiceContext"],
 ) -> None:
     """Initialize group conversation context for each AI participant"""
     ai_names = [ctx.character_config.character_name for ctx in client_contexts.values()]
@@ -190,7 +311,7 @@ def init_group_conversation_contexts(
 
 async def process_group_input(
     user_input: Union[str, np.ndarray],
-    initiator_context: ServiceContext,
+    initiator_context: "ServiceContext",
     initiator_ws_send: WebSocketSend,
     broadcast_func: BroadcastFunc,
     group_members: List[str],
@@ -223,27 +344,81 @@ async def broadcast_transcription(
     )
 
 
-async def handle_group_member_turn(
-    current_member_uid: str,
+def start_member_turn(
+    member_uid: str,
     state: GroupConversationState,
-    client_contexts: Dict[str, ServiceContext],
+    client_contexts: Dict[str, "ServiceContext"],
     client_connections: Dict[str, WebSocket],
     broadcast_func: BroadcastFunc,
     group_members: List[str],
     images: Optional[List[Dict[str, Any]]],
-    tts_manager: TTSTaskManager,
     metadata: Optional[Dict[str, Any]] = None,
-) -> None:
-    """Handle a single group member's conversation turn"""
-    # Update current speaker before processing
-    state.current_speaker_uid = current_member_uid
+    speculative: bool = False,
+) -> MemberTurn:
+    """Start generating a member's response in the background.
 
-    await broadcast_thinking_state(broadcast_func, group_members)
+    The member sees the conversation up to now. A speculative turn's
+    messages are held by its gate until the turn is committed, and it
+    pauses after its first sentence until then.
+    """
+    gate = TurnGate(is_open=not speculative)
+    turn = MemberTurn(member_uid=member_uid, gate=gate, tts_manager=TTSTaskManager())
+    agent = client_contexts[member_uid].agent_engine
+    if speculative and hasattr(agent, "memory_checkpoint"):
+        turn.memory_checkpoint = agent.memory_checkpoint()
+    turn.generation = asyncio.create_task(
+        generate_member_response(
+            member_uid=member_uid,
+            state=state,
+            context=client_contexts[member_uid],
+            ws_send=gate.wrap(client_connections[member_uid].send_json),
+            broadcast_func=gate.wrap(broadcast_func),
+            group_members=group_members,
+            images=images,
+            tts_manager=turn.tts_manager,
+            metadata=metadata,
+            gate=gate,
+        )
+    )
+    return turn
 
-    context = client_contexts[current_member_uid]
-    current_ws_send = client_connections[current_member_uid].send_text
 
-    new_messages = state.conversation_history[state.memory_index[current_member_uid] :]
+async def cancel_member_turn(
+    turn: MemberTurn,
+    client_contexts: Dict[str, "ServiceContext"],
+    session_emoji: str,
+) -> None:
+    """Stop a member's turn, rolling back its memory if it was never committed"""
+    if turn.generation:
+        if not turn.generation.done():
+            turn.generation.cancel()
+        # Let the agent stop writing to its memory before rolling it back
+        await asyncio.gather(turn.generation, return_exceptions=True)
+    cleanup_conversation(turn.tts_manager, session_emoji)
+
+    if turn.memory_checkpoint is not None:
+        agent = client_contexts[turn.member_uid].agent_engine
+        agent.rollback_memory(turn.memory_checkpoint)
+        turn.memory_checkpoint = None
+        logger.debug(f"Rolled back the speculative turn of {turn.member_uid}")
+
+
+async def generate_member_response(
+    member_uid: str,
+    state: GroupConversationState,
+    context: "ServiceContext",
+    ws_send: WebSocketSend,
+    broadcast_func: BroadcastFunc,
+    group_members: List[str],
+    images: Optional[List[Dict[str, Any]]],
+    tts_manager: TTSTaskManager,
+    metadata: Optional[Dict[str, Any]] = None,
+    gate: Optional[TurnGate] = None,
+) -> str:
+    """Stream a member's response and queue its TTS, returning the full text"""
+    await broadcast_thinking_state(broadcast_func, group_members)
+
+    new_messages = state.conversation_history[state.memory_index[member_uid] :]
     new_context = "\n".join(new_messages) if new_messages else ""
 
     batch_input = create_batch_input(
@@ -255,42 +430,71 @@ async def handle_group_member_turn(
 
     logger.info(
         f"AI {context.character_config.character_name} "
-        f"(client {current_member_uid}) receiving context:\n{new_context}"
+        f"(client {member_uid}) receiving context:\n{new_context}"
     )
 
-    full_response = await process_member_response(
+    return await process_member_response(
         context=context,
         batch_input=batch_input,
-        current_ws_send=current_ws_send,
+        current_ws_send=ws_send,
         tts_manager=tts_manager,
         broadcast_func=broadcast_func,
         group_members=group_members,
+        gate=gate,
     )
 
+
+def record_member_response(
+    member_uid: str,
+    full_response: str,
+    state: GroupConversationState,
+    client_contexts: Dict[str, "ServiceContext"],
+) -> None:
+    """Add a response to the conversation, so the next member sees it"""
+    if full_response:
+        context = client_contexts[member_uid]
+        ai_message = f"{context.character_config.character_name}: {full_response}"
+        state.conversation_history.append(ai_message)
+        logger.info(f"Appended complete response: {ai_message}")
+
+    state.memory_index[member_uid] = len(state.conversation_history)
+
+
+async def complete_member_turn(
+    turn: MemberTurn,
+    full_response: str,
+    state: GroupConversationState,
+    client_contexts: Dict[str, "ServiceContext"],
+    client_connections: Dict[str, WebSocket],
+    broadcast_func: BroadcastFunc,
+    group_members: List[str],
+) -> None:
+    """Wait for the member's audio to finish playing, then store the response"""
+    member_uid = turn.member_uid
+    context = client_contexts[member_uid]
+    current_ws_send = client_connections[member_uid].send_json
+    tts_manager = turn.tts_manager
+
     if tts_manager.task_list:
         await asyncio.gather(*tts_manager.task_list)
-        await current_ws_send(json.dumps({"type": "backend-synth-complete"}))
+        await current_ws_send({"type": "backend-synth-complete"})
 
         broadcast_ctx = BroadcastContext(
             broadcast_func=broadcast_func,
             group_members=group_members,
-            current_client_uid=current_member_uid,
+            current_client_uid=member_uid,
         )
 
         await finalize_conversation_turn(
             tts_manager=tts_manager,
             websocket_send=current_ws_send,
-            client_uid=current_member_uid,
+            client_uid=member_uid,
             broadcast_ctx=broadcast_ctx,
         )
 
     if full_response:
-        ai_message = f"{context.character_config.character_name}: {full_response}"
-        state.conversation_history.append(ai_message)
-        logger.info(f"Appended complete response: {ai_message}")
-
-        for member_uid in group_members:
-            member_context = client_contexts[member_uid]
+        for uid in group_members:
+            member_context = client_contexts[uid]
             store_message(
                 conf_uid=member_context.character_config.conf_uid,
                 history_uid=member_context.history_uid,
@@ -299,11 +503,9 @@ async def handle_group_member_turn(
                 name=context.character_config.character_name,
                 avatar=context.character_config.avatar,
             )
-        else:
-            logger.debug("Skipping storing AI response to history (proactive speak)")
 
-    state.memory_index[current_member_uid] = len(state.conversation_history)
-    state.group_queue.append(current_member_uid)
+    cleanup_conversation(tts_manager, state.session_emoji)
+    state.group_queue.append(member_uid)
 
     # Clear speaker after turn completes
     state.current_speaker_uid = None
@@ -339,14 +541,19 @@ async def handle_member_error(
 
 
 async def process_member_response(
-    context: ServiceContext,
+    context: "ServiceContext",
     batch_input: Any,
     current_ws_send: WebSocketSend,
     tts_manager: TTSTaskManager,
     broadcast_func: Optional[BroadcastFunc] = None,
     group_members: Optional[List[str]] = None,
+    gate: Optional[TurnGate] = None,
 ) -> str:
-    """Process group member's response, handling text/audio and tool status events."""
+    """Process group member's response, handling text/audio and tool status events.
+
+    With a closed `gate`, the stream is paused after each sentence until the
+    gate opens.
+    """
     full_response = ""
 
     try:
@@ -378,6 +585,8 @@ async def process_member_response(
                     translate_engine=context.translate_engine,
                 )
                 full_response += response_part  # Accumulate text response
+                if gate is not None and not gate.is_open:
+                    await gate.wait_open()
             else:
                 logger.warning(
                     f"Received unexpected item type from agent chat stream: {type(output_item)}"
@@ -386,9 +595,7 @@ async def process_member_response(
     except Exception as e:
         logger.exception(f"Error processing group member response stream: {e}")
         await current_ws_send(
-            json.dumps(
-                {"type": "error", "message": f"Error processing response: {str(e)}"}
-            )
+            {"type": "error", "message": f"Error processing response: {str(e)}"}
         )
 
     return full_response
@@ -1,6 +1,5 @@
 from typing import Union, List, Dict, Any, Optional
 import asyncio
-import json
 from loguru import logger
 import numpy as np
 
@@ -17,6 +16,7 @@ from .types import WebSocketSend
 from .tts_manager import TTSTaskManager
 from ..chat_history_manager import store_message
 from ..service_context import ServiceContext
+from ..utils.turn_trace import TurnTracer
 
 # Import necessary types from agent outputs
 from ..agent.output_types import SentenceOutput, AudioOutput
@@ -45,6 +45,8 @@ async def process_single_conversation(
     Returns:
         str: Complete response text
     """
+    tracer = TurnTracer.get_instance()
+    trace = tracer.start_turn(client_uid)
     # Create TTSTaskManager for this conversation
     tts_manager = TTSTaskManager()
     full_response = ""  # Initialize full_response here
@@ -87,6 +89,7 @@ async def process_single_conversation(
 
         try:
             # agent.chat yields Union[SentenceOutput, Dict[str, Any]]
+            trace.begin("llm")
             agent_output_stream = context.agent_engine.chat(batch_input)
 
             async for output_item in agent_output_stream:
@@ -98,10 +101,11 @@ async def process_single_conversation(
                     output_item["name"] = context.character_config.character_name
                     logger.debug(f"Sending tool status update: {output_item}")
 
-                    await websocket_send(json.dumps(output_item))
+                    await websocket_send(output_item)
 
                 elif isinstance(output_item, (SentenceOutput, AudioOutput)):
                     # Handle SentenceOutput or AudioOutput
+                    trace.mark("llm.first_sentence", since="llm")
                     response_part = await process_agent_output(
                         output=output_item,
                         character_config=context.character_config,
@@ -127,12 +131,10 @@ async def process_single_conversation(
                 f"Error processing agent response stream: {e}"
             )  # Log with stack trace
             await websocket_send(
-                json.dumps(
-                    {
-                        "type": "error",
-                        "message": f"Error processing agent response: {str(e)}",
-                    }
-                )
+                {
+                    "type": "error",
+                    "message": f"Error processing agent response: {str(e)}",
+                }
             )
             # full_response will contain partial response before error
         # --- End processing agent response ---
@@ -141,7 +143,7 @@ async def process_single_conversation(
         if tts_manager.task_list:
             await asyncio.gather(*tts_manager.task_list)
             try:
-                await websocket_send(json.dumps({"type": "backend-synth-complete"}))
+                await websocket_send({"type": "backend-synth-complete"})
             except RuntimeError as e:
                 if "Cannot call \"send\"" in str(e):
                     logger.warning(f"Socket closed before sending synth-complete: {e}")
@@ -153,6 +155,7 @@ async def process_single_conversation(
             websocket_send=websocket_send,
             client_uid=client_uid,
         )
+        tracer.finish(trace)
 
         if context.history_uid and full_response:  # Check full_response before storing
             store_message(
@@ -182,9 +185,7 @@ async def process_single_conversation(
     except Exception as e:
         logger.error(f"Error in conversation chain: {e}")
         try:
-            await websocket_send(
-                json.dumps({"type": "error", "message": f"Conversation error: {str(e)}"})
-            )
+            await websocket_send({"type": "error", "message": f"Conversation error: {str(e)}"})
         except RuntimeError as rt_err:
              if "Cannot call \"send\"" in str(rt_err):
                  logger.warning(f"Could not send error message to closed socket: {rt_err}")
@@ -192,5 +193,7 @@ async def process_single_conversation(
                  raise
         raise
     finally:
+        # Interrupted or failed turns are not recorded
+        tracer.finish(trace, record=False)
         cleanup_conversation(tts_manager, session_emoji)
 
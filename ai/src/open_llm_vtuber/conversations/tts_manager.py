@@ -1,6 +1,6 @@
 import asyncio
-import json
 import re
+import time
 import uuid
 from datetime import datetime
 from typing import List, Optional, Dict
@@ -10,6 +10,9 @@ from ..agent.output_types import DisplayText, Actions
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
 from ..utils.stream_audio import prepare_audio_payload
+from ..utils.tts_latency import TTSLatencyTracker
+from ..utils.turn_trace import current_turn
+from ..utils.lazy_engine import resolve_engine
 from .types import WebSocketSend
 
 
@@ -26,6 +29,11 @@ class TTSTaskManager:
         # Counter for maintaining order
         self._sequence_counter = 0
         self._next_sequence_to_send = 0
+        # The manager is created per turn, so this is when the turn started
+        self._turn_start = time.monotonic()
+        self.time_to_first_audio: Optional[float] = None
+        # Trace of the turn, None outside traced (single-user) turns
+        self.trace = current_turn()
 
     async def speak(
         self,
@@ -66,6 +74,9 @@ class TTSTaskManager:
             f"🏃Queuing TTS task for: '''{tts_text}''' (by {display_text.name})"
         )
 
+        if self.trace:
+            self.trace.begin("tts")
+
         # Get current sequence number
         current_sequence = self._sequence_counter
         self._sequence_counter += 1
@@ -105,7 +116,17 @@ class TTSTaskManager:
                 # Send payloads in order
                 while self._next_sequence_to_send in buffered_payloads:
                     next_payload = buffered_payloads.pop(self._next_sequence_to_send)
-                    await websocket_send(json.dumps(next_payload))
+                    await websocket_send(next_payload)
+                    if (
+                        self.time_to_first_audio is None
+                        and next_payload.get("audio") is not None
+                    ):
+                        self.time_to_first_audio = time.monotonic() - self._turn_start
+                        if self.trace:
+                            self.trace.mark("ws.first_payload")
+                        logger.info(
+                            f"⏱️ Time to first audio: {self.time_to_first_audio * 1000:.0f} ms"
+                        )
                     self._next_sequence_to_send += 1
 
                 self._payload_queue.task_done()
@@ -140,6 +161,8 @@ class TTSTaskManager:
         audio_file_path = None
         try:
             audio_file_path = await self._generate_audio(tts_engine, tts_text)
+            if self.trace:
+                self.trace.mark("tts.first_audio", since="tts")
             payload = prepare_audio_payload(
                 audio_path=audio_file_path,
                 display_text=display_text,
@@ -166,10 +189,16 @@ class TTSTaskManager:
     async def _generate_audio(self, tts_engine: TTSInterface, text: str) -> str:
         """Generate audio file from text"""
         logger.debug(f"🏃Generating audio for '''{text}'''...")
-        return await tts_engine.async_generate_audio(
+        # Built before the timer starts, so the latency is the synthesis only
+        tts_engine = await resolve_engine(tts_engine)
+        start = time.monotonic()
+        audio_file_path = await tts_engine.async_generate_audio(
             text=text,
             file_name_no_ext=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
         )
+        # Used to size the first chunk of later turns
+        TTSLatencyTracker.get_instance().record(time.monotonic() - start)
+        return audio_file_path
 
     def clear(self) -> None:
         """Clear all pending tasks and reset state"""
@@ -178,5 +207,7 @@ class TTSTaskManager:
             self._sender_task.cancel()
         self._sequence_counter = 0
         self._next_sequence_to_send = 0
+        self._turn_start = time.monotonic()
+        self.time_to_first_audio = None
         # Create a new queue to clear any pending items
         self._payload_queue = asyncio.Queue()
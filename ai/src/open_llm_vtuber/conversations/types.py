@@ -1,11 +1,12 @@
-from typing import List, Dict, Callable, Optional, TypedDict, Awaitable, ClassVar
+from typing import Any, List, Dict, Callable, Optional, TypedDict, Awaitable, ClassVar
 from dataclasses import dataclass, field
 from pydantic import BaseModel
 
 from ..agent.output_types import Actions, DisplayText
 
 # Type definitions
-WebSocketSend = Callable[[str], Awaitable[None]]
+# Sends a message dict, serialized by the connection's wire format
+WebSocketSend = Callable[[Dict[str, Any]], Awaitable[None]]
 BroadcastFunc = Callable[[List[str], dict, Optional[str]], Awaitable[None]]
 
 
@@ -1,3 +1,4 @@
+import re
 import json
 import chardet
 from loguru import logger
@@ -17,6 +18,7 @@ class Live2dModel:
         model_info (dict): The information of the Live2D model.
         emo_map (dict): The emotion map of the Live2D model.
         emo_str (str): The string representation of the emotion map of the Live2D model.
+        emo_pattern (re.Pattern | None): The compiled pattern matching any emotion tag of the emotion map, or None if the map is empty.
     """
 
     model_dict_path: str
@@ -24,6 +26,7 @@ class Live2dModel:
     model_info: dict
     emo_map: dict
     emo_str: str
+    emo_pattern: re.Pattern | None
 
     def __init__(
         self, live2d_model_name: str, model_dict_path: str = "model_dict.json"
@@ -34,7 +37,7 @@ class Live2dModel:
 
     def set_model(self, model_name: str) -> None:
         """
-        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, and `self.emo_str` attributes.
+        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, `self.emo_str`, and `self.emo_pattern` attributes.
         This method is called in the constructor.
 
         Parameters:
@@ -51,6 +54,25 @@ class Live2dModel:
         self.emo_str: str = " ".join([f"[{key}]," for key in self.emo_map.keys()])
         # emo_str is a string of the keys in the emoMap dictionary. The keys are enclosed in square brackets.
         # example: `"[fear], [anger], [disgust], [sadness], [joy], [neutral], [surprise]"`
+        self.emo_pattern: re.Pattern | None = self._compile_emo_pattern(self.emo_map)
+
+    @staticmethod
+    def _compile_emo_pattern(emo_map: dict) -> re.Pattern | None:
+        """
+        Compile a single case-insensitive pattern that matches any `[key]` tag of the emotion map.
+        Longer keys come first, so a key is never shadowed by a shorter one.
+
+        Parameters:
+            emo_map (dict): The emotion map with lowercase keys.
+
+        Returns:
+            re.Pattern | None: The compiled pattern, or None if the emotion map is empty.
+        """
+        if not emo_map:
+            return None
+        keys = sorted(emo_map.keys(), key=len, reverse=True)
+        alternation = "|".join(re.escape(key) for key in keys)
+        return re.compile(rf"\[({alternation})\]", re.IGNORECASE)
 
     def _load_file_content(self, file_path: str) -> str:
         """Load the content of a file with robust encoding handling."""
@@ -154,22 +176,12 @@ class Live2dModel:
             list: A list of values of the emotions found in the string. An empty list is returned if no emotions are found.
         """
 
-        expression_list = []
-        str_to_check = str_to_check.lower()
-
-        i = 0
-        while i < len(str_to_check):
-            if str_to_check[i] != "[":
-                i += 1
-                continue
-            for key in self.emo_map.keys():
-                emo_tag = f"[{key}]"
-                if str_to_check[i : i + len(emo_tag)] == emo_tag:
-                    expression_list.append(self.emo_map[key])
-                    i += len(emo_tag) - 1
-                    break
-            i += 1
-        return expression_list
+        if self.emo_pattern is None or "[" not in str_to_check:
+            return []
+        return [
+            self.emo_map[match.group(1).lower()]
+            for match in self.emo_pattern.finditer(str_to_check)
+        ]
 
     def remove_emotion_keywords(self, target_str: str) -> str:
         """
@@ -182,13 +194,6 @@ class Live2dModel:
             str: The cleaned string with the emotion keywords removed.
         """
 
-        lower_str = target_str.lower()
-
-        for key in self.emo_map.keys():
-            lower_key = f"[{key}]".lower()
-            while lower_key in lower_str:
-                start_index = lower_str.find(lower_key)
-                end_index = start_index + len(lower_key)
-                target_str = target_str[:start_index] + target_str[end_index:]
-                lower_str = lower_str[:start_index] + lower_str[end_index:]
-        return target_str
+        if self.emo_pattern is None or "[" not in target_str:
+            return target_str
+        return self.emo_pattern.sub("", target_str)
@@ -1,16 +1,43 @@
 import json
+from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
+_WHITESPACE = " \t\r\n"
+
+
+@dataclass
+class _OpenObject:
+    """An unclosed `{` in the buffer.
+
+    Args:
+        start (int): Position of the `{` in the buffer.
+        viable (Optional[bool]): Whether it can start a JSON object, decided by
+            the first non-whitespace character after it. None until seen.
+        children (list[tuple[int, int]]): Closed child objects, as (start, end)
+            spans, that will be parsed only if this object turns out invalid.
+    """
+
+    start: int
+    viable: Optional[bool] = None
+    children: List[Tuple[int, int]] = field(default_factory=list)
+
 
 class StreamJSONDetector:
-    """Detector for real-time JSON detection in streaming text."""
+    """Detector for real-time JSON detection in streaming text.
+
+    Tracks braces and string state incrementally, so every character is
+    scanned once and a JSON object is parsed only when it closes. Prose around
+    the JSON, including stray braces, is skipped.
+    """
 
     def __init__(self):
         self.buffer = ""  # Store text that has not been fully processed
-        self.potential_jsons = []  # Store possible JSON starting positions
         self.completed_jsons = []  # Store completed JSON objects
-        self.processed_ranges = []  # Store processed intervals [start, end]
+        self._scan_pos = 0  # Next buffer position to scan
+        self._open: List[_OpenObject] = []  # Stack of unclosed objects
+        self._in_string = False
+        self._escaped = False
 
     def process_chunk(self, chunk: str) -> List[Dict[str, Any]]:
         """Process a single text chunk, return a list of complete JSON objects found in this chunk.
@@ -21,104 +48,101 @@ class StreamJSONDetector:
         Returns:
             List[Dict[str, Any]]: List of complete JSON objects parsed from the current chunk
         """
-        # Add new chunk to buffer
-        old_length = len(self.buffer)
         self.buffer += chunk
+        new_jsons = []
 
-        # Update potential JSON starting positions
-        self._find_potential_starts(old_length)
-
-        # Try to parse potential JSON objects
-        new_jsons = self._try_parse_jsons()
-
-        return new_jsons
+        buffer = self.buffer
+        for i in range(self._scan_pos, len(buffer)):
+            char = buffer[i]
+            top = self._open[-1] if self._open else None
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
 
-    def _find_potential_starts(self, start_from: int) -> None:
-        """Find new potential JSON starting positions in the buffer.
+            if top is not None and top.viable is None and char not in _WHITESPACE:
+                # A JSON object can only continue with a key or be empty
+                top.viable = char == '"' or char == "}"
 
-        Args:
-            start_from (int): Position to start searching from
-        """
-        for i in range(start_from, len(self.buffer)):
-            if self.buffer[i] == "{" and not self._is_in_processed_range(i):
-                self.potential_jsons.append(i)
+            if char == "{":
+                self._open.append(_OpenObject(start=i))
+            elif char == "}" and top is not None:
+                self._open.pop()
+                self._close_object(top, i, new_jsons)
+            elif char == '"' and top is not None and top.viable:
+                # Only track strings inside objects, quotes in prose don't matter
+                self._in_string = True
 
-    def _is_in_processed_range(self, pos: int) -> bool:
-        """Check if a specified position is within a processed range.
+        self._scan_pos = len(buffer)
 
-        Args:
-            pos (int): Position to check
+        # Nothing before the scan position is needed once all objects closed
+        if not self._open:
+            self.buffer = ""
+            self._scan_pos = 0
 
-        Returns:
-            bool: True if position is within a processed range, otherwise False
-        """
-        for start, end in self.processed_ranges:
-            if start <= pos <= end:
-                return True
-        return False
+        self.completed_jsons.extend(new_jsons)
+        return new_jsons
 
-    def _try_parse_jsons(self) -> List[Dict[str, Any]]:
-        """Try to parse JSON objects from the current buffer.
+    def _close_object(
+        self, obj: _OpenObject, end: int, new_jsons: List[Dict[str, Any]]
+    ) -> None:
+        """Handle a closed object: parse it now, or hand it to its parent.
 
-        Returns:
-            List[Dict[str, Any]]: List of newly parsed JSON objects
+        Args:
+            obj (_OpenObject): The object that was just closed
+            end (int): Position of its closing `}`
+            new_jsons (List[Dict[str, Any]]): List to append parsed objects to
         """
-        new_jsons = []
-        remaining_potential = []
-
-        # Sort by starting position, process outermost JSON first
-        self.potential_jsons.sort()
-
-        for start_idx in self.potential_jsons:
-            # Skip if this position is already within a processed range
-            if self._is_in_processed_range(start_idx):
-                continue
-
-            result, end_idx = self._extract_json(start_idx)
+        parent = self._viable_parent()
+        if obj.viable is not False:
+            if parent is not None:
+                # The enclosing object may still parse and contain this one
+                parent.children.append((obj.start, end))
+                return
+            result = self._parse(obj.start, end)
             if result is not None:
                 new_jsons.append(result)
-                # Mark this range as processed
-                self.processed_ranges.append((start_idx, end_idx))
-                self.completed_jsons.append(result)
+                return
+
+        # Not a JSON object itself, so its children are candidates instead
+        for start, child_end in obj.children:
+            if parent is not None:
+                parent.children.append((start, child_end))
             else:
-                # This JSON may not be complete yet, keep it
-                remaining_potential.append(start_idx)
+                result = self._parse(start, child_end)
+                if result is not None:
+                    new_jsons.append(result)
 
-        self.potential_jsons = remaining_potential
-        return new_jsons
+    def _viable_parent(self) -> Optional[_OpenObject]:
+        """Get the nearest open object that may still be valid JSON."""
+        for obj in reversed(self._open):
+            if obj.viable is not False:
+                return obj
+        return None
 
-    def _extract_json(self, start_idx: int) -> Tuple[Optional[Dict[str, Any]], int]:
-        """Try to extract a complete JSON object from the given position.
+    def _parse(self, start: int, end: int) -> Optional[Dict[str, Any]]:
+        """Parse the buffer span [start, end] as a JSON object.
 
         Args:
-            start_idx (int): Potential starting position of JSON
+            start (int): Position of the opening `{`
+            end (int): Position of the closing `}`
 
         Returns:
-            Tuple[Optional[Dict[str, Any]], int]: Parsed JSON object and ending position,
-                                               or (None, -1) if incomplete
+            Optional[Dict[str, Any]]: Parsed JSON object, or None if invalid
         """
-        stack = 1
-        i = start_idx + 1
-
-        while i < len(self.buffer) and stack > 0:
-            if self.buffer[i] == "{":
-                stack += 1
-            elif self.buffer[i] == "}":
-                stack -= 1
-            i += 1
-
-        # If complete JSON is found
-        if stack == 0:
-            json_str = self.buffer[start_idx:i]
-            try:
-                json_data = json.loads(json_str)
-                return json_data, i - 1
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"JSON structure found but parsing failed: {json_str[:50]}..."
-                )
-
-        return None, -1
+        json_str = self.buffer[start : end + 1]
+        try:
+            return json.loads(json_str)
+        except json.JSONDecodeError:
+            logger.warning(
+                f"JSON structure found but parsing failed: {json_str[:50]}..."
+            )
+            return None
 
     def get_all_jsons(self) -> List[Dict[str, Any]]:
         """Get all JSON objects parsed so far.
@@ -131,9 +155,11 @@ class StreamJSONDetector:
     def reset(self) -> None:
         """Reset detector state, prepare to process a new stream."""
         self.buffer = ""
-        self.potential_jsons = []
         self.completed_jsons = []
-        self.processed_ranges = []
+        self._scan_pos = 0
+        self._open = []
+        self._in_string = False
+        self._escaped = False
 
 
 # Usage example
@@ -1,7 +1,10 @@
 """MCP Client for Open-LLM-Vtuber."""
 
-from contextlib import AsyncExitStack
-from typing import Dict, Any, List, Callable
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Callable, AsyncIterator, Optional, Set
 from loguru import logger
 from datetime import timedelta
 
@@ -12,11 +15,35 @@ from mcp.client.stdio import stdio_client
 from .server_registry import ServerRegistry
 
 DEFAULT_TIMEOUT = timedelta(seconds=30)
+DEFAULT_MAX_SESSIONS = 2
+
+
+@dataclass
+class _PooledSession:
+    """An initialized session and the task that owns its transport."""
+
+    session: ClientSession
+    task: asyncio.Task
+
+
+@dataclass
+class _SessionPool:
+    """Lazily grown pool of sessions for a single MCP server.
+
+    `size` counts the idle, borrowed and starting sessions. Every change to
+    it or to `idle` is made under `slots` and notifies one waiter.
+    """
+
+    max_size: int
+    size: int = 0
+    idle: deque = field(default_factory=deque)
+    slots: asyncio.Condition = field(default_factory=asyncio.Condition)
 
 
 class MCPClient:
     """MCP Client for Open-LLM-Vtuber.
-    Manages persistent connections to multiple MCP servers.
+    Manages a pool of persistent connections to each MCP server, so that
+    concurrent tool calls on the same server do not wait on a single session.
     """
 
     def __init__(
@@ -26,8 +53,9 @@ class MCPClient:
         client_uid: str = None,
     ) -> None:
         """Initialize the MCP Client."""
-        self.exit_stack: AsyncExitStack = AsyncExitStack()
-        self.active_sessions: Dict[str, ClientSession] = {}
+        self._pools: Dict[str, _SessionPool] = {}
+        self._session_tasks: Set[asyncio.Task] = set()
+        self._closing: asyncio.Event = asyncio.Event()
         self._list_tools_cache: Dict[str, List[Tool]] = {}  # Cache for list_tools
         self._send_text: Callable = send_text
         self._client_uid: str = client_uid
@@ -40,13 +68,34 @@ class MCPClient:
             )
         logger.info("MCPC: Initialized MCPClient instance.")
 
-    async def _ensure_server_running_and_get_session(
-        self, server_name: str
-    ) -> ClientSession:
-        """Gets the existing session or creates a new one."""
-        if server_name in self.active_sessions:
-            return self.active_sessions[server_name]
+    async def _run_session(
+        self,
+        server_name: str,
+        server_params: StdioServerParameters,
+        timeout: timedelta,
+        ready: asyncio.Future,
+    ) -> None:
+        """Own the transport of one session until the client is closed.
+
+        The stdio transport and the session are entered and exited in this task,
+        so they stay valid no matter which task borrows the session.
+        """
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(
+                    read, write, read_timeout_seconds=timeout
+                ) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCPC: Session for server '{server_name}' ended: {e}")
 
+    async def _start_session(self, server_name: str) -> _PooledSession:
+        """Start a new server process and return its initialized session."""
         logger.info(f"MCPC: Starting and connecting to server '{server_name}'...")
         server = self.server_registery.get_server(server_name)
         if not server:
@@ -60,26 +109,95 @@ class MCPClient:
             command=server.command, args=server.args, env=server.env, cwd=server.cwd
         )
 
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(
+            self._run_session(server_name, server_params, timeout, ready)
+        )
+        self._session_tasks.add(task)
+        task.add_done_callback(self._session_tasks.discard)
         try:
-            stdio_transport = await self.exit_stack.enter_async_context(
-                stdio_client(server_params)
-            )
-            read, write = stdio_transport
-
-            session = await self.exit_stack.enter_async_context(
-                ClientSession(read, write, read_timeout_seconds=timeout)
-            )
-            await session.initialize()
-
-            self.active_sessions[server_name] = session
-            logger.info(f"MCPC: Successfully connected to server '{server_name}'.")
-            return session
+            session = await ready
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
         except Exception as e:
             logger.exception(f"MCPC: Failed to connect to server '{server_name}': {e}")
             raise RuntimeError(
                 f"MCPC: Failed to connect to server '{server_name}'."
             ) from e
 
+        logger.info(f"MCPC: Successfully connected to server '{server_name}'.")
+        return _PooledSession(session=session, task=task)
+
+    def _get_pool(self, server_name: str) -> _SessionPool:
+        """Get the session pool of a server, creating it on first use."""
+        pool = self._pools.get(server_name)
+        if pool is None:
+            server = self.server_registery.get_server(server_name)
+            max_size = (
+                server.max_sessions
+                if server and server.max_sessions
+                else DEFAULT_MAX_SESSIONS
+            )
+            pool = _SessionPool(max_size=max(1, max_size))
+            self._pools[server_name] = pool
+        return pool
+
+    @asynccontextmanager
+    async def _acquire_session(self, server_name: str) -> AsyncIterator[ClientSession]:
+        """Borrow a session of a server, waiting if all of them are busy.
+
+        The pool size is the concurrency limit of the server. A new session is
+        only started when every existing one is busy.
+        """
+        pool = self._get_pool(server_name)
+        async with pool.slots:
+            while True:
+                pooled = self._take_idle(pool)
+                if pooled is not None:
+                    break
+                if pool.size < pool.max_size:
+                    # Reserve the slot now, the session is started unlocked
+                    pool.size += 1
+                    break
+                await pool.slots.wait()
+
+        if pooled is None:
+            try:
+                pooled = await self._start_session(server_name)
+            except BaseException:
+                await self._release_slot(pool, None)
+                raise
+
+        try:
+            yield pooled.session
+        finally:
+            await self._release_slot(pool, pooled)
+
+    @staticmethod
+    def _take_idle(pool: _SessionPool) -> Optional[_PooledSession]:
+        """Pop a live idle session, freeing the slots of dead ones."""
+        while pool.idle:
+            pooled = pool.idle.popleft()
+            if not pooled.task.done():
+                return pooled
+            # The server process died while idle
+            pool.size -= 1
+        return None
+
+    async def _release_slot(
+        self, pool: _SessionPool, pooled: Optional[_PooledSession]
+    ) -> None:
+        """Give a borrowed session back, or free its slot, and wake a waiter."""
+        async with pool.slots:
+            if pooled is None or pooled.task.done():
+                # Failed to start or the server process is gone, let the
+                # next borrower start a new one
+                pool.size -= 1
+            else:
+                pool.idle.append(pooled)
+            pool.slots.notify()
+
     async def list_tools(self, server_name: str) -> List[Tool]:
         """List all available tools on the specified server."""
         # Check cache first
@@ -90,8 +208,8 @@ class MCPClient:
         logger.debug(
             f"MCPC: Cache miss for list_tools on server '{server_name}'. Fetching..."
         )
-        session = await self._ensure_server_running_and_get_session(server_name)
-        response = await session.list_tools()
+        async with self._acquire_session(server_name) as session:
+            response = await session.list_tools()
 
         # Store in cache before returning
         self._list_tools_cache[server_name] = response.tools
@@ -106,9 +224,11 @@ class MCPClient:
         Returns:
             Dict containing the metadata and content_items from the tool response.
         """
-        session = await self._ensure_server_running_and_get_session(server_name)
-        logger.info(f"MCPC: Calling tool '{tool_name}' on server '{server_name}'...")
-        response = await session.call_tool(tool_name, tool_args)
+        async with self._acquire_session(server_name) as session:
+            logger.info(
+                f"MCPC: Calling tool '{tool_name}' on server '{server_name}'..."
+            )
+            response = await session.call_tool(tool_name, tool_args)
 
         if response.isError:
             error_text = (
@@ -154,15 +274,22 @@ class MCPClient:
         }
         return result
 
+    def clear_tools_cache(self) -> None:
+        """Forget the cached list_tools results, keeping the sessions open."""
+        self._list_tools_cache.clear()
+
     async def aclose(self) -> None:
         """Closes all active server connections."""
         logger.info(
-            f"MCPC: Closing client instance and {len(self.active_sessions)} active connections..."
+            f"MCPC: Closing client instance and {len(self._session_tasks)} active connections..."
         )
-        await self.exit_stack.aclose()
-        self.active_sessions.clear()
+        self._closing.set()
+        if self._session_tasks:
+            await asyncio.gather(*list(self._session_tasks), return_exceptions=True)
+        self._session_tasks.clear()
+        self._pools.clear()
         self._list_tools_cache.clear()  # Clear cache on close
-        self.exit_stack = AsyncExitStack()
+        self._closing = asyncio.Event()
         logger.info("MCPC: Client instance closed.")
 
     async def __aenter__(self) -> "MCPClient":
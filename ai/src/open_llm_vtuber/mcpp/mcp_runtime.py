@@ -0,0 +1,182 @@
+"""Process-level MCP runtime shared by all client sessions."""
+
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar, Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+from .types import FormattedTool
+from .mcp_client import MCPClient
+from .server_registry import ServerRegistry, DEFAULT_CONFIG_PATH
+from .tool_adapter import ToolAdapter
+from .tool_manager import ToolManager
+
+
+@dataclass
+class MCPToolset:
+    """Tool listings and formatted schemas for one list of enabled servers.
+
+    Args:
+        mcp_prompt (str): Prompt string describing the servers and their tools.
+        tool_manager (ToolManager): Tool manager holding the formatted tools.
+        tools (dict[str, FormattedTool]): Raw tool information by tool name.
+        mcp_client (MCPClient, optional): The client the tools were listed with.
+    """
+
+    mcp_prompt: str
+    tool_manager: ToolManager
+    tools: Dict[str, FormattedTool] = field(default_factory=dict)
+    mcp_client: Optional[MCPClient] = None
+
+
+class MCPRuntime:
+    """Starts each MCP server once per process and caches its tools.
+
+    All sessions share one MCPClient, so server processes are pooled per
+    server instead of per client. Tool listings and the OpenAI/Claude schemas
+    are cached per list of enabled servers, and dropped when the server config
+    file changes or `invalidate()` is called.
+
+    Every toolset returned by `get_toolset()` leases its client until it is
+    given back with `release_client()`. When the config file changes a new
+    client is swapped in, and the old one is closed once its last lease ends.
+    """
+
+    _instance: ClassVar[Optional["MCPRuntime"]] = None
+
+    def __init__(self, config_path: str | Path = DEFAULT_CONFIG_PATH) -> None:
+        self._config_path = Path(config_path)
+        self._config_mtime: Optional[float] = None
+        self._toolsets: Dict[Tuple[str, ...], MCPToolset] = {}
+        self._lock = asyncio.Lock()
+        # Leases by client, and the replaced clients still leased
+        self._leases: Dict[MCPClient, int] = {}
+        self._retired: Set[MCPClient] = set()
+
+        self.server_registery: ServerRegistry | None = None
+        self.mcp_client: MCPClient | None = None
+        self.tool_adapter: ToolAdapter | None = None
+
+    @classmethod
+    def get_instance(cls) -> "MCPRuntime":
+        """Get the runtime of this process, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _read_config_mtime(self) -> Optional[float]:
+        try:
+            return self._config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    async def _reload(self) -> None:
+        """(Re)load the server registry and swap in a new shared client."""
+        if self.mcp_client:
+            await self._retire(self.mcp_client)
+
+        self._toolsets.clear()
+        self._config_mtime = self._read_config_mtime()
+        self.server_registery = ServerRegistry(self._config_path)
+        self.mcp_client = MCPClient(self.server_registery)
+        self.tool_adapter = ToolAdapter(
+            server_registery=self.server_registery, mcp_client=self.mcp_client
+        )
+        logger.info(
+            f"MCPRT: Loaded {len(self.server_registery.servers)} MCP server(s) from '{self._config_path}'."
+        )
+
+    async def _retire(self, client: MCPClient) -> None:
+        """Close a replaced client now, or when its last lease is released."""
+        if self._leases.get(client):
+            self._retired.add(client)
+        else:
+            await client.aclose()
+
+    async def get_toolset(self, enabled_servers: List[str]) -> MCPToolset:
+        """Get the cached toolset of the enabled servers, building it on a miss.
+
+        The toolset's client is leased to the caller, who must give it back
+        with `release_client()` when done with it.
+        """
+        async with self._lock:
+            toolset = await self._get_toolset(enabled_servers)
+            self._leases[toolset.mcp_client] = (
+                self._leases.get(toolset.mcp_client, 0) + 1
+            )
+            return toolset
+
+    async def release_client(self, client: MCPClient) -> None:
+        """End a lease taken by `get_toolset()`, closing a replaced client last."""
+        async with self._lock:
+            leases = self._leases.get(client, 0) - 1
+            if leases > 0:
+                self._leases[client] = leases
+                return
+            self._leases.pop(client, None)
+            if client in self._retired:
+                self._retired.discard(client)
+                await client.aclose()
+
+    async def _get_toolset(self, enabled_servers: List[str]) -> MCPToolset:
+        """Get or build the toolset, with the lock held."""
+        if (
+            self.server_registery is None
+            or self._read_config_mtime() != self._config_mtime
+        ):
+            await self._reload()
+
+        key = tuple(enabled_servers)
+        toolset = self._toolsets.get(key)
+        if toolset is not None:
+            logger.debug(f"MCPRT: Cache hit for toolset of servers {list(key)}.")
+            return toolset
+
+        (
+            servers_info,
+            formatted_tools_dict,
+        ) = await self.tool_adapter.get_server_and_tool_info(enabled_servers)
+        openai_tools, claude_tools = self.tool_adapter.format_tools_for_api(
+            formatted_tools_dict
+        )
+        toolset = MCPToolset(
+            mcp_prompt=self.tool_adapter.construct_mcp_prompt_string(servers_info),
+            tool_manager=ToolManager(
+                formatted_tools_openai=openai_tools,
+                formatted_tools_claude=claude_tools,
+                initial_tools_dict=formatted_tools_dict,
+            ),
+            tools=formatted_tools_dict,
+            mcp_client=self.mcp_client,
+        )
+
+        # Don't cache a toolset with servers that failed to list their tools
+        if all(servers_info.get(name) for name in servers_info):
+            self._toolsets[key] = toolset
+        else:
+            logger.warning(
+                "MCPRT: Some servers returned no tools, toolset will not be cached."
+            )
+        return toolset
+
+    def invalidate(self) -> None:
+        """Drop the cached toolsets so they are fetched again on next use."""
+        self._toolsets.clear()
+        if self.mcp_client:
+            self.mcp_client.clear_tools_cache()
+        logger.info("MCPRT: Toolset cache invalidated.")
+
+    async def aclose(self) -> None:
+        """Stop all server processes and clear the caches."""
+        if self.mcp_client:
+            await self.mcp_client.aclose()
+        for client in self._retired:
+            await client.aclose()
+        self._toolsets.clear()
+        self._leases.clear()
+        self._retired.clear()
+        self.server_registery = None
+        self.mcp_client = None
+        self.tool_adapter = None
+        logger.info("MCPRT: Runtime closed.")
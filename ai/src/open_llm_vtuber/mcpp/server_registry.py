@@ -87,6 +87,7 @@ class ServerRegistry:
                 env=server_details.get("env", None),
                 cwd=server_details.get("cwd", None),
                 timeout=server_details.get("timeout", None),
+                max_sessions=server_details.get("max_sessions", None),
             )
             logger.debug(f"MCPSR: Loaded server: '{server_name}'.")
 
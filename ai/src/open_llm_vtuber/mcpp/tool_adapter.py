@@ -11,9 +11,18 @@ from .server_registry import ServerRegistry
 class ToolAdapter:
     """Dynamically fetches tool information from enabled MCP servers and formats it."""
 
-    def __init__(self, server_registery: Optional[ServerRegistry] = None) -> None:
-        """Initialize with an ServerRegistry."""
+    def __init__(
+        self,
+        server_registery: Optional[ServerRegistry] = None,
+        mcp_client: Optional[MCPClient] = None,
+    ) -> None:
+        """Initialize with an ServerRegistry.
+
+        If an MCPClient is given, tools are listed through its running servers
+        instead of starting a temporary client for every fetch.
+        """
         self.server_registery = server_registery or ServerRegistry()
+        self._mcp_client = mcp_client
 
     async def get_server_and_tool_info(
         self, enabled_servers: List[str]
@@ -30,58 +39,67 @@ class ToolAdapter:
 
         logger.debug(f"MC: Fetching tool info for enabled servers: {enabled_servers}")
 
-        # Use a single client instance for efficiency
-        async with MCPClient(self.server_registery) as client:
-            for server_name in enabled_servers:
-                if server_name not in self.server_registery.servers:
-                    logger.warning(
-                        f"MC: Enabled server '{server_name}' not found in Server Manager. Skipping."
-                    )
-                    continue
-
-                try:
-                    servers_info[server_name] = {}
-                    tools = await client.list_tools(server_name)
-                    logger.debug(
-                        f"MC: Found {len(tools)} tools on server '{server_name}'"
-                    )
-                    for tool in tools:
-                        servers_info[server_name][tool.name] = {}
-                        tool_info = servers_info[server_name][tool.name]
-                        tool_info["description"] = tool.description
-                        tool_info["parameters"] = tool.inputSchema.get("properties", {})
-                        tool_info["required"] = tool.inputSchema.get("required", [])
-
-                        # Store the tool info in FormattedTool format
-                        formatted_tools[tool.name] = FormattedTool(
-                            input_schema=tool.inputSchema,
-                            related_server=server_name,
-                            description=tool.description,
-                            # Generic schema will be generated later if needed
-                            generic_schema=None,
-                        )
-                except (ValueError, RuntimeError, ConnectionError) as e:
-                    logger.error(
-                        f"MC: Failed to get info for server '{server_name}': {e}"
-                    )
-                    if (
-                        server_name not in servers_info
-                    ):  # Ensure entry exists even on error
-                        servers_info[server_name] = {}
-                    continue  # Continue to next server
-                except Exception as e:
-                    logger.error(
-                        f"MC: Unexpected error for server '{server_name}': {e}"
-                    )
-                    if server_name not in servers_info:
-                        servers_info[server_name] = {}
-                    continue  # Continue to next server
+        if self._mcp_client:
+            await self._collect_server_and_tool_info(
+                self._mcp_client, enabled_servers, servers_info, formatted_tools
+            )
+        else:
+            # Use a single client instance for efficiency
+            async with MCPClient(self.server_registery) as client:
+                await self._collect_server_and_tool_info(
+                    client, enabled_servers, servers_info, formatted_tools
+                )
 
         logger.debug(
             f"MC: Finished fetching tool info. Found {len(formatted_tools)} tools across enabled servers."
         )
         return servers_info, formatted_tools
 
+    async def _collect_server_and_tool_info(
+        self,
+        client: MCPClient,
+        enabled_servers: List[str],
+        servers_info: Dict[str, Dict[str, str]],
+        formatted_tools: Dict[str, FormattedTool],
+    ) -> None:
+        """List the tools of each enabled server and record them in place."""
+        for server_name in enabled_servers:
+            if server_name not in self.server_registery.servers:
+                logger.warning(
+                    f"MC: Enabled server '{server_name}' not found in Server Manager. Skipping."
+                )
+                continue
+
+            try:
+                servers_info[server_name] = {}
+                tools = await client.list_tools(server_name)
+                logger.debug(f"MC: Found {len(tools)} tools on server '{server_name}'")
+                for tool in tools:
+                    servers_info[server_name][tool.name] = {}
+                    tool_info = servers_info[server_name][tool.name]
+                    tool_info["description"] = tool.description
+                    tool_info["parameters"] = tool.inputSchema.get("properties", {})
+                    tool_info["required"] = tool.inputSchema.get("required", [])
+
+                    # Store the tool info in FormattedTool format
+                    formatted_tools[tool.name] = FormattedTool(
+                        input_schema=tool.inputSchema,
+                        related_server=server_name,
+                        description=tool.description,
+                        # Generic schema will be generated later if needed
+                        generic_schema=None,
+                    )
+            except (ValueError, RuntimeError, ConnectionError) as e:
+                logger.error(f"MC: Failed to get info for server '{server_name}': {e}")
+                if server_name not in servers_info:  # Ensure entry exists even on error
+                    servers_info[server_name] = {}
+                continue  # Continue to next server
+            except Exception as e:
+                logger.error(f"MC: Unexpected error for server '{server_name}': {e}")
+                if server_name not in servers_info:
+                    servers_info[server_name] = {}
+                continue  # Continue to next server
+
     def construct_mcp_prompt_string(
         self, servers_info: Dict[str, Dict[str, str]]
     ) -> str:
@@ -1,4 +1,5 @@
 import json
+import asyncio
 import datetime
 from loguru import logger
 from typing import (
@@ -14,15 +15,19 @@ from .types import ToolCallObject
 from .mcp_client import MCPClient
 from .tool_manager import ToolManager
 
+DEFAULT_TOOL_TIMEOUT = 60.0
+
 
 class ToolExecutor:
     def __init__(
         self,
         mcp_client: MCPClient,
         tool_manager: ToolManager,
+        tool_timeout: float | None = DEFAULT_TOOL_TIMEOUT,
     ):
         self._mcp_client = mcp_client
         self._tool_manager = tool_manager
+        self._tool_timeout = tool_timeout
 
     def parse_tool_call(self, call: Union[Dict[str, Any], ToolCallObject]) -> tuple:
         """Parse tool call from different formats.
@@ -152,154 +157,205 @@ class ToolExecutor:
                 logger.warning("Skipping invalid tool structure in prompt mode JSON")
         return parsed_tools
 
+    def _build_tool_outputs(
+        self,
+        caller_mode: Literal["Claude", "OpenAI", "Prompt"],
+        tool_name: str,
+        tool_id: str,
+        result: tuple[bool, str, Dict[str, Any], List[Dict[str, Any]]],
+    ) -> tuple[Dict[str, Any], Dict[str, Any] | None]:
+        """Build the status update and the LLM result of a finished tool call.
+
+        Returns:
+            tuple: (status_update, formatted_result)
+        """
+        is_error, text_content, metadata, content_items = result
+
+        # Determine content for status update and LLM result format
+        status_content = text_content  # Default to text content
+        llm_formatted_content = text_content  # Default to text content for LLM
+
+        if content_items:
+            image_items = [
+                item for item in content_items if item.get("type") == "image"
+            ]
+            if image_items:
+                num_images = len(image_items)
+                status_content = (
+                    f"{text_content}\n[Tool returned {num_images} image(s)]".strip()
+                )
+
+                if caller_mode == "Claude":
+                    # Format for Claude: list of blocks
+                    claude_blocks = []
+                    if text_content:
+                        claude_blocks.append({"type": "text", "text": text_content})
+                    for item in content_items:
+                        if (
+                            item.get("type") == "image"
+                            and "data" in item
+                            and "mimeType" in item
+                        ):
+                            claude_blocks.append(
+                                {
+                                    "type": "image",
+                                    "source": {
+                                        "type": "base64",
+                                        "media_type": item["mimeType"],
+                                        "data": item["data"],
+                                    },
+                                }
+                            )
+                        # Add other non-text types here
+                    llm_formatted_content = (
+                        claude_blocks if claude_blocks else ""
+                    )  # Use blocks or empty string
+                elif caller_mode in ["OpenAI", "Prompt"]:
+                    llm_formatted_content = status_content
+
+        # Prepare tool call status update
+        status_update = {
+            "type": "tool_call_status",
+            "tool_id": tool_id,
+            "tool_name": tool_name,
+            "status": "error" if is_error else "completed",
+            "content": status_content
+            if not is_error
+            else f"Error: {text_content}",  # Use descriptive content or error message
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat() + "Z",
+        }
+
+        # For stagehand_navigate tool, include browser view links if available
+        if tool_name == "stagehand_navigate" and not is_error:
+            live_view_data = metadata.get("liveViewData", {})
+            if live_view_data:
+                logger.info(
+                    f"Found live view data for stagehand_navigate: {live_view_data}"
+                )
+                status_update["browser_view"] = live_view_data
+
+        formatted_result = self.format_tool_result(
+            caller_mode, tool_id, llm_formatted_content, is_error
+        )
+        return status_update, formatted_result
+
     async def execute_tools(
         self,
         tool_calls: Union[List[Dict[str, Any]], List[ToolCallObject]],
         caller_mode: Literal["Claude", "OpenAI", "Prompt"],
     ) -> AsyncIterator[Dict[str, Any]]:
-        """Execute tools and yield status updates."""
-        tool_results_for_llm = []
+        """Execute tools concurrently and yield status updates.
+
+        All tool calls of one LLM turn are started at once; the MCPClient session
+        pools limit how many of them run on the same server. Status updates are
+        yielded as calls finish, while the final results keep the call order.
+        Cancelling the consumer (e.g. a user interrupt) cancels pending calls.
+        """
+        tool_results_for_llm: List[Dict[str, Any] | None] = [None] * len(tool_calls)
+        pending: Dict[asyncio.Task, tuple[int, str, str]] = {}
 
         logger.info(f"Executing {len(tool_calls)} tool(s) for {caller_mode} caller.")
-        for call in tool_calls:
-            (
-                tool_name,
-                tool_id,
-                tool_input,
-                is_error,
-                result_content,
-                parse_error,
-            ) = self.parse_tool_call(call)
-
-            logger.info(f"Executing tool: {call}")
-
-            if parse_error:
-                logger.warning(
-                    f"Skipping tool call due to parsing error: {result_content}"
-                )
-                status_update = {
+        try:
+            for index, call in enumerate(tool_calls):
+                (
+                    tool_name,
+                    tool_id,
+                    tool_input,
+                    is_error,
+                    result_content,
+                    parse_error,
+                ) = self.parse_tool_call(call)
+
+                logger.info(f"Executing tool: {call}")
+
+                if parse_error:
+                    logger.warning(
+                        f"Skipping tool call due to parsing error: {result_content}"
+                    )
+                    tool_id = (
+                        tool_id
+                        or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}"
+                    )
+                    yield {
+                        "type": "tool_call_status",
+                        "tool_id": tool_id,
+                        "tool_name": tool_name or "Unknown Tool",
+                        "status": "error",
+                        "content": result_content,
+                        "timestamp": datetime.datetime.now(
+                            datetime.timezone.utc
+                        ).isoformat()
+                        + "Z",
+                    }
+                    # Even on parse error, we might need to format a result for the LLM
+                    tool_results_for_llm[index] = self.format_tool_result(
+                        caller_mode,
+                        tool_id,
+                        result_content,
+                        True,  # is_error
+                    )
+                    continue  # Skip execution logic for this call
+
+                # Yield 'running' status before execution
+                yield {
                     "type": "tool_call_status",
-                    "tool_id": tool_id
-                    or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
-                    "tool_name": tool_name or "Unknown Tool",
-                    "status": "error",
-                    "content": result_content,
+                    "tool_id": tool_id,
+                    "tool_name": tool_name,
+                    "status": "running",
+                    "content": f"Input: {json.dumps(tool_input)}",
                     "timestamp": datetime.datetime.now(
                         datetime.timezone.utc
                     ).isoformat()
                     + "Z",
                 }
-                yield status_update
-                # Even on parse error, we might need to format a result for the LLM
-                # Use dummy values or the error message
-                formatted_result = self.format_tool_result(
-                    caller_mode,
-                    tool_id
-                    or f"parse_error_{datetime.datetime.now(datetime.timezone.utc).isoformat()}",
-                    result_content,
-                    True,  # is_error
-                )
-                if formatted_result:
-                    tool_results_for_llm.append(formatted_result)
-                continue  # Skip execution logic for this call
-
-            # Yield 'running' status before execution
-            yield {
-                "type": "tool_call_status",
-                "tool_id": tool_id,
-                "tool_name": tool_name,
-                "status": "running",
-                "content": f"Input: {json.dumps(tool_input)}",
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                + "Z",
-            }
 
-            # Execute the tool
-            (
-                is_error,
-                text_content,
-                metadata,
-                content_items,
-            ) = await self.run_single_tool(tool_name, tool_id, tool_input)
-
-            # Determine content for status update and LLM result format
-            status_content = text_content  # Default to text content
-            llm_formatted_content = text_content  # Default to text content for LLM
-
-            if content_items:
-                image_items = [
-                    item for item in content_items if item.get("type") == "image"
-                ]
-                if image_items:
-                    num_images = len(image_items)
-                    status_content = (
-                        f"{text_content}\n[Tool returned {num_images} image(s)]".strip()
-                    )
-
-                    if caller_mode == "Claude":
-                        # Format for Claude: list of blocks
-                        claude_blocks = []
-                        if text_content:
-                            claude_blocks.append({"type": "text", "text": text_content})
-                        for item in content_items:
-                            if (
-                                item.get("type") == "image"
-                                and "data" in item
-                                and "mimeType" in item
-                            ):
-                                claude_blocks.append(
-                                    {
-                                        "type": "image",
-                                        "source": {
-                                            "type": "base64",
-                                            "media_type": item["mimeType"],
-                                            "data": item["data"],
-                                        },
-                                    }
-                                )
-                            # Add other non-text types here
-                        llm_formatted_content = (
-                            claude_blocks if claude_blocks else ""
-                        )  # Use blocks or empty string
-                    elif caller_mode in ["OpenAI", "Prompt"]:
-                        llm_formatted_content = status_content
-
-            # Prepare and yield tool call status update
-            status_update = {
-                "type": "tool_call_status",
-                "tool_id": tool_id,
-                "tool_name": tool_name,
-                "status": "error" if is_error else "completed",
-                "content": status_content
-                if not is_error
-                else f"Error: {text_content}",  # Use descriptive content or error message
-                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
-                + "Z",
-            }
+                task = asyncio.create_task(
+                    self._run_tool_with_timeout(tool_name, tool_id, tool_input)
+                )
+                pending[task] = (index, tool_name, tool_id)
 
-            # For stagehand_navigate tool, include browser view links if available
-            if tool_name == "stagehand_navigate" and not is_error:
-                live_view_data = metadata.get("liveViewData", {})
-                if live_view_data:
-                    logger.info(
-                        f"Found live view data for stagehand_navigate: {live_view_data}"
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    index, tool_name, tool_id = pending.pop(task)
+                    status_update, formatted_result = self._build_tool_outputs(
+                        caller_mode, tool_name, tool_id, task.result()
                     )
-                    status_update["browser_view"] = live_view_data
-
-            yield status_update
-
-            # Format result for LLM and add to list
-            formatted_result = self.format_tool_result(
-                caller_mode, tool_id, llm_formatted_content, is_error
-            )
-            if formatted_result:
-                tool_results_for_llm.append(formatted_result)
-
+                    yield status_update
+                    tool_results_for_llm[index] = formatted_result
+        finally:
+            if pending:
+                logger.info(f"Cancelling {len(pending)} unfinished tool call(s).")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending.keys(), return_exceptions=True)
+
+        tool_results_for_llm = [
+            result for result in tool_results_for_llm if result is not None
+        ]
         logger.info(
             f"Finished executing tools with {len(tool_results_for_llm)} results."
         )
         yield {"type": "final_tool_results", "results": tool_results_for_llm}
 
+    async def _run_tool_with_timeout(
+        self, tool_name: str, tool_id: str, tool_input: Any
+    ) -> tuple[bool, str, Dict[str, Any], List[Dict[str, Any]]]:
+        """Run a single tool, turning a timeout into an error result."""
+        try:
+            return await asyncio.wait_for(
+                self.run_single_tool(tool_name, tool_id, tool_input),
+                timeout=self._tool_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Tool '{tool_name}' (ID: {tool_id}) timed out after {self._tool_timeout}s."
+            )
+            text_content = f"Tool '{tool_name}' timed out after {self._tool_timeout}s."
+            return True, text_content, {}, [{"type": "error", "text": text_content}]
+
     async def run_single_tool(
         self, tool_name: str, tool_id: str, tool_input: Any
     ) -> tuple[bool, str, Dict[str, Any], List[Dict[str, Any]]]:
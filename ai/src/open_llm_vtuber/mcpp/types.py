@@ -14,6 +14,7 @@ class MCPServer:
         env (Optional[dict[str, str]], optional): Environment variables for the command. Defaults to None.
         cwd (Optional[str], optional): Working directory for the command. Defaults to None.
         timeout (Optional[timedelta], optional): Timeout for the command. Defaults to 10 seconds.
+        max_sessions (Optional[int], optional): Maximum number of concurrent sessions (server processes) per client. Defaults to None, which uses the client default.
     """
 
     name: str
@@ -23,6 +24,7 @@ class MCPServer:
     cwd: str | None = None
     timeout: Optional[timedelta] = timedelta(seconds=30)
     description: str = "No description available."
+    max_sessions: Optional[int] = None
 
 
 @dataclass
@@ -1,7 +1,5 @@
 import os
-import asyncio
 import json
-import subprocess
 import tempfile
 import shutil
 from pathlib import Path
@@ -15,6 +13,10 @@ from loguru import logger
 from .service_context import ServiceContext
 from .websocket_handler import WebSocketHandler
 from .proxy_handler import ProxyHandler
+from .agent.rag.jd_crawler import JDCrawler, JDCrawlError
+from .workers import new_client_uid
+from .utils.turn_trace import TurnTracer
+from .utils.lazy_engine import resolve_engine
 
 
 def init_client_ws_route(default_context_cache: ServiceContext, config=None) -> APIRouter:
@@ -34,12 +36,17 @@ def init_client_ws_route(default_context_cache: ServiceContext, config=None) ->
 
     @router.websocket("/client-ws")
     async def websocket_endpoint(websocket: WebSocket):
-        """WebSocket endpoint for client connections"""
+        """WebSocket endpoint for client connections
+
+        Clients can ask for a compact outbound format with `?wire=msgpack`.
+        """
         await websocket.accept()
-        client_uid = str(uuid4())
+        client_uid = new_client_uid()
 
         try:
-            await ws_handler.handle_new_connection(websocket, client_uid)
+            await ws_handler.handle_new_connection(
+                websocket, client_uid, websocket.query_params.get("wire")
+            )
             await ws_handler.handle_websocket_communication(websocket, client_uid)
         except WebSocketDisconnect:
             await ws_handler.handle_disconnect(client_uid)
@@ -181,9 +188,8 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
             if len(audio_array) == 0:
                 raise ValueError("Empty audio data")
 
-            text = await default_context_cache.asr_engine.async_transcribe_np(
-                audio_array
-            )
+            asr_engine = await resolve_engine(default_context_cache.asr_engine)
+            text = await asr_engine.async_transcribe_np(audio_array)
             logger.info(f"Transcription result: {text}")
             return {"text": text}
 
@@ -223,14 +229,13 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                 sentences = [s.strip() for s in text.split(".") if s.strip()]
 
                 try:
+                    tts_engine = await resolve_engine(default_context_cache.tts_engine)
                     # Generate and send audio for each sentence
                     for sentence in sentences:
                         sentence = sentence + "."  # Add back the period
                         file_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid4())[:8]}"
-                        audio_path = (
-                            await default_context_cache.tts_engine.async_generate_audio(
-                                text=sentence, file_name_no_ext=file_name
-                            )
+                        audio_path = await tts_engine.async_generate_audio(
+                            text=sentence, file_name_no_ext=file_name
                         )
                         logger.info(
                             f"Generated audio for sentence: {sentence} at: {audio_path}"
@@ -314,45 +319,24 @@ def init_analysis_routes(service_context: ServiceContext) -> APIRouter:
         logger.info(f"Received JD analysis request for: {url}")
 
         try:
-            # 1. Call Crawler Service (CLI)
-            # Path to crawler/cli_jd.py relative to this file
-            # ai/src/open_llm_vtuber/routes.py -> ../../../crawler/cli_jd.py
-            base_dir = Path(__file__).parent.parent.parent.parent # ai/
-            crawler_script = base_dir / "crawler" / "cli_jd.py"
-
-            if not crawler_script.exists():
-                 # Fallback/Debug path check
-                 logger.error(f"Crawler script not found at: {crawler_script}")
-                 # Try hardcoded assumption if relative path failed
-                 crawler_script = Path("/Users/junghwan/Desktop/StackLoad_Demo/crawler/cli_jd.py")
-
-            # Run subprocess using system python for simplicity as proof of concept
-            # Assuming 'python' is in path
-            cmd = ["python", str(crawler_script), url]
-            logger.info(f"Running crawler command: {' '.join(cmd)}")
-
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                logger.error(f"Crawler failed: {stderr.decode()}")
-                raise HTTPException(status_code=500, detail=f"Crawler failed: {stderr.decode()}")
-
-            jd_text = stdout.decode().strip()
+            # 1. Crawl the JD page in-process (pooled client, cached by URL)
+            try:
+                jd_text = await JDCrawler.get_instance().crawl(url)
+            except JDCrawlError as e:
+                raise HTTPException(status_code=502, detail=str(e))
             logger.info(f"Crawler returned {len(jd_text)} chars")
 
             # 2. Analyze using JDAnalyzer
             if not service_context.jd_analyzer:
                  raise HTTPException(status_code=500, detail="JD Analyzer not initialized")
 
-            analysis_result = await service_context.jd_analyzer.analyze(jd_text)
+            jd_analyzer = await resolve_engine(service_context.jd_analyzer)
+            analysis_result = await jd_analyzer.analyze(jd_text)
 
             return JSONResponse(analysis_result)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error processing JD: {e}")
             raise HTTPException(status_code=500, detail=str(e))
@@ -384,3 +368,19 @@ def init_report_routes(service_context: ServiceContext) -> APIRouter:
         return JSONResponse(report)
 
     return router
+
+
+def init_metrics_routes() -> APIRouter:
+    """
+    Create the route exposing the turn latency histograms to Prometheus.
+    """
+    router = APIRouter()
+
+    @router.get("/metrics")
+    async def get_metrics():
+        return Response(
+            TurnTracer.get_instance().render_metrics(),
+            media_type="text/plain; version=0.0.4",
+        )
+
+    return router
@@ -1,6 +1,7 @@
 import os
 import json
-from typing import Callable
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable
 from loguru import logger
 from fastapi import WebSocket
 
@@ -13,13 +14,10 @@ from .vad.vad_interface import VADInterface
 from .agent.agents.agent_interface import AgentInterface
 from .translate.translate_interface import TranslateInterface
 from .interview.interview_manager import InterviewManager
-from .agent.rag.jd_analyzer import JDAnalyzer
+from .utils.lazy_engine import LazyEngine
 
-from .mcpp.server_registry import ServerRegistry
-from .mcpp.tool_manager import ToolManager
-from .mcpp.mcp_client import MCPClient
 from .mcpp.tool_executor import ToolExecutor
-from .mcpp.tool_adapter import ToolAdapter
+from .mcpp.mcp_runtime import MCPRuntime
 
 from .asr.asr_factory import ASRFactory
 from .tts.tts_factory import TTSFactory
@@ -40,6 +38,14 @@ from .config_manager import (
     validate_config,
 )
 
+if TYPE_CHECKING:
+    # Imports langchain and the Google SDK, loaded on first use
+    from .agent.rag.jd_analyzer import JDAnalyzer
+    from .mcpp.server_registry import ServerRegistry
+    from .mcpp.tool_manager import ToolManager
+    from .mcpp.mcp_client import MCPClient
+    from .mcpp.tool_adapter import ToolAdapter
+
 
 class ServiceContext:
     """Initializes, stores, and updates the asr, tts, and llm instances and other
@@ -58,10 +64,10 @@ class ServiceContext:
         self.vad_engine: VADInterface | None = None
         self.translate_engine: TranslateInterface | None = None
 
-        self.mcp_server_registery: ServerRegistry | None = None
-        self.tool_adapter: ToolAdapter | None = None
-        self.tool_manager: ToolManager | None = None
-        self.mcp_client: MCPClient | None = None
+        self.mcp_server_registery: "ServerRegistry | None" = None
+        self.tool_adapter: "ToolAdapter | None" = None
+        self.tool_manager: "ToolManager | None" = None
+        self.mcp_client: "MCPClient | None" = None
         self.tool_executor: ToolExecutor | None = None
 
         # the system prompt is a combination of the persona prompt and live2d expression prompt
@@ -76,7 +82,7 @@ class ServiceContext:
         self.client_uid: str = None
         self.client_uid: str = None
         self.interview_manager: InterviewManager | None = None
-        self.jd_analyzer: JDAnalyzer | None = None
+        self.jd_analyzer: "JDAnalyzer | None" = None
 
     def __str__(self):
         return (
@@ -99,12 +105,18 @@ class ServiceContext:
     # ==== Initializers
 
     async def _init_mcp_components(self, use_mcpp, enabled_servers):
-        """Initializes MCP components based on configuration, dynamically fetching tool info."""
+        """Initializes MCP components based on configuration.
+
+        Server processes, tool listings and formatted schemas come from the
+        process-level MCPRuntime, so only the ToolExecutor is created per session.
+        The session leases the runtime's client until it is closed or re-initialized.
+        """
         logger.debug(
             f"Initializing MCP components: use_mcpp={use_mcpp}, enabled_servers={enabled_servers}"
         )
 
-        # Reset MCP components first
+        # Reset MCP components first, ending the lease on the shared client
+        await self._release_mcp_client()
         self.mcp_server_registery = None
         self.tool_manager = None
         self.mcp_client = None
@@ -113,76 +125,28 @@ class ServiceContext:
         self.mcp_prompt = ""
 
         if use_mcpp and enabled_servers:
-            # 1. Initialize ServerRegistry
-            self.mcp_server_registery = ServerRegistry()
-            logger.info("ServerRegistry initialized or referenced.")
-
-            # 2. Use ToolAdapter to get the MCP prompt and tools
-            if not self.tool_adapter:
-                logger.error(
-                    "ToolAdapter not initialized before calling _init_mcp_components."
-                )
-                self.mcp_prompt = "[Error: ToolAdapter not initialized]"
-                return  # Exit if ToolAdapter is mandatory and not initialized
-
+            mcp_runtime = MCPRuntime.get_instance()
             try:
-                (
-                    mcp_prompt_string,
-                    openai_tools,
-                    claude_tools,
-                ) = await self.tool_adapter.get_tools(enabled_servers)
-                # Store the generated prompt string
-                self.mcp_prompt = mcp_prompt_string
-                logger.info(
-                    f"Dynamically generated MCP prompt string (length: {len(self.mcp_prompt)})."
-                )
-                logger.info(
-                    f"Dynamically formatted tools - OpenAI: {len(openai_tools)}, Claude: {len(claude_tools)}."
-                )
-
-                # 3. Initialize ToolManager with the fetched formatted tools
-
-                _, raw_tools_dict = await self.tool_adapter.get_server_and_tool_info(
-                    enabled_servers
-                )
-                self.tool_manager = ToolManager(
-                    formatted_tools_openai=openai_tools,
-                    formatted_tools_claude=claude_tools,
-                    initial_tools_dict=raw_tools_dict,
-                )
-                logger.info("ToolManager initialized with dynamically fetched tools.")
-
+                toolset = await mcp_runtime.get_toolset(enabled_servers)
             except Exception as e:
                 logger.error(
                     f"Failed during dynamic MCP tool construction: {e}", exc_info=True
                 )
                 # Ensure dependent components are not created if construction fails
-                self.tool_manager = None
                 self.mcp_prompt = "[Error constructing MCP tools/prompt]"
+                return
 
-            # 4. Initialize MCPClient
-            if self.mcp_server_registery:
-                self.mcp_client = MCPClient(
-                    self.mcp_server_registery, self.send_text, self.client_uid
-                )
-                logger.info("MCPClient initialized for this session.")
-            else:
-                logger.error(
-                    "MCP enabled but ServerRegistry not available. MCPClient not created."
-                )
-                self.mcp_client = None  # Ensure it's None
-
-            # 5. Initialize ToolExecutor
-            if self.mcp_client and self.tool_manager:
-                self.tool_executor = ToolExecutor(self.mcp_client, self.tool_manager)
-                logger.info("ToolExecutor initialized for this session.")
-            else:
-                logger.warning(
-                    "MCPClient or ToolManager not available. ToolExecutor not created."
-                )
-                self.tool_executor = None  # Ensure it's None
+            self.mcp_server_registery = mcp_runtime.server_registery
+            self.tool_adapter = mcp_runtime.tool_adapter
+            self.mcp_client = toolset.mcp_client
+            self.tool_manager = toolset.tool_manager
+            self.mcp_prompt = toolset.mcp_prompt
+            logger.info(
+                f"MCP prompt string (length: {len(self.mcp_prompt)}) and {len(toolset.tools)} tools loaded from the shared MCP runtime."
+            )
 
-            logger.info("StreamJSONDetector initialized for this session.")
+            self.tool_executor = ToolExecutor(self.mcp_client, self.tool_manager)
+            logger.info("ToolExecutor initialized for this session.")
 
         elif use_mcpp and not enabled_servers:
             logger.warning(
@@ -193,13 +157,21 @@ class ServiceContext:
                 "MCP components not initialized (use_mcpp is False or no enabled servers)."
             )
 
+    async def _release_mcp_client(self) -> None:
+        """Give the leased MCPClient back to the shared MCPRuntime."""
+        if self.mcp_client:
+            client, self.mcp_client = self.mcp_client, None
+            await MCPRuntime.get_instance().release_client(client)
+
     async def close(self):
-        """Clean up resources, especially the MCPClient."""
+        """Clean up resources of this session.
+
+        The MCPClient belongs to the shared MCPRuntime and stays open for other
+        sessions, so only the lease of this session is released here.
+        """
         logger.info("Closing ServiceContext resources...")
-        if self.mcp_client:
-            logger.info(f"Closing MCPClient for context instance {id(self)}...")
-            await self.mcp_client.aclose()
-            self.mcp_client = None
+        self.tool_executor = None
+        await self._release_mcp_client()
         # if self.agent_engine and hasattr(self.agent_engine, "close"):
         #     await self.agent_engine.close()  # Ensure agent resources are also closed
         logger.info("ServiceContext closed.")
@@ -215,8 +187,8 @@ class ServiceContext:
         vad_engine: VADInterface,
         agent_engine: AgentInterface,
         translate_engine: TranslateInterface | None,
-        mcp_server_registery: ServerRegistry | None = None,
-        tool_adapter: ToolAdapter | None = None,
+        mcp_server_registery: "ServerRegistry | None" = None,
+        tool_adapter: "ToolAdapter | None" = None,
         send_text: Callable = None,
         client_uid: str = None,
     ) -> None:
@@ -283,19 +255,6 @@ class ServiceContext:
         # init vad from character config
         self.init_vad(config.character_config.vad_config)
 
-        # Initialize shared ToolAdapter if it doesn't exist yet
-        if (
-            not self.tool_adapter
-            and config.character_config.agent_config.agent_settings.basic_memory_agent.use_mcpp
-        ):
-            if not self.mcp_server_registery:
-                logger.info(
-                    "Initializing shared ServerRegistry within load_from_config."
-                )
-                self.mcp_server_registery = ServerRegistry()
-            logger.info("Initializing shared ToolAdapter within load_from_config.")
-            self.tool_adapter = ToolAdapter(server_registery=self.mcp_server_registery)
-
         # Initialize MCP Components before initializing Agent
         await self._init_mcp_components(
             config.character_config.agent_config.agent_settings.basic_memory_agent.use_mcpp,
@@ -322,13 +281,17 @@ class ServiceContext:
             # Looking at InterviewManager code, it instantiates ResumeAnalyzer in __init__.
             # We should probably update InterviewManager to use the new ResumeAnalyzer class we refactored.
 
-            from .agent.rag.resume_analyzer import ResumeAnalyzer
             # Pass LLM model name to InterviewManager if it accepts config, or let it use default
             # For now, we will initialize it simply.
             self.interview_manager = InterviewManager()
 
             # Initialize JD Analyzer
-            self.jd_analyzer = JDAnalyzer(model_name="gemini-2.0-flash-exp")
+            def build_jd_analyzer():
+                from .agent.rag.jd_analyzer import JDAnalyzer
+
+                return JDAnalyzer(model_name=llm_model)
+
+            self.jd_analyzer = self._build_engine("JD analyzer", build_jd_analyzer)
 
 
         self.init_translate(
@@ -340,6 +303,27 @@ class ServiceContext:
         self.system_config = config.system_config or self.system_config
         self.character_config = config.character_config
 
+    def _build_engine(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Build an engine now, or on first use if system_config.lazy_engines is set."""
+        if self.system_config and self.system_config.lazy_engines:
+            return LazyEngine(name, factory)
+        return factory()
+
+    async def warm_up(self) -> None:
+        """Build the engines left to be built on first use, without blocking the event loop."""
+        lazy_engines = [
+            engine
+            for engine in (self.asr_engine, self.tts_engine, self.vad_engine, self.jd_analyzer)
+            if isinstance(engine, LazyEngine) and not engine.built
+        ]
+        tasks = [engine.warm_up() for engine in lazy_engines]
+        if self.interview_manager:
+            tasks.append(asyncio.to_thread(self.interview_manager.warm_up))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Warm-up failed: {result}")
+
     def init_live2d(self, live2d_model_name: str) -> None:
         logger.info(f"Initializing Live2D: {live2d_model_name}")
         try:
@@ -352,9 +336,12 @@ class ServiceContext:
     def init_asr(self, asr_config: ASRConfig) -> None:
         if not self.asr_engine or (self.character_config.asr_config != asr_config):
             logger.info(f"Initializing ASR: {asr_config.asr_model}")
-            self.asr_engine = ASRFactory.get_asr_system(
-                asr_config.asr_model,
-                **getattr(asr_config, asr_config.asr_model).model_dump(),
+            self.asr_engine = self._build_engine(
+                "ASR",
+                lambda: ASRFactory.get_asr_system(
+                    asr_config.asr_model,
+                    **getattr(asr_config, asr_config.asr_model).model_dump(),
+                ),
             )
             # saving config should be done after successful initialization
             self.character_config.asr_config = asr_config
@@ -364,9 +351,12 @@ class ServiceContext:
     def init_tts(self, tts_config: TTSConfig) -> None:
         if not self.tts_engine or (self.character_config.tts_config != tts_config):
             logger.info(f"Initializing TTS: {tts_config.tts_model}")
-            self.tts_engine = TTSFactory.get_tts_engine(
-                tts_config.tts_model,
-                **getattr(tts_config, tts_config.tts_model.lower()).model_dump(),
+            self.tts_engine = self._build_engine(
+                "TTS",
+                lambda: TTSFactory.get_tts_engine(
+                    tts_config.tts_model,
+                    **getattr(tts_config, tts_config.tts_model.lower()).model_dump(),
+                ),
             )
             # saving config should be done after successful initialization
             self.character_config.tts_config = tts_config
@@ -381,9 +371,12 @@ class ServiceContext:
 
         if not self.vad_engine or (self.character_config.vad_config != vad_config):
             logger.info(f"Initializing VAD: {vad_config.vad_model}")
-            self.vad_engine = VADFactory.get_vad_engine(
-                vad_config.vad_model,
-                **getattr(vad_config, vad_config.vad_model.lower()).model_dump(),
+            self.vad_engine = self._build_engine(
+                "VAD",
+                lambda: VADFactory.get_vad_engine(
+                    vad_config.vad_model,
+                    **getattr(vad_config, vad_config.vad_model.lower()).model_dump(),
+                ),
             )
             # saving config should be done after successful initialization
             self.character_config.vad_config = vad_config
@@ -548,24 +541,20 @@ class ServiceContext:
                 )
 
                 # Send responses to client
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "set-model-and-conf",
-                            "model_info": self.live2d_model.model_info,
-                            "conf_name": self.character_config.conf_name,
-                            "conf_uid": self.character_config.conf_uid,
-                        }
-                    )
+                await websocket.send_json(
+                    {
+                        "type": "set-model-and-conf",
+                        "model_info": self.live2d_model.model_info,
+                        "conf_name": self.character_config.conf_name,
+                        "conf_uid": self.character_config.conf_uid,
+                    }
                 )
 
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "config-switched",
-                            "message": f"Switched to config: {config_file_name}",
-                        }
-                    )
+                await websocket.send_json(
+                    {
+                        "type": "config-switched",
+                        "message": f"Switched to config: {config_file_name}",
+                    }
                 )
 
                 logger.info(f"Configuration switched to {config_file_name}")
@@ -577,13 +566,11 @@ class ServiceContext:
         except Exception as e:
             logger.error(f"Error switching configuration: {e}")
             logger.debug(self)
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "error",
-                        "message": f"Error switching configuration: {str(e)}",
-                    }
-                )
+            await websocket.send_json(
+                {
+                    "type": "error",
+                    "message": f"Error switching configuration: {str(e)}",
+                }
             )
             raise e
 
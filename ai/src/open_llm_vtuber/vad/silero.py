@@ -1,12 +1,12 @@
 import asyncio
+import importlib.util
 from collections import deque
 from enum import Enum
+from pathlib import Path
 
 import numpy as np
-import torch
 from loguru import logger
 from pydantic import BaseModel
-from silero_vad import load_silero_vad
 
 from .vad_interface import VADInterface
 
@@ -19,6 +19,68 @@ class SileroVADConfig(BaseModel):
     required_hits: int = 3  # 3 * (0.032) = 0.1s
     required_misses: int = 24  # 24 * (0.032) = 0.8s
     smoothing_window: int = 5
+    onnx: bool = False
+
+
+def silero_onnx_model_path() -> Path:
+    """Path of the ONNX model shipped with the silero_vad package."""
+    # find_spec does not run the package, which imports torch
+    spec = importlib.util.find_spec("silero_vad")
+    if spec is None or not spec.submodule_search_locations:
+        raise RuntimeError("silero_vad package is not installed")
+    return Path(spec.submodule_search_locations[0]) / "data" / "silero_vad.onnx"
+
+
+class SileroTorchModel:
+    """Silero VAD TorchScript model."""
+
+    def __init__(self):
+        import torch
+        from silero_vad import load_silero_vad
+
+        self._torch = torch
+        self.model = load_silero_vad()
+
+    def __call__(self, chunk: np.ndarray, sr: int) -> float:
+        with self._torch.no_grad():
+            return self.model(self._torch.Tensor(chunk), sr).item()
+
+
+class SileroOnnxModel:
+    """Silero VAD ONNX model run with onnxruntime and numpy, without torch."""
+
+    def __init__(self, sr: int = 16000):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.inter_op_num_threads = 1
+        options.intra_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            str(silero_onnx_model_path()),
+            providers=["CPUExecutionProvider"],
+            sess_options=options,
+        )
+        self.sr = sr
+        # The model sees the tail of the previous chunk before each chunk
+        self.context_size = 64 if sr == 16000 else 32
+        self.reset_states()
+
+    def reset_states(self) -> None:
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, self.context_size), dtype=np.float32)
+
+    def __call__(self, chunk: np.ndarray, sr: int) -> float:
+        if sr != self.sr:
+            self.sr = sr
+            self.context_size = 64 if sr == 16000 else 32
+            self.reset_states()
+        x = np.concatenate([self._context, chunk.reshape(1, -1)], axis=1)
+        out, self._state = self.session.run(
+            None,
+            {"input": x, "state": self._state, "sr": np.array(sr, dtype=np.int64)},
+        )
+        self._context = x[:, -self.context_size :]
+        return float(out[0][0])
 
 
 class VADEngine(VADInterface):
@@ -31,6 +93,7 @@ class VADEngine(VADInterface):
         required_hits: int = 3,
         required_misses: int = 24,
         smoothing_window: int = 5,
+        onnx: bool = False,
     ):
         self.config = SileroVADConfig(
             orig_sr=orig_sr,
@@ -40,6 +103,7 @@ class VADEngine(VADInterface):
             required_hits=required_hits,
             required_misses=required_misses,
             smoothing_window=smoothing_window,
+            onnx=onnx,
         )
         self.model = self.load_vad_model()
         self.state = StateMachine(self.config)
@@ -47,8 +111,11 @@ class VADEngine(VADInterface):
         # 512 / 16000 = 0.032s
 
     def load_vad_model(self):
+        if self.config.onnx:
+            logger.info("Loading Silero-VAD model (ONNX)...")
+            return SileroOnnxModel(self.config.target_sr)
         logger.info("Loading Silero-VAD model...")
-        return load_silero_vad()
+        return SileroTorchModel()
 
     def detect_speech(self, audio_data: list[float]):
         audio_np = np.array(audio_data, dtype=np.float32)
@@ -56,10 +123,7 @@ class VADEngine(VADInterface):
             chunk_np = audio_np[i : i + self.window_size_samples]
             if len(chunk_np) < self.window_size_samples:
                 break
-            chunk = torch.Tensor(chunk_np)
-
-            with torch.no_grad():
-                speech_prob = self.model(chunk, self.config.target_sr).item()
+            speech_prob = self.model(chunk_np, self.config.target_sr)
 
             if speech_prob:
                 # print(speech_prob)
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional, Callable, TypedDict
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
-import json
+import time
 from enum import Enum
 import numpy as np
 from loguru import logger
@@ -14,7 +14,12 @@ from .chat_group import (
     broadcast_to_group,
 )
 from .message_handler import message_handler
+from .message_validation import TELEMETRY_TYPES, compile_validators
+from .send_queue import ConnectionSender
+from .wire_format import decode_message, get_wire_encoder
 from .utils.stream_audio import prepare_audio_payload
+from .utils.lazy_engine import resolve_engine
+from .utils.turn_trace import TurnTracer
 from .chat_history_manager import (
     create_new_history,
     get_history,
@@ -73,7 +78,8 @@ class WebSocketHandler:
 
     def __init__(self, default_context_cache: ServiceContext, config=None):
         """Initialize the WebSocket handler with default context"""
-        self.client_connections: Dict[str, WebSocket] = {}
+        # Outbound side of each connection, see ConnectionSender
+        self.client_connections: Dict[str, ConnectionSender] = {}
         self.client_contexts: Dict[str, ServiceContext] = {}
         self.chat_group_manager = ChatGroupManager()
         self.current_conversation_tasks: Dict[str, Optional[asyncio.Task]] = {}
@@ -83,6 +89,7 @@ class WebSocketHandler:
 
         # Message handlers mapping
         self._message_handlers = self._init_message_handlers()
+        self._message_validators = compile_validators()
 
         # Interview Manager
         if config and hasattr(config, "rag_config"):
@@ -120,7 +127,7 @@ class WebSocketHandler:
         }
 
     async def handle_new_connection(
-        self, websocket: WebSocket, client_uid: str
+        self, websocket: WebSocket, client_uid: str, wire_format: str | None = None
     ) -> None:
         """
         Handle new WebSocket connection setup
@@ -128,21 +135,27 @@ class WebSocketHandler:
         Args:
             websocket: The WebSocket connection
             client_uid: Unique identifier for the client
+            wire_format: Outbound wire format the client asked for ("json" or "msgpack")
 
         Raises:
             Exception: If initialization fails
         """
         try:
+            # Everything sent to this client goes through one queue, in order
+            sender = ConnectionSender(
+                websocket, client_uid, encoder=get_wire_encoder(wire_format)
+            )
+
             session_service_context = await self._init_service_context(
-                websocket.send_text, client_uid
+                sender.send_text, client_uid
             )
 
             await self._store_client_data(
-                websocket, client_uid, session_service_context
+                sender, client_uid, session_service_context
             )
 
             await self._send_initial_messages(
-                websocket, client_uid, session_service_context
+                sender, client_uid, session_service_context
             )
 
             logger.info(f"Connection established for client {client_uid}")
@@ -166,7 +179,7 @@ class WebSocketHandler:
 
     async def _store_client_data(
         self,
-        websocket: WebSocket,
+        websocket: ConnectionSender,
         client_uid: str,
         session_service_context: ServiceContext,
     ):
@@ -181,32 +194,28 @@ class WebSocketHandler:
 
     async def _send_initial_messages(
         self,
-        websocket: WebSocket,
+        websocket: ConnectionSender,
         client_uid: str,
         session_service_context: ServiceContext,
     ):
         """Send initial connection messages to the client"""
-        await websocket.send_text(
-            json.dumps({"type": "full-text", "text": "Connection established"})
-        )
-
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "set-model-and-conf",
-                    "model_info": session_service_context.live2d_model.model_info,
-                    "conf_name": session_service_context.character_config.conf_name,
-                    "conf_uid": session_service_context.character_config.conf_uid,
-                    "client_uid": client_uid,
-                }
-            )
+        await websocket.send_json({"type": "full-text", "text": "Connection established"})
+
+        await websocket.send_json(
+            {
+                "type": "set-model-and-conf",
+                "model_info": session_service_context.live2d_model.model_info,
+                "conf_name": session_service_context.character_config.conf_name,
+                "conf_uid": session_service_context.character_config.conf_uid,
+                "client_uid": client_uid,
+            }
         )
 
         # Send initial group status
         await self.send_group_update(websocket, client_uid)
 
         # Start microphone
-        await websocket.send_text(json.dumps({"type": "control", "text": "start-mic"}))
+        await websocket.send_json({"type": "control", "text": "start-mic"})
 
     async def _init_service_context(
         self, send_text: Callable, client_uid: str
@@ -245,22 +254,27 @@ class WebSocketHandler:
             websocket: The WebSocket connection
             client_uid: Unique identifier for the client
         """
+        # Replies go through the client's send queue, behind earlier frames
+        sender = self.client_connections.get(client_uid, websocket)
         try:
             while True:
                 try:
-                    data = await websocket.receive_json()
-                    message_handler.handle_message(client_uid, data)
-                    await self._route_message(websocket, client_uid, data)
+                    frame = await self._receive_frame(websocket)
+                    try:
+                        data = decode_message(frame)
+                    except ValueError as e:
+                        # Only undecodable frames are dropped silently, handler
+                        # errors are reported to the client below
+                        logger.error(f"Invalid message received: {e}")
+                        continue
+                    if data.get("type") not in TELEMETRY_TYPES:
+                        message_handler.handle_message(client_uid, data)
+                    await self._route_message(sender, client_uid, data)
                 except WebSocketDisconnect:
                     raise
-                except json.JSONDecodeError:
-                    logger.error("Invalid JSON received")
-                    continue
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
-                    await websocket.send_text(
-                        json.dumps({"type": "error", "message": str(e)})
-                    )
+                    await sender.send_json({"type": "error", "message": str(e)})
                     continue
 
         except WebSocketDisconnect:
@@ -270,11 +284,21 @@ class WebSocketHandler:
             logger.error(f"Fatal error in WebSocket communication: {e}")
             raise
 
+    @staticmethod
+    async def _receive_frame(websocket: WebSocket) -> str | bytes:
+        """Receive the next text or binary frame"""
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+        text = message.get("text")
+        return text if text is not None else message.get("bytes", b"")
+
     async def _route_message(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """
-        Route incoming message to appropriate handler
+        Route incoming message to appropriate handler, after checking the
+        fields its handler relies on
 
         Args:
             websocket: The WebSocket connection
@@ -288,6 +312,12 @@ class WebSocketHandler:
 
         handler = self._message_handlers.get(msg_type)
         if handler:
+            validator = self._message_validators.get(msg_type)
+            error = validator(data) if validator else None
+            if error:
+                logger.warning(f"Rejected message from {client_uid}: {error}")
+                await websocket.send_json({"type": "error", "message": error})
+                return
             await handler(websocket, client_uid, data)
         else:
             if msg_type != "frontend-playback-complete":
@@ -332,7 +362,9 @@ class WebSocketHandler:
         )
 
         # Clean up other client data
-        self.client_connections.pop(client_uid, None)
+        sender = self.client_connections.pop(client_uid, None)
+        if sender:
+            await sender.close()
         self.client_contexts.pop(client_uid, None)
         self.received_data_buffers.pop(client_uid, None)
         self.client_aggregators.pop(client_uid, None)
@@ -349,10 +381,13 @@ class WebSocketHandler:
 
         logger.info(f"Client {client_uid} disconnected")
         message_handler.cleanup_client(client_uid)
+        TurnTracer.get_instance().discard(client_uid)
 
     async def _cleanup_failed_connection(self, client_uid: str) -> None:
         """Clean up failed connection data"""
-        self.client_connections.pop(client_uid, None)
+        sender = self.client_connections.pop(client_uid, None)
+        if sender:
+            await sender.close()
         self.client_contexts.pop(client_uid, None)
         self.received_data_buffers.pop(client_uid, None)
         self.chat_group_manager.client_group_map.pop(client_uid, None)
@@ -382,27 +417,23 @@ class WebSocketHandler:
         if group:
             current_members = self.chat_group_manager.get_group_members(client_uid)
             try:
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "group-update",
-                            "members": current_members,
-                            "is_owner": group.owner_uid == client_uid,
-                        }
-                    )
+                await websocket.send_json(
+                    {
+                        "type": "group-update",
+                        "members": current_members,
+                        "is_owner": group.owner_uid == client_uid,
+                    }
                 )
             except (WebSocketDisconnect, RuntimeError):
                  # RuntimeError can happen if connection is closed ("Connection is already closed")
                  logger.debug(f"Failed to send group update to {client_uid} (connection closed)")
         else:
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "group-update",
-                        "members": [],
-                        "is_owner": False,
-                    }
-                )
+            await websocket.send_json(
+                {
+                    "type": "group-update",
+                    "members": [],
+                    "is_owner": False,
+                }
             )
 
     async def _handle_interrupt(
@@ -436,9 +467,7 @@ class WebSocketHandler:
         """Handle request for chat history list"""
         context = self.client_contexts[client_uid]
         histories = get_history_list(context.character_config.conf_uid)
-        await websocket.send_text(
-            json.dumps({"type": "history-list", "histories": histories})
-        )
+        await websocket.send_json({"type": "history-list", "histories": histories})
 
     async def _handle_fetch_history(
         self, websocket: WebSocket, client_uid: str, data: dict
@@ -464,9 +493,7 @@ class WebSocketHandler:
             )
             if msg["role"] != "system"
         ]
-        await websocket.send_text(
-            json.dumps({"type": "history-data", "messages": messages})
-        )
+        await websocket.send_json({"type": "history-data", "messages": messages})
 
     async def _handle_create_history(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -480,13 +507,11 @@ class WebSocketHandler:
                 conf_uid=context.character_config.conf_uid,
                 history_uid=history_uid,
             )
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "new-history-created",
-                        "history_uid": history_uid,
-                    }
-                )
+            await websocket.send_json(
+                {
+                    "type": "new-history-created",
+                    "history_uid": history_uid,
+                }
             )
 
     async def _handle_delete_history(
@@ -502,14 +527,12 @@ class WebSocketHandler:
             context.character_config.conf_uid,
             history_uid,
         )
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "history-deleted",
-                    "success": success,
-                    "history_uid": history_uid,
-                }
-            )
+        await websocket.send_json(
+            {
+                "type": "history-deleted",
+                "success": success,
+                "history_uid": history_uid,
+            }
         )
         if history_uid == context.history_uid:
             context.history_uid = None
@@ -532,22 +555,21 @@ class WebSocketHandler:
         context = self.client_contexts[client_uid]
         chunk = data.get("audio", [])
         if chunk:
-            for audio_bytes in context.vad_engine.detect_speech(chunk):
+            vad_start_ns = time.perf_counter_ns()
+            vad_engine = await resolve_engine(context.vad_engine)
+            for audio_bytes in vad_engine.detect_speech(chunk):
                 if audio_bytes == b"<|PAUSE|>":
-                    await websocket.send_text(
-                        json.dumps({"type": "control", "text": "interrupt"})
-                    )
+                    await websocket.send_json({"type": "control", "text": "interrupt"})
                 elif audio_bytes == b"<|RESUME|>":
                     pass
                 elif len(audio_bytes) > 1024:
                     # Detected audio activity (voice)
+                    TurnTracer.get_instance().end_of_speech(client_uid, vad_start_ns)
                     self.received_data_buffers[client_uid] = np.append(
                         self.received_data_buffers[client_uid],
                         np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32),
                     )
-                    await websocket.send_text(
-                        json.dumps({"type": "control", "text": "mic-audio-end"})
-                    )
+                    await websocket.send_json({"type": "control", "text": "mic-audio-end"})
 
     async def _handle_conversation_trigger(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -573,9 +595,7 @@ class WebSocketHandler:
         """Handle fetching available configurations"""
         context = self.client_contexts[client_uid]
         config_files = scan_config_alts_directory(context.system_config.config_alts_dir)
-        await websocket.send_text(
-            json.dumps({"type": "config-files", "configs": config_files})
-        )
+        await websocket.send_json({"type": "config-files", "configs": config_files})
 
     async def _handle_config_switch(
         self, websocket: WebSocket, client_uid: str, data: dict
@@ -591,9 +611,7 @@ class WebSocketHandler:
     ) -> None:
         """Handle fetching available background images"""
         bg_files = scan_bg_directory()
-        await websocket.send_text(
-            json.dumps({"type": "background-files", "files": bg_files})
-        )
+        await websocket.send_json({"type": "background-files", "files": bg_files})
 
     async def _handle_audio_play_start(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -601,6 +619,9 @@ class WebSocketHandler:
         """
         Handle audio playback start notification
         """
+        trace = TurnTracer.get_instance().get(client_uid)
+        if trace:
+            trace.mark("playback.start", since="ws.first_payload")
         group_members = self.chat_group_manager.get_group_members(client_uid)
         if len(group_members) > 1:
             display_text = data.get("display_text")
@@ -629,16 +650,14 @@ class WebSocketHandler:
         if not context:
             context = self.default_context_cache
 
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "set-model-and-conf",
-                    "model_info": context.live2d_model.model_info,
-                    "conf_name": context.character_config.conf_name,
-                    "conf_uid": context.character_config.conf_uid,
-                    "client_uid": client_uid,
-                }
-            )
+        await websocket.send_json(
+            {
+                "type": "set-model-and-conf",
+                "model_info": context.live2d_model.model_info,
+                "conf_name": context.character_config.conf_name,
+                "conf_uid": context.character_config.conf_uid,
+                "client_uid": client_uid,
+            }
         )
 
     async def _handle_heartbeat(
@@ -667,7 +686,7 @@ class WebSocketHandler:
 
         # 1.5. Prepare Session (RAG Analysis - Async)
         # This analyzes the resume and generates questions.
-        await websocket.send_text(json.dumps({"type": "status", "message": "Analyzing resume..."}))
+        await websocket.send_json({"type": "status", "message": "Analyzing resume..."})
         await self.interview_manager.prepare_session(client_uid)
 
         # 2. Generate Dynamic System Prompt
@@ -689,14 +708,12 @@ class WebSocketHandler:
         await context.load_from_config(new_config)
 
         # 4. Notify Client
-        await websocket.send_text(
-            json.dumps({
-                "type": "interview-session-created",
-                "status": "ready",
-                "client_uid": client_uid,
-                "message": "AI Interviewer is ready with your context."
-            })
-        )
+        await websocket.send_json({
+            "type": "interview-session-created",
+            "status": "ready",
+            "client_uid": client_uid,
+            "message": "AI Interviewer is ready with your context."
+        })
 
         # 5. Trigger First Greeting (Optional)
         # We can ask the AI to introduce itself based on the new prompt
@@ -705,7 +722,7 @@ class WebSocketHandler:
         task = asyncio.create_task(
             process_single_conversation(
                 context=context,
-                websocket_send=websocket.send_text,
+                websocket_send=websocket.send_json,
                 client_uid=client_uid,
                 user_input="면접관으로서 첫 인사를 건네고 면접을 시작해주세요.",
                 metadata={
@@ -753,14 +770,12 @@ class WebSocketHandler:
             guide_text = self.interview_manager.get_phase_guide(new_phase)
 
             # 4. Notify Client
-            await websocket.send_text(
-                json.dumps({
-                    "type": "interview-phase-updated",
-                    "phase": new_phase,
-                    "guide": guide_text,
-                    "message": f"Interview phase changed into {new_phase}."
-                })
-            )
+            await websocket.send_json({
+                "type": "interview-phase-updated",
+                "phase": new_phase,
+                "guide": guide_text,
+                "message": f"Interview phase changed into {new_phase}."
+            })
 
     async def _handle_behavior_data(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -774,18 +789,17 @@ class WebSocketHandler:
             return
 
         try:
-            model = NonVerbalData(**payload)
+            # Arrives every second per client, skip the full pydantic validation
+            model = NonVerbalData.from_payload(payload)
             aggregator = self.client_aggregators[client_uid]
             feedback = aggregator.add_data(model)
 
             if feedback:
-                await websocket.send_text(
-                    json.dumps({
-                        "type": "control",
-                        "text": "warning",
-                        "message": feedback
-                    })
-                )
+                await websocket.send_json({
+                    "type": "control",
+                    "text": "warning",
+                    "message": feedback
+                })
         except Exception as e:
             logger.error(f"Error processing behavior data: {e}")
 
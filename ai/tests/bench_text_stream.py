@@ -0,0 +1,292 @@
+
+"""
+Micro-benchmark of the text streaming hot path
+==============================================
+Replays recorded LLM token streams (tests/data/token_streams.json) through the
+transformer chain of the agents, sentence_divider -> actions_extractor ->
+display_processor -> tts_filter, which runs SentenceDivider,
+Live2dModel.extract_emotion and tts_preprocessor.tts_filter. Tokens are
+replayed without delay, so only the cost of the chain itself is measured.
+
+For each stream it reports the median cost per token and per sentence, the
+cost of extract_emotion and tts_filter per sentence, the peak memory traced
+while replaying and the memory blocks each replay leaves allocated.
+
+    # From ai/
+    python -m tests.bench_text_stream --output bench.json
+
+    # Exit code 1 if a stream got slower or allocates more than a saved run
+    python -m tests.bench_text_stream --baseline bench.json
+
+Timings are scaled by a calibration loop before being compared, which
+absorbs some of the difference between machines. Still, record the baseline
+on the machine that runs the check.
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+from loguru import logger
+
+from src.open_llm_vtuber.config_manager import TranslatorConfig, TTSPreprocessorConfig
+from src.open_llm_vtuber.live2d_model import Live2dModel
+from src.app.core.utils.tts_latency import TTSLatencyTracker
+from src.app.core.utils.tts_preprocessor import tts_filter as filter_text
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+STREAMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "token_streams.json")
+MODEL_DICT_PATH = os.path.join(ROOT, "model_dict.json")
+LIVE2D_MODEL = "mao_pro"
+# Replays over which retained blocks are averaged, enough for caches to settle
+RETENTION_REPLAYS = 50
+# Blocks a replay may leave allocated over the baseline before it counts as a leak
+RETAINED_BLOCKS_SLACK = 2.0
+CALIBRATION_TEXT = "[joy] Thanks, that helps. *nods* 그 부분을 조금 더 자세히 말씀해 주시겠어요? " * 4
+# The agent transformers import these from their old place in
+# src.open_llm_vtuber, they now live in src.app.core. The submodules are
+# aliased too, so the chain and the benchmark share one TTSLatencyTracker.
+LEGACY_MODULES = (
+    ("src.open_llm_vtuber.utils", "src.app.core.utils"),
+    ("src.open_llm_vtuber.utils.sentence_divider", "src.app.core.utils.sentence_divider"),
+    ("src.open_llm_vtuber.utils.tts_latency", "src.app.core.utils.tts_latency"),
+    ("src.open_llm_vtuber.utils.tts_preprocessor", "src.app.core.utils.tts_preprocessor"),
+    ("src.open_llm_vtuber.utils.turn_trace", "src.app.core.utils.turn_trace"),
+)
+
+
+def load_streams(path: str = STREAMS_PATH) -> Dict[str, List[str]]:
+    """Load the recorded token streams, by name."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def tts_preprocessor_config() -> TTSPreprocessorConfig:
+    return TTSPreprocessorConfig(
+        remove_special_char=True,
+        translator_config=TranslatorConfig(translate_audio=False, translate_provider="deeplx"),
+    )
+
+
+def build_chain(live2d_model: Live2dModel, segment_method: str = "pysbd") -> Callable:
+    """The transformer chain of BasicMemoryAgent, over a replayed token stream."""
+    # The aliases only live while the transformers are imported
+    with patch.dict(sys.modules):
+        for old, new in LEGACY_MODULES:
+            sys.modules[old] = importlib.import_module(new)
+        from src.open_llm_vtuber.agent.transformers import (
+            actions_extractor,
+            display_processor,
+            sentence_divider,
+            tts_filter,
+        )
+
+    @tts_filter(tts_preprocessor_config())
+    @display_processor()
+    @actions_extractor(live2d_model)
+    @sentence_divider(
+        faster_first_response=True,
+        segment_method=segment_method,
+        valid_tags=["think"],
+    )
+    async def replay(tokens: List[str]):
+        for token in tokens:
+            yield token
+
+    return replay
+
+
+def replay_stream(chain: Callable, tokens: List[str], loop: asyncio.AbstractEventLoop) -> List:
+    """Run the tokens through the chain and get its outputs."""
+
+    async def collect():
+        return [output async for output in chain(tokens)]
+
+    # The first chunk size follows the measured TTS latency, keep it fixed
+    TTSLatencyTracker.get_instance().reset()
+    return loop.run_until_complete(collect())
+
+
+def median_ns(run: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        run()
+        times.append(time.perf_counter_ns() - start)
+    return statistics.median(times)
+
+
+def calibrate(repeat: int = 9) -> float:
+    """Time a fixed string workload like the chain's, in microseconds."""
+
+    def work():
+        for _ in range(200):
+            text = re.sub(r"\[\w+\]", "", CALIBRATION_TEXT)
+            text.strip().split(" ")
+
+    work()
+    return median_ns(work, repeat) / 1000
+
+
+def measure(chain: Callable, live2d_model: Live2dModel, tokens: List[str], repeat: int,
+            loop: asyncio.AbstractEventLoop) -> Dict:
+    """Benchmark one token stream through the chain."""
+    outputs = replay_stream(chain, tokens, loop)
+    for _ in range(2):
+        replay_stream(chain, tokens, loop)
+    chain_ns = median_ns(lambda: replay_stream(chain, tokens, loop), repeat)
+
+    texts = [output.display_text.text for output in outputs]
+    config = tts_preprocessor_config()
+    emotion_ns = median_ns(lambda: [live2d_model.extract_emotion(text) for text in texts], repeat)
+    filter_ns = median_ns(
+        lambda: [
+            filter_text(
+                text=text,
+                remove_special_char=config.remove_special_char,
+                ignore_brackets=config.ignore_brackets,
+                ignore_parentheses=config.ignore_parentheses,
+                ignore_asterisks=config.ignore_asterisks,
+                ignore_angle_brackets=config.ignore_angle_brackets,
+            )
+            for text in texts
+        ],
+        repeat,
+    )
+
+    # Blocks still allocated after replays, a leak if it grows with every replay
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    for _ in range(RETENTION_REPLAYS):
+        replay_stream(chain, tokens, loop)
+    gc.collect()
+    retained = (sys.getallocatedblocks() - blocks) / RETENTION_REPLAYS
+
+    tracemalloc.start()
+    replay_stream(chain, tokens, loop)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sentences = max(len(outputs), 1)
+    return {
+        "tokens": len(tokens),
+        "sentences": len(outputs),
+        "us_per_token": round(chain_ns / len(tokens) / 1000, 2),
+        "us_per_sentence": round(chain_ns / sentences / 1000, 2),
+        "extract_emotion_us_per_sentence": round(emotion_ns / sentences / 1000, 2),
+        "tts_filter_us_per_sentence": round(filter_ns / sentences / 1000, 2),
+        "peak_kib": round(peak / 1024, 1),
+        "retained_blocks_per_replay": round(retained, 1),
+    }
+
+
+def run_benchmark(streams: Dict[str, List[str]], repeat: int, segment_method: str) -> Dict:
+    live2d_model = Live2dModel(LIVE2D_MODEL, model_dict_path=MODEL_DICT_PATH)
+    chain = build_chain(live2d_model, segment_method)
+    loop = asyncio.new_event_loop()
+    try:
+        results = {
+            name: measure(chain, live2d_model, tokens, repeat, loop)
+            for name, tokens in streams.items()
+        }
+    finally:
+        loop.close()
+    return {
+        "segment_method": segment_method,
+        "calibration_us": round(calibrate(), 1),
+        "streams": results,
+    }
+
+
+def compare(result: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """List the regressions of a run against a baseline run, by stream.
+
+    Timings may grow by `tolerance` (0.3 = 30%) after scaling by the
+    calibration, peak memory by `tolerance` too. Retained blocks may not
+    grow past the baseline by more than RETAINED_BLOCKS_SLACK per replay.
+    """
+    regressions = []
+    scale = result["calibration_us"] / baseline["calibration_us"]
+    for name, now in result["streams"].items():
+        then = baseline["streams"].get(name)
+        if then is None:
+            continue
+        if now["sentences"] != then["sentences"]:
+            print(f"{name}: {then['sentences']} -> {now['sentences']} sentences, costs per sentence differ", file=sys.stderr)
+        for metric in ("us_per_token", "us_per_sentence", "extract_emotion_us_per_sentence", "tts_filter_us_per_sentence"):
+            limit = then[metric] * scale * (1 + tolerance)
+            if now[metric] > limit:
+                regressions.append(f"{name}: {metric} {then[metric]} -> {now[metric]} (limit {limit:.2f})")
+        if now["peak_kib"] > then["peak_kib"] * (1 + tolerance):
+            regressions.append(f"{name}: peak_kib {then['peak_kib']} -> {now['peak_kib']}")
+        if now["retained_blocks_per_replay"] > then["retained_blocks_per_replay"] + RETAINED_BLOCKS_SLACK:
+            regressions.append(
+                f"{name}: retained_blocks_per_replay {then['retained_blocks_per_replay']} -> {now['retained_blocks_per_replay']}"
+            )
+    return regressions
+
+
+def print_table(result: Dict) -> None:
+    print(
+        f"{'stream':<10} {'tokens':>6} {'sent.':>5} {'us/token':>9} {'us/sent.':>9} "
+        f"{'emotion':>8} {'filter':>7} {'peak KiB':>9} {'retained':>8}"
+    )
+    for name, row in result["streams"].items():
+        print(
+            f"{name:<10} {row['tokens']:>6} {row['sentences']:>5} {row['us_per_token']:>9} "
+            f"{row['us_per_sentence']:>9} {row['extract_emotion_us_per_sentence']:>8} "
+            f"{row['tts_filter_us_per_sentence']:>7} {row['peak_kib']:>9} {row['retained_blocks_per_replay']:>8}"
+        )
+    print(f"calibration {result['calibration_us']} us, segment method {result['segment_method']}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the text streaming hot path")
+    parser.add_argument("--streams", default=STREAMS_PATH, help="JSON of token streams by name")
+    parser.add_argument("--only", help="Comma-separated stream names to run")
+    parser.add_argument("--repeat", type=int, default=30, help="Replays per measurement")
+    parser.add_argument("--segment-method", choices=("pysbd", "regex"), default="pysbd")
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Results JSON of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed growth over the baseline")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    # The chain logs every sentence at debug level, measure it without sinks
+    logger.remove()
+    streams = load_streams(args.streams)
+    if args.only:
+        streams = {name: streams[name] for name in args.only.split(",")}
+
+    result = run_benchmark(streams, args.repeat, args.segment_method)
+    print_table(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("segment_method") != result["segment_method"]:
+            print("Baseline used another segment method, the comparison may not hold", file=sys.stderr)
+        regressions = compare(result, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,530 @@
+
+"""
+Load test of the interview server
+=================================
+Simulates N candidates at once, each connected to /client-ws and answering
+by voice: the answer audio is streamed in real time, then the candidate waits
+for the interviewer's reply and acts like the frontend (playback start and
+complete). The LLM, TTS and ASR are replaced by fakes with fixed latencies,
+so the results measure the server itself and are reproducible.
+
+For each concurrency level it reports time to first audio and turn latency
+percentiles (from the end of the answer), and the CPU and peak RSS of the
+server process and its children. Run it from the ai/ directory, as a module
+so that the src package can be imported:
+
+    # Start a server with the fakes and run three concurrency levels
+    python -m tests.load_harness --concurrency 1,4,16 --turns 3 --output load.json
+
+    # Fail (exit code 1) if a level got slower than a saved run
+    python -m tests.load_harness --concurrency 1,4,16 --baseline load.json
+
+    # Only the server with the fakes, for load from elsewhere
+    python -m tests.load_harness serve --port 12400
+
+Answers are a synthetic 4 s recording by default, or a 16 kHz mono 16-bit
+WAV file given with --audio. With --server-vad the audio goes through the
+server's VAD (raw-audio-data) instead of being ended by the client.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+import wave
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from src.open_llm_vtuber.agent.stateless_llm.stateless_llm_interface import StatelessLLMInterface
+from src.open_llm_vtuber.asr.asr_interface import ASRInterface
+from src.open_llm_vtuber.tts.tts_interface import TTSInterface
+
+SAMPLE_RATE = 16000
+CHUNK_S = 0.1
+TRANSCRIPT = "I built the interview backend with FastAPI and moved the slow parts to background workers."
+RESPONSE = (
+    "Thank you for the answer. "
+    "What was the hardest performance problem in that project, and how did you measure it? "
+    "그 문제를 해결하기 위해 어떤 방법을 선택하셨나요?"
+)
+# Length of TTS audio per character of text, about the speed of speech
+TTS_SECONDS_PER_CHAR = 0.07
+SERVER_START_TIMEOUT_S = 300.0
+# The ai/ directory, where the server runs from
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+class FakeASR(ASRInterface):
+    """ASR answering a fixed transcript after a fixed latency."""
+
+    def __init__(self, latency_s: float, transcript: str = TRANSCRIPT):
+        self.latency_s = latency_s
+        self.transcript = transcript
+
+    async def async_transcribe_np(self, audio: np.ndarray) -> str:
+        await asyncio.sleep(self.latency_s)
+        return self.transcript
+
+    def transcribe_np(self, audio: np.ndarray) -> str:
+        time.sleep(self.latency_s)
+        return self.transcript
+
+
+class FakeLLM(StatelessLLMInterface):
+    """LLM streaming a fixed response, with a fixed first token and per-token latency."""
+
+    def __init__(self, first_token_s: float, token_s: float, response: str = RESPONSE):
+        self.first_token_s = first_token_s
+        self.token_s = token_s
+        # Words with their trailing space, about the size of real tokens
+        self.tokens = re.findall(r"\S+\s*", response)
+
+    async def chat_completion(self, messages, system=None, tools=None):
+        await asyncio.sleep(self.first_token_s)
+        for i, token in enumerate(self.tokens):
+            if i:
+                await asyncio.sleep(self.token_s)
+            yield token
+
+
+class FakeTTS(TTSInterface):
+    """TTS writing silence as long as the text would be spoken, after a fixed latency."""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    async def async_generate_audio(self, text: str, file_name_no_ext=None) -> str:
+        await asyncio.sleep(self.latency_s)
+        return self._write_silence(text, file_name_no_ext)
+
+    def generate_audio(self, text: str, file_name_no_ext=None) -> str:
+        time.sleep(self.latency_s)
+        return self._write_silence(text, file_name_no_ext)
+
+    def _write_silence(self, text: str, file_name_no_ext=None) -> str:
+        path = self.generate_cache_file_name(file_name_no_ext, "wav")
+        samples = int(len(text) * TTS_SECONDS_PER_CHAR * SAMPLE_RATE)
+        with wave.open(path, "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(SAMPLE_RATE)
+            f.writeframes(bytes(2 * samples))
+        return path
+
+
+def install_fakes(context, args) -> None:
+    """Replace the ASR, TTS and LLM of a loaded service context with the fakes."""
+    agent = context.agent_engine
+    if not hasattr(agent, "_llm"):
+        raise SystemExit(
+            f"The load test needs an agent with a stateless LLM (basic_memory_agent), got {type(agent).__name__}"
+        )
+    context.asr_engine = FakeASR(args.asr_ms / 1000)
+    context.tts_engine = FakeTTS(args.tts_ms / 1000)
+    agent._llm = FakeLLM(args.llm_first_token_ms / 1000, args.llm_token_ms / 1000)
+
+
+def serve(args) -> None:
+    """Run the server from the config, with the fakes, on 127.0.0.1:port."""
+    import uvicorn
+    from src.app.bootstrap.server import WebSocketServer
+    from src.app.core.config.main import read_yaml, validate_config
+
+    config = validate_config(read_yaml(args.config))
+    system_config = config.system_config
+    system_config.host = "127.0.0.1"
+    system_config.port = args.port
+    # The ASR and TTS of the config are replaced, so they are never built
+    system_config.lazy_engines = True
+    system_config.warm_up_engines = False
+
+    server = WebSocketServer(config=config)
+    asyncio.run(server.initialize())
+    context = server.default_context_cache
+    install_fakes(context, args)
+    if args.server_vad and context.vad_engine is not None:
+        # Not during the first measured turn
+        context.vad_engine.get()
+    uvicorn.run(app=server.app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+def synthetic_answer(seconds: float = 4.0, seed: int = 0) -> np.ndarray:
+    """Noise shaped like syllables, the same for the same seed."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    return (0.2 * envelope * rng.standard_normal(t.size)).astype(np.float32)
+
+
+def load_answer(path: str) -> np.ndarray:
+    with wave.open(path, "rb") as f:
+        if (f.getframerate(), f.getnchannels(), f.getsampwidth()) != (SAMPLE_RATE, 1, 2):
+            raise SystemExit(f"{path} must be 16 kHz mono 16-bit WAV")
+        frames = f.readframes(f.getnframes())
+    return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768
+
+
+def answer_frames(answer: np.ndarray, server_vad: bool) -> List[str]:
+    """Serialize the answer into the frames the frontend would send, once for all candidates."""
+    msg_type = "raw-audio-data" if server_vad else "mic-audio-data"
+    chunk = int(CHUNK_S * SAMPLE_RATE)
+    return [
+        json.dumps({"type": msg_type, "audio": np.round(answer[i : i + chunk], 4).tolist()})
+        for i in range(0, len(answer), chunk)
+    ]
+
+
+class TurnResult(NamedTuple):
+    time_to_first_audio_s: Optional[float]
+    turn_latency_s: float
+
+
+def play_turn(ws, frames: List[str], speech_frames: int, server_vad: bool) -> TurnResult:
+    """Stream an answer in real time and wait for the end of the reply.
+
+    Latencies count from the end of the speech, the last `speech_frames`
+    frame. Frames after it are silence for the server VAD.
+    """
+    start = time.perf_counter()
+    answered = None
+    for i, frame in enumerate(frames):
+        # Send each chunk when it would have been recorded
+        delay = start + i * CHUNK_S - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        ws.send(frame)
+        if i == speech_frames - 1:
+            answered = time.perf_counter()
+    if not server_vad:
+        ws.send(json.dumps({"type": "mic-audio-end"}))
+
+    first_audio = None
+    while True:
+        message = json.loads(ws.recv())
+        msg_type = message.get("type")
+        if msg_type == "audio" and message.get("audio") and first_audio is None:
+            first_audio = time.perf_counter() - answered
+            ws.send(json.dumps({"type": "audio-play-start", "display_text": message.get("display_text") or {}}))
+        elif msg_type == "backend-synth-complete":
+            # Playback takes no time
+            ws.send(json.dumps({"type": "frontend-playback-complete"}))
+        elif msg_type == "control" and message.get("text") == "mic-audio-end":
+            # The server VAD found the end of speech, the frontend confirms it
+            ws.send(json.dumps({"type": "mic-audio-end"}))
+        elif msg_type == "control" and message.get("text") == "conversation-chain-end":
+            return TurnResult(first_audio, time.perf_counter() - answered)
+        elif msg_type == "error":
+            raise RuntimeError(message.get("message"))
+
+
+def run_candidate(url: str, frames: List[str], speech_frames: int, args, start_delay: float,
+                  results: List[TurnResult], errors: List[str]) -> None:
+    import websocket
+
+    time.sleep(start_delay)
+    try:
+        ws = websocket.create_connection(url, timeout=args.turn_timeout)
+    except Exception as e:
+        errors.append(f"connect: {e}")
+        return
+    try:
+        while json.loads(ws.recv()).get("type") != "set-model-and-conf":
+            pass
+        for turn in range(args.turns):
+            if turn:
+                time.sleep(args.think_s)
+            results.append(play_turn(ws, frames, speech_frames, args.server_vad))
+    except Exception as e:
+        errors.append(f"{type(e).__name__}: {e}")
+    finally:
+        ws.close()
+
+
+def process_tree(pid: int) -> List[int]:
+    """Get a process and its descendants (Linux)."""
+    pids, i = [pid], 0
+    while i < len(pids):
+        task_dir = f"/proc/{pids[i]}/task"
+        try:
+            for task in os.listdir(task_dir):
+                with open(f"{task_dir}/{task}/children") as f:
+                    pids.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+        i += 1
+    return pids
+
+
+def cpu_seconds(pid: int) -> float:
+    """User and system CPU time of a process and its descendants."""
+    total = 0
+    for p in process_tree(pid):
+        try:
+            with open(f"/proc/{p}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        # utime and stime, fields 14 and 15 of proc(5)
+        total += int(fields[11]) + int(fields[12])
+    return total / os.sysconf("SC_CLK_TCK")
+
+
+class ServerMonitor:
+    """Samples the RSS of the server processes in a thread, keeping the peak."""
+
+    def __init__(self, pid: Optional[int], interval_s: float = 0.25):
+        self.pid = pid
+        self.interval_s = interval_s
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "ServerMonitor":
+        if self.pid is not None:
+            self._start_cpu = cpu_seconds(self.pid)
+            self._start = time.perf_counter()
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.pid is not None:
+            self._stop.set()
+            self._thread.join()
+            self.cpu_percent = 100 * (cpu_seconds(self.pid) - self._start_cpu) / (
+                time.perf_counter() - self._start
+            )
+
+    def _run(self) -> None:
+        from src.app.bootstrap.workers import process_memory
+
+        while not self._stop.is_set():
+            rss = sum(process_memory(p).get("rss", 0) for p in process_tree(self.pid))
+            self.peak_rss = max(self.peak_rss, rss)
+            self._stop.wait(self.interval_s)
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """p50, p95, p99 and max in milliseconds (nearest rank)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(q: int) -> float:
+        return ordered[max(0, -(-len(ordered) * q // 100) - 1)]
+
+    return {
+        "p50": round(rank(50) * 1000, 1),
+        "p95": round(rank(95) * 1000, 1),
+        "p99": round(rank(99) * 1000, 1),
+        "max": round(ordered[-1] * 1000, 1),
+    }
+
+
+def summarize(concurrency: int, results: List[TurnResult], errors: List[str],
+              monitor: Optional[ServerMonitor] = None) -> Dict:
+    summary = {
+        "concurrency": concurrency,
+        "turns": len(results),
+        "errors": len(errors),
+        "time_to_first_audio_ms": percentiles(
+            [r.time_to_first_audio_s for r in results if r.time_to_first_audio_s is not None]
+        ),
+        "turn_latency_ms": percentiles([r.turn_latency_s for r in results]),
+    }
+    if monitor is not None and monitor.pid is not None:
+        summary["cpu_percent"] = round(monitor.cpu_percent, 1)
+        summary["peak_rss_mb"] = round(monitor.peak_rss / 2**20, 1)
+    return summary
+
+
+def run_level(url: str, frames: List[str], speech_frames: int, concurrency: int, args,
+              server_pid: Optional[int]) -> Dict:
+    results: List[TurnResult] = []
+    errors: List[str] = []
+    # Candidates start spread over the ramp, the same way on every run
+    rng = random.Random(args.seed + concurrency)
+    threads = [
+        threading.Thread(
+            target=run_candidate,
+            args=(url, frames, speech_frames, args, rng.uniform(0, args.ramp_s), results, errors),
+            daemon=True,
+        )
+        for _ in range(concurrency)
+    ]
+    with ServerMonitor(server_pid) as monitor:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    for error in sorted(set(errors)):
+        print(f"  error: {error}", file=sys.stderr)
+    return summarize(concurrency, results, errors, monitor)
+
+
+def compare(levels: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """List the regressions of a run against a baseline run, by concurrency level.
+
+    Latency p95, CPU and peak RSS may grow by `tolerance` (0.2 = 20%); errors
+    may not grow at all.
+    """
+    regressions = []
+    base_levels = {level["concurrency"]: level for level in baseline}
+    for level in levels:
+        base = base_levels.get(level["concurrency"])
+        if base is None:
+            continue
+        name = f"concurrency {level['concurrency']}"
+        for metric in ("time_to_first_audio_ms", "turn_latency_ms"):
+            now, then = level[metric].get("p95"), base[metric].get("p95")
+            if now is not None and then and now > then * (1 + tolerance):
+                regressions.append(f"{name}: {metric} p95 {then} -> {now}")
+        for metric in ("cpu_percent", "peak_rss_mb"):
+            now, then = level.get(metric), base.get(metric)
+            if now is not None and then and now > then * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {then} -> {now}")
+        if level["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {level['errors']}")
+    return regressions
+
+
+def print_table(levels: List[Dict]) -> None:
+    print(
+        f"{'clients':>7} {'turns':>5} {'errors':>6} "
+        f"{'TTFA p50':>9} {'p95':>7} {'p99':>7} {'turn p50':>9} {'p95':>7} {'p99':>7} "
+        f"{'CPU %':>6} {'RSS MB':>7}"
+    )
+    for level in levels:
+        ttfa, turn = level["time_to_first_audio_ms"], level["turn_latency_ms"]
+        print(
+            f"{level['concurrency']:>7} {level['turns']:>5} {level['errors']:>6} "
+            f"{ttfa.get('p50', '-'):>9} {ttfa.get('p95', '-'):>7} {ttfa.get('p99', '-'):>7} "
+            f"{turn.get('p50', '-'):>9} {turn.get('p95', '-'):>7} {turn.get('p99', '-'):>7} "
+            f"{level.get('cpu_percent', '-'):>6} {level.get('peak_rss_mb', '-'):>7}"
+        )
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(args) -> subprocess.Popen:
+    """Start `serve` in a subprocess and wait until it accepts connections."""
+    command = [
+        sys.executable, "-m", "tests.load_harness", "serve",
+        "--port", str(args.port), "--config", args.config,
+        "--asr-ms", str(args.asr_ms), "--tts-ms", str(args.tts_ms),
+        "--llm-first-token-ms", str(args.llm_first_token_ms),
+        "--llm-token-ms", str(args.llm_token_ms),
+    ] + (["--server-vad"] if args.server_vad else [])
+    process = subprocess.Popen(command, cwd=ROOT)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"Server exited with code {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", args.port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise SystemExit("Server did not start in time")
+
+
+def run(args) -> int:
+    answer = load_answer(args.audio) if args.audio else synthetic_answer(seed=args.seed)
+    frames = answer_frames(answer, args.server_vad)
+    speech_frames = len(frames)
+    if args.server_vad:
+        # Trailing silence, for the VAD to find the end of speech
+        frames += answer_frames(np.zeros(SAMPLE_RATE, dtype=np.float32), True)
+
+    process = None
+    server_pid = args.server_pid
+    url = args.url
+    if url is None:
+        args.port = args.port or free_port()
+        process = start_server(args)
+        server_pid = process.pid
+        url = f"ws://127.0.0.1:{args.port}/client-ws"
+    if server_pid is not None and not os.path.exists(f"/proc/{server_pid}"):
+        print("CPU and RSS are only measured on Linux", file=sys.stderr)
+        server_pid = None
+
+    levels = []
+    try:
+        for concurrency in args.concurrency:
+            print(f"Running {concurrency} candidates x {args.turns} turns...", file=sys.stderr)
+            levels.append(run_level(url, frames, speech_frames, concurrency, args, server_pid))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+    print_table(levels)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"fakes": fake_latencies(args), "levels": levels}, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("fakes") != fake_latencies(args):
+            print("Baseline used other fake latencies, the comparison may not hold", file=sys.stderr)
+        regressions = compare(levels, baseline["levels"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+def fake_latencies(args) -> Dict[str, float]:
+    return {
+        "asr_ms": args.asr_ms,
+        "llm_first_token_ms": args.llm_first_token_ms,
+        "llm_token_ms": args.llm_token_ms,
+        "tts_ms": args.tts_ms,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test of the interview server")
+    parser.add_argument("command", nargs="?", choices=("run", "serve"), default="run")
+    parser.add_argument("--concurrency", type=lambda s: [int(n) for n in s.split(",")], default=[1, 4, 16],
+                        help="Comma-separated numbers of concurrent candidates")
+    parser.add_argument("--turns", type=int, default=3, help="Answers per candidate")
+    parser.add_argument("--think-s", type=float, default=1.0, help="Pause between a reply and the next answer")
+    parser.add_argument("--ramp-s", type=float, default=2.0, help="Candidates connect spread over this time")
+    parser.add_argument("--turn-timeout", type=float, default=60.0)
+    parser.add_argument("--audio", help="16 kHz mono 16-bit WAV answer, synthetic if omitted")
+    parser.add_argument("--server-vad", action="store_true", help="Stream raw-audio-data through the server VAD")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="Server to test, e.g. ws://host:12393/client-ws. Started with the fakes if omitted")
+    parser.add_argument("--server-pid", type=int, help="PID of the --url server, to measure its CPU and RSS")
+    parser.add_argument("--port", type=int, default=0, help="Port of the started server, any free port if 0")
+    parser.add_argument("--config", default="conf.yaml")
+    parser.add_argument("--asr-ms", type=float, default=300)
+    parser.add_argument("--llm-first-token-ms", type=float, default=500)
+    parser.add_argument("--llm-token-ms", type=float, default=30)
+    parser.add_argument("--tts-ms", type=float, default=400)
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Results JSON of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed growth over the baseline")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command == "serve":
+        serve(args)
+    else:
+        sys.exit(run(args))
@@ -0,0 +1,78 @@
+
+import unittest
+import asyncio
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from tests.bench_text_stream import (
+    LIVE2D_MODEL,
+    MODEL_DICT_PATH,
+    build_chain,
+    compare,
+    load_streams,
+    replay_stream,
+)
+from src.open_llm_vtuber.live2d_model import Live2dModel
+
+def result(calibration_us, **row):
+    stream = {
+        "sentences": 5,
+        "us_per_token": 50.0,
+        "us_per_sentence": 800.0,
+        "extract_emotion_us_per_sentence": 0.3,
+        "tts_filter_us_per_sentence": 40.0,
+        "peak_kib": 27.0,
+        "retained_blocks_per_replay": 0.5,
+    }
+    stream.update(row)
+    return {"calibration_us": calibration_us, "streams": {"korean": stream}}
+
+class TestReplay(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.streams = load_streams()
+        cls.model = Live2dModel(LIVE2D_MODEL, model_dict_path=MODEL_DICT_PATH)
+
+    def setUp(self):
+        self.chain = build_chain(self.model, segment_method="regex")
+
+    def replay(self, name):
+        loop = asyncio.new_event_loop()
+        try:
+            return replay_stream(self.chain, self.streams[name], loop)
+        finally:
+            loop.close()
+
+    def test_recorded_streams(self):
+        self.assertEqual(set(self.streams), {"english", "korean", "mixed", "tag_heavy"})
+        for name in self.streams:
+            self.assertGreater(len(self.replay(name)), 1, name)
+
+    def test_tags_reach_the_outputs(self):
+        outputs = self.replay("tag_heavy")
+        # Think blocks are shown in parentheses and not spoken
+        self.assertEqual(outputs[0].display_text.text, "(")
+        self.assertEqual(outputs[0].tts_text, "")
+        self.assertTrue(any(output.actions.expressions for output in outputs))
+
+class TestCompare(unittest.TestCase):
+    def test_within_tolerance(self):
+        self.assertEqual(compare(result(100, us_per_token=60.0), result(100), 0.3), [])
+
+    def test_timings_scale_with_calibration(self):
+        # Twice slower on a twice slower machine
+        slower = result(200, us_per_token=100.0, us_per_sentence=1600.0)
+        self.assertEqual(compare(slower, result(100), 0.3), [])
+
+    def test_regressions(self):
+        regressions = compare(
+            result(100, us_per_token=80.0, retained_blocks_per_replay=10.0), result(100), 0.3
+        )
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("korean: us_per_token"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+
+import unittest
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.core.utils.sentence_divider import SentenceDivider, budget_splitter
+from src.app.core.utils.tts_latency import TTSLatencyTracker
+
+KOREAN_TEXT = "안녕하세요 저는 오늘 여러분과 함께 기술 면접을 진행할 면접관입니다 반갑습니다."
+
+async def _stream(tokens, delay=0.0):
+    for token in tokens:
+        if delay:
+            await asyncio.sleep(delay)
+        yield token
+
+def _divide(tokens, delay=0.0, **kwargs):
+    divider = SentenceDivider(segment_method="regex", **kwargs)
+
+    async def collect():
+        return [s.text async for s in divider.process_stream(_stream(tokens, delay))]
+
+    return asyncio.run(collect())
+
+class TestFirstChunkBudget(unittest.TestCase):
+    def setUp(self):
+        TTSLatencyTracker.get_instance().reset()
+
+    def test_budget_splitter_keeps_words(self):
+        self.assertEqual(
+            budget_splitter("hello there general kenobi", 15, 5),
+            ("hello there", "general kenobi"),
+        )
+        self.assertEqual(budget_splitter("短い文章です", 3, 1), ("短い文", "章です"))
+        self.assertEqual(budget_splitter("hi", 10, 1), ("", "hi"))
+
+    def test_first_chunk_split_without_comma(self):
+        sentences = _divide(list(KOREAN_TEXT), first_chunk_wait_ms=0)
+        self.assertEqual(len(sentences), 2)
+        self.assertLessEqual(len(sentences[0]), 20)
+        self.assertEqual(" ".join(sentences), KOREAN_TEXT)
+
+    def test_time_budget_emits_early(self):
+        sentences = _divide(list(KOREAN_TEXT), delay=0.01, first_chunk_wait_ms=50)
+        self.assertEqual(sentences[0], "안녕하세요 저는")
+
+    def test_chunk_size_follows_tts_latency(self):
+        tracker = TTSLatencyTracker.get_instance()
+        self.assertEqual(tracker.first_chunk_chars(8, 40), 20)
+        tracker.record(1.0)
+        self.assertEqual(tracker.first_chunk_chars(8, 40), 12)
+        tracker.record(10.0)
+        self.assertEqual(tracker.first_chunk_chars(8, 40), 40)
+
+    def test_comma_still_preferred(self):
+        self.assertEqual(
+            _divide(list("Hello, world. Bye.")), ["Hello,", "world.", "Bye."]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+
+import unittest
+import asyncio
+import importlib
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+# The conversation modules import these from their old place in
+# src.open_llm_vtuber, they now live in src.app.core
+LEGACY_MODULES = (
+    ("src.open_llm_vtuber.message_handler", "src.app.core.chat.message_handler"),
+    ("src.open_llm_vtuber.chat_history_manager", "src.app.core.chat.history_manager"),
+    ("src.open_llm_vtuber.utils", "src.app.core.utils"),
+)
+
+# Patched into sys.modules for this module's tests only, with whatever
+# they import, so other tests don't see the aliases
+_modules = patch.dict(sys.modules)
+group_conversation = None
+output_types = None
+
+def setUpModule():
+    global group_conversation, output_types
+    _modules.start()
+    for old, new in LEGACY_MODULES:
+        sys.modules[old] = importlib.import_module(new)
+    group_conversation = importlib.import_module(
+        "src.open_llm_vtuber.conversations.group_conversation"
+    )
+    output_types = importlib.import_module("src.open_llm_vtuber.agent.output_types")
+
+def tearDownModule():
+    _modules.stop()
+
+class FakeConnection:
+    def __init__(self, uid, log):
+        self.uid = uid
+        self.log = log
+
+    async def send_json(self, data):
+        self.log.append((self.uid, data.get("type")))
+
+class FakeAgent:
+    """Keeps a memory like BasicMemoryAgent, written to by fake_generate."""
+
+    def __init__(self):
+        self.memory = []
+
+    def memory_checkpoint(self):
+        return len(self.memory)
+
+    def rollback_memory(self, checkpoint):
+        del self.memory[checkpoint:]
+
+def _context(name):
+    return SimpleNamespace(
+        character_config=SimpleNamespace(
+            character_name=name, human_name="Human", conf_uid=name, avatar=None
+        ),
+        history_uid="h",
+        system_config=None,
+        agent_engine=FakeAgent(),
+    )
+
+class TestTurnGate(unittest.TestCase):
+    def test_closed_gate_replays_in_order(self):
+        sent = []
+
+        async def send(frame):
+            sent.append(frame)
+
+        async def run():
+            gate = group_conversation.TurnGate(is_open=False)
+            gated = gate.wrap(send)
+            await gated("a")
+            await gated("b")
+            self.assertEqual(sent, [])
+            await gate.open()
+            await gated("c")
+
+        asyncio.run(run())
+        self.assertEqual(sent, ["a", "b", "c"])
+
+class TestSpeculativeResponse(unittest.TestCase):
+    def test_closed_gate_pauses_after_first_sentence(self):
+        processed = []
+
+        async def chat(batch_input):
+            for i in range(3):
+                yield output_types.SentenceOutput(
+                    display_text=output_types.DisplayText(text=f"s{i}"), tts_text=f"s{i}", actions=output_types.Actions()
+                )
+
+        async def fake_process(output, **kwargs):
+            processed.append(output.tts_text)
+            return output.tts_text
+
+        context = _context("A")
+        context.agent_engine.chat = chat
+        context.live2d_model = context.tts_engine = context.translate_engine = None
+
+        async def run():
+            gate = group_conversation.TurnGate(is_open=False)
+            response = asyncio.create_task(
+                group_conversation.process_member_response(
+                    context=context,
+                    batch_input=None,
+                    current_ws_send=gate.wrap(self._send),
+                    tts_manager=None,
+                    gate=gate,
+                )
+            )
+            await asyncio.sleep(0.01)
+            self.assertEqual(processed, ["s0"])
+            await gate.open()
+            return await response
+
+        with patch.object(group_conversation, "process_agent_output", fake_process):
+            full_response = asyncio.run(run())
+        self.assertEqual(full_response, "s0s1s2")
+        self.assertEqual(processed, ["s0", "s1", "s2"])
+
+    async def _send(self, data):
+        pass
+
+class TestPipelinedGroupConversation(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.contexts = {uid: _context(uid) for uid in ("A", "B")}
+        self.connections = {uid: FakeConnection(uid, self.events) for uid in ("A", "B")}
+
+    def _conversation(self, pipelined, playback_s=0.01, turns=3):
+        events = self.events
+
+        async def fake_generate(member_uid, state, context, ws_send, **kwargs):
+            context.agent_engine.memory.append(("user", state.conversation_history[-1]))
+            context.agent_engine.memory.append(("assistant", f"{member_uid} reply"))
+            events.append((member_uid, "generate"))
+            await ws_send({"type": "audio"})
+            return f"reply {len(state.conversation_history)}"
+
+        async def fake_finalize(tts_manager, websocket_send, client_uid, broadcast_ctx=None):
+            events.append((client_uid, "playback"))
+            await asyncio.sleep(playback_s)
+            if sum(1 for _, e in events if e == "playback") >= turns:
+                raise asyncio.CancelledError()
+
+        async def fake_input(user_input, **kwargs):
+            return user_input
+
+        async def broadcast(members, message, exclude_uid=None):
+            pass
+
+        async def never_done():
+            await asyncio.sleep(0)
+
+        def start_turn(*args, **kwargs):
+            turn = real_start(*args, **kwargs)
+            # Give every turn audio, so it waits for playback
+            turn.tts_manager.task_list.append(asyncio.ensure_future(never_done()))
+            return turn
+
+        real_start = group_conversation.start_member_turn
+        for name, fake in (
+            ("generate_member_response", fake_generate),
+            ("finalize_conversation_turn", fake_finalize),
+            ("process_group_input", fake_input),
+            ("init_group_conversation_contexts", lambda c: None),
+            ("store_message", lambda **kw: None),
+            ("start_member_turn", start_turn),
+        ):
+            patcher = patch.object(group_conversation, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        return group_conversation.process_group_conversation(
+            client_contexts=self.contexts,
+            client_connections=self.connections,
+            broadcast_func=broadcast,
+            group_members=["A", "B"],
+            initiator_client_uid="A",
+            user_input="hello",
+            pipelined=pipelined,
+        )
+
+    def _run(self, pipelined):
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(self._conversation(pipelined))
+        return self.events
+
+    def test_next_member_generates_during_playback(self):
+        events = self._run(pipelined=True)
+        # B generated before A's playback finished, but its audio was held back
+        self.assertLess(events.index(("B", "generate")), events.index(("A", "playback")))
+        self.assertGreater(events.index(("B", "audio")), events.index(("A", "playback")))
+
+    def test_sequential_mode(self):
+        events = self._run(pipelined=False)
+        self.assertGreater(events.index(("B", "generate")), events.index(("A", "playback")))
+
+    def test_interrupt_during_speculation_rolls_back_memory(self):
+        async def run():
+            # Interrupted during A's playback, like handle_group_interrupt does
+            task = asyncio.create_task(self._conversation(pipelined=True, playback_s=10))
+            while ("B", "generate") not in self.events:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        # A's spoken turn stays in memory, B's unheard reply is dropped
+        self.assertEqual(self.contexts["A"].agent_engine.memory[-1], ("assistant", "A reply"))
+        self.assertEqual(self.contexts["B"].agent_engine.memory, [])
+        self.assertNotIn(("B", "audio"), self.events)
+
+if __name__ == '__main__':
+    unittest.main()
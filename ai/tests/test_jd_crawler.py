@@ -0,0 +1,119 @@
+
+import unittest
+import asyncio
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.open_llm_vtuber.agent.rag.jd_crawler import JDCrawler, JDCrawlError, extract_jd_text
+
+class CountingCrawler(JDCrawler):
+    """JDCrawler with the network fetch replaced by a counter."""
+
+    def __init__(self, fail=False, **kwargs):
+        super().__init__(**kwargs)
+        self.fetches = 0
+        self.fail = fail
+
+    async def _fetch(self, url):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise JDCrawlError("boom")
+        return f"text of {url}"
+
+class TestJDCrawler(unittest.TestCase):
+    def test_cache_hit(self):
+        crawler = CountingCrawler()
+
+        async def run():
+            first = await crawler.crawl("https://jobs.example/1")
+            second = await crawler.crawl("https://jobs.example/1")
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(first, second)
+        self.assertEqual(crawler.fetches, 1)
+
+    def test_cache_expires(self):
+        crawler = CountingCrawler(cache_ttl=0)
+
+        async def run():
+            await crawler.crawl("https://jobs.example/1")
+            await crawler.crawl("https://jobs.example/1")
+
+        asyncio.run(run())
+        self.assertEqual(crawler.fetches, 2)
+
+    def test_concurrent_requests_share_fetch(self):
+        crawler = CountingCrawler()
+
+        async def run():
+            return await asyncio.gather(*[crawler.crawl("https://jobs.example/1") for _ in range(5)])
+
+        results = asyncio.run(run())
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(crawler.fetches, 1)
+
+    def test_cancelled_request_keeps_shared_fetch(self):
+        crawler = CountingCrawler()
+
+        async def run():
+            first = asyncio.create_task(crawler.crawl("https://jobs.example/1"))
+            second = asyncio.create_task(crawler.crawl("https://jobs.example/1"))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.gather(first, return_exceptions=True)
+            return first, await second
+
+        first, text = asyncio.run(run())
+        self.assertTrue(first.cancelled())
+        self.assertEqual(text, "text of https://jobs.example/1")
+        self.assertEqual(crawler.fetches, 1)
+
+    def test_fetch_cancelled_without_waiters(self):
+        crawler = CountingCrawler()
+
+        async def run():
+            request = asyncio.create_task(crawler.crawl("https://jobs.example/1"))
+            await asyncio.sleep(0)
+            fetch = crawler._inflight["https://jobs.example/1"]
+            request.cancel()
+            await asyncio.gather(request, fetch, return_exceptions=True)
+            return fetch
+
+        fetch = asyncio.run(run())
+        self.assertTrue(fetch.cancelled())
+        self.assertEqual(crawler._inflight, {})
+        self.assertEqual(crawler._waiters, {})
+        self.assertEqual(crawler._cache, {})
+
+    def test_failures_not_cached(self):
+        crawler = CountingCrawler(fail=True)
+
+        async def run():
+            for _ in range(2):
+                with self.assertRaises(JDCrawlError):
+                    await crawler.crawl("https://jobs.example/1")
+
+        asyncio.run(run())
+        self.assertEqual(crawler.fetches, 2)
+
+    def test_cache_size_bounded(self):
+        crawler = CountingCrawler(cache_size=2)
+
+        async def run():
+            for i in range(3):
+                await crawler.crawl(f"https://jobs.example/{i}")
+
+        asyncio.run(run())
+        self.assertEqual(list(crawler._cache), ["https://jobs.example/1", "https://jobs.example/2"])
+
+    def test_extract_text(self):
+        html = b"<html><head><script>var x;</script></head><body><nav>Menu</nav><h1>Backend Engineer</h1><p>Python  FastAPI</p></body></html>"
+        self.assertEqual(extract_jd_text(html), "Backend Engineer\nPython\nFastAPI")
+
+if __name__ == '__main__':
+    unittest.main()
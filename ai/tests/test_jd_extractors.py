@@ -0,0 +1,89 @@
+
+import unittest
+import json
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.open_llm_vtuber.agent.rag.jd_extractors import extract_jd_text, MAX_JD_CHARS
+
+JOB_POSTING = {
+    "@context": "https://schema.org",
+    "@graph": [
+        {"@type": "WebPage", "name": "채용공고"},
+        {
+            "@type": "JobPosting",
+            "title": "백엔드 개발자",
+            "hiringOrganization": {"@type": "Organization", "name": "스택로드"},
+            "jobLocation": {"@type": "Place", "address": {"@type": "PostalAddress", "addressLocality": "서울"}},
+            "employmentType": "FULL_TIME",
+            "description": "<p>Python <b>백엔드</b> 개발자를 찾습니다.</p><ul><li>FastAPI 경험</li><li>AWS 경험</li></ul>",
+        },
+    ],
+}
+
+NEXT_DATA = {
+    "props": {
+        "pageProps": {
+            "user": {"name": "guest"},
+            "job": {
+                "position": "Frontend Engineer",
+                "company": {"name": "Wanted Lab"},
+                "skill_tags": [{"title": "React"}, {"title": "TypeScript"}],
+                "detail": {
+                    "intro": "HR 플랫폼을 만듭니다.",
+                    "main_tasks": "• 웹 프론트엔드 개발",
+                    "requirements": "• React 3년 이상",
+                    "preferred_points": "• Next.js 경험",
+                },
+            },
+        }
+    }
+}
+
+def _page(body, head=""):
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+class TestJDExtractors(unittest.TestCase):
+    def test_json_ld_job_posting(self):
+        script = f'<script type="application/ld+json">{json.dumps(JOB_POSTING, ensure_ascii=False)}</script>'
+        text = extract_jd_text(_page("<nav>메뉴</nav><p>배너</p>", head=script), "https://www.saramin.co.kr/jobs/1")
+
+        self.assertTrue(text.startswith("Position: 백엔드 개발자\nCompany: 스택로드\nLocation: 서울"))
+        self.assertIn("[Introduction]\nPython 백엔드 개발자를 찾습니다.\n- FastAPI 경험\n- AWS 경험", text)
+        self.assertNotIn("배너", text)
+
+    def test_next_data(self):
+        script = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(NEXT_DATA, ensure_ascii=False)}</script>'
+        text = extract_jd_text(_page(script), "https://www.wanted.co.kr/wd/1")
+
+        self.assertTrue(text.startswith("Position: Frontend Engineer\nCompany: Wanted Lab"))
+        sections = [line for line in text.splitlines() if line.startswith("[")]
+        self.assertEqual(sections, ["[Introduction]", "[Main tasks]", "[Requirements]", "[Preferred]", "[Tech stack]"])
+        self.assertIn("[Tech stack]\nReact, TypeScript", text)
+
+    def test_main_content(self):
+        paragraphs = "".join(
+            f"<p>{i}. 대규모 데이터 파이프라인을 설계하고, Spark와 Kafka를 운영합니다.</p>" for i in range(4)
+        )
+        body = (
+            '<div class="gnb"><a href="/">채용</a><a href="/c">기업</a></div>'
+            f'<div id="content"><div class="job-detail"><h1>데이터 엔지니어</h1>{paragraphs}</div>'
+            '<div class="recommend-list"><a href="/2">다른 공고 보기 다른 공고 보기 다른 공고</a></div></div>'
+            "<footer>사업자등록번호 대표이사 주소</footer>"
+        )
+        text = extract_jd_text(_page(body), "https://careers.example.com/jobs/1")
+
+        self.assertTrue(text.startswith("데이터 엔지니어\n0. 대규모"))
+        self.assertNotIn("다른 공고", text)
+        self.assertNotIn("채용", text)
+        self.assertNotIn("사업자등록번호", text)
+
+    def test_fallback_is_bounded(self):
+        text = extract_jd_text(_page("<div>" + "가" * (MAX_JD_CHARS * 2) + "</div>"))
+        self.assertEqual(len(text), MAX_JD_CHARS + len("...(truncated)"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.open_llm_vtuber.mcpp.json_detector import StreamJSONDetector
+
+class TestStreamJSONDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = StreamJSONDetector()
+
+    def test_json_split_across_chunks(self):
+        chunks = ["Sure! {", '"mcp_server": "time", ', '"tool": "now", "arguments": {}', "} done"]
+        results = [self.detector.process_chunk(chunk) for chunk in chunks]
+
+        self.assertEqual(results[:3], [[], [], []])
+        self.assertEqual(results[3], [{"mcp_server": "time", "tool": "now", "arguments": {}}])
+
+    def test_nested_object_is_returned_once(self):
+        result = self.detector.process_chunk('{"a": {"b": {"c": 1}}}')
+        self.assertEqual(result, [{"a": {"b": {"c": 1}}}])
+
+    def test_braces_inside_strings(self):
+        result = self.detector.process_chunk('{"text": "a } b { c", "quote": "\\"}"}')
+        self.assertEqual(result, [{"text": "a } b { c", "quote": '"}'}])
+
+    def test_stray_braces_in_prose(self):
+        result = self.detector.process_chunk('use {name} or a { brace, then {"x": 1} ')
+        self.assertEqual(result, [{"x": 1}])
+
+    def test_buffer_released_after_object_closes(self):
+        self.detector.process_chunk('text {"x": 1} more text')
+        self.assertEqual(self.detector.buffer, "")
+        self.assertEqual(self.detector.get_all_jsons(), [{"x": 1}])
+
+    def test_reset(self):
+        self.detector.process_chunk('{"x": ')
+        self.detector.reset()
+        self.assertEqual(self.detector.process_chunk('{"y": 2}'), [{"y": 2}])
+
+if __name__ == '__main__':
+    unittest.main()
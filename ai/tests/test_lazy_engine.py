@@ -0,0 +1,119 @@
+
+import unittest
+import asyncio
+import threading
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.core.utils.lazy_engine import LazyEngine, resolve_engine
+from src.app.bootstrap.import_profile import parse_importtime, profile_imports, time_by_package
+
+class FakeEngine:
+    def __init__(self):
+        self.voice = "default"
+
+    def speak(self, text):
+        return f"{self.voice}: {text}"
+
+class TestLazyEngine(unittest.TestCase):
+    def test_built_on_first_use(self):
+        builds = []
+        engine = LazyEngine("TTS", lambda: builds.append(1) or FakeEngine())
+        self.assertFalse(engine.built)
+        self.assertEqual(builds, [])
+        self.assertEqual(engine.speak("hi"), "default: hi")
+        engine.voice = "other"
+        self.assertEqual(engine.speak("hi"), "other: hi")
+        self.assertTrue(engine.built)
+        self.assertEqual(builds, [1])
+
+    def test_concurrent_first_use_builds_once(self):
+        builds = []
+        barrier = threading.Barrier(4)
+
+        def factory():
+            builds.append(1)
+            return FakeEngine()
+
+        engine = LazyEngine("ASR", factory)
+
+        def use():
+            barrier.wait()
+            engine.get()
+
+        threads = [threading.Thread(target=use) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(builds, [1])
+
+    def test_warm_up_failure_is_not_raised(self):
+        def factory():
+            raise RuntimeError("model missing")
+
+        engine = LazyEngine("VAD", factory)
+        self.assertIsNone(asyncio.run(engine.warm_up()))
+        self.assertFalse(engine.built)
+
+    def test_failed_build_is_not_retried(self):
+        builds = []
+
+        def factory():
+            builds.append(1)
+            raise RuntimeError("model missing")
+
+        engine = LazyEngine("TTS", factory)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                engine.speak("hi")
+        self.assertEqual(builds, [1])
+        self.assertIn("failed", repr(engine))
+
+    def test_resolve_builds_off_the_event_loop(self):
+        release = threading.Event()
+
+        def factory():
+            release.wait(5)
+            return FakeEngine()
+
+        engine = LazyEngine("VAD", factory)
+
+        async def run():
+            warm_up = asyncio.create_task(engine.warm_up())
+            resolved = asyncio.create_task(resolve_engine(engine))
+            # The loop keeps running while both wait for the build
+            await asyncio.sleep(0.05)
+            self.assertFalse(resolved.done())
+            release.set()
+            return await resolved, await warm_up
+
+        resolved, warmed_up = asyncio.run(run())
+        self.assertIsInstance(resolved, FakeEngine)
+        self.assertIs(resolved, warmed_up)
+
+    def test_resolve_plain_engine(self):
+        fake = FakeEngine()
+        self.assertIs(asyncio.run(resolve_engine(fake)), fake)
+
+class TestImportProfile(unittest.TestCase):
+    def test_parse_importtime(self):
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:       300 |        420 | json\n"
+            "some other stderr line\n"
+        )
+        rows = parse_importtime(output)
+        self.assertEqual([(r.module, r.self_us, r.cumulative_us) for r in rows], [("json.decoder", 120, 120), ("json", 300, 420)])
+        self.assertEqual(time_by_package(rows), {"json": 420})
+
+    def test_profile_stdlib_module(self):
+        modules = {row.module for row in profile_imports("email.parser")}
+        self.assertIn("email.parser", modules)
+
+if __name__ == '__main__':
+    unittest.main()
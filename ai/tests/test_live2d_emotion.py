@@ -0,0 +1,35 @@
+
+import unittest
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.open_llm_vtuber.live2d_model import Live2dModel
+
+MODEL_DICT_PATH = os.path.join(os.path.dirname(__file__), "..", "model_dict.json")
+
+class TestLive2dEmotion(unittest.TestCase):
+    def setUp(self):
+        self.model = Live2dModel("mao_pro", model_dict_path=MODEL_DICT_PATH)
+
+    def test_extract_emotion(self):
+        text = "[Joy] Nice to meet you. [sadness]Bye [unknown] [joy"
+        self.assertEqual(
+            self.model.extract_emotion(text),
+            [self.model.emo_map["joy"], self.model.emo_map["sadness"]],
+        )
+
+    def test_remove_emotion_keywords(self):
+        text = "[Joy] Nice to meet you. [sadness]Bye [unknown]"
+        self.assertEqual(
+            self.model.remove_emotion_keywords(text), " Nice to meet you. Bye [unknown]"
+        )
+
+    def test_no_tags(self):
+        self.assertEqual(self.model.extract_emotion("plain text"), [])
+        self.assertEqual(self.model.remove_emotion_keywords("plain"), "plain")
+
+if __name__ == '__main__':
+    unittest.main()
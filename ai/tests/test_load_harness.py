@@ -0,0 +1,98 @@
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import wave
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from tests.load_harness import (
+    FakeLLM,
+    FakeTTS,
+    RESPONSE,
+    TurnResult,
+    answer_frames,
+    compare,
+    cpu_seconds,
+    percentiles,
+    process_tree,
+    summarize,
+    synthetic_answer,
+)
+
+def level(concurrency, ttfa_p95, turn_p95, errors=0, **extra):
+    return {
+        "concurrency": concurrency,
+        "errors": errors,
+        "time_to_first_audio_ms": {"p95": ttfa_p95},
+        "turn_latency_ms": {"p95": turn_p95},
+        **extra,
+    }
+
+class TestStatistics(unittest.TestCase):
+    def test_percentiles_nearest_rank(self):
+        values = [i / 1000 for i in range(1, 101)]
+        self.assertEqual(percentiles(values), {"p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0})
+        self.assertEqual(percentiles([0.2])["p99"], 200.0)
+        self.assertEqual(percentiles([]), {})
+
+    def test_summary_skips_turns_without_audio(self):
+        summary = summarize(2, [TurnResult(0.5, 2.0), TurnResult(None, 1.0)], ["boom"])
+        self.assertEqual(summary["turns"], 2)
+        self.assertEqual(summary["errors"], 1)
+        self.assertEqual(summary["time_to_first_audio_ms"]["max"], 500.0)
+        self.assertEqual(summary["turn_latency_ms"]["max"], 2000.0)
+        self.assertNotIn("cpu_percent", summary)
+
+class TestCompare(unittest.TestCase):
+    def test_within_tolerance(self):
+        baseline = [level(4, 1000, 3000, cpu_percent=50, peak_rss_mb=400)]
+        run = [level(4, 1150, 3100, cpu_percent=55, peak_rss_mb=410), level(8, 9000, 9000)]
+        self.assertEqual(compare(run, baseline, 0.2), [])
+
+    def test_regressions(self):
+        baseline = [level(4, 1000, 3000, cpu_percent=50, peak_rss_mb=400)]
+        run = [level(4, 1300, 3000, errors=1, cpu_percent=80, peak_rss_mb=400)]
+        regressions = compare(run, baseline, 0.2)
+        self.assertEqual(len(regressions), 3)
+        self.assertTrue(regressions[0].startswith("concurrency 4: time_to_first_audio_ms"))
+
+class TestFakes(unittest.TestCase):
+    def test_llm_streams_the_response(self):
+        async def collect():
+            return [token async for token in FakeLLM(0, 0).chat_completion([])]
+
+        self.assertEqual("".join(asyncio.run(collect())), RESPONSE)
+
+    def test_tts_writes_speech_length_silence(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                path = asyncio.run(FakeTTS(0).async_generate_audio("x" * 100, "answer"))
+                with wave.open(path) as f:
+                    seconds = f.getnframes() / f.getframerate()
+            finally:
+                os.chdir(cwd)
+        self.assertAlmostEqual(seconds, 7.0)
+
+    def test_answer_frames_are_reproducible(self):
+        frames = answer_frames(synthetic_answer(seconds=1.0), server_vad=False)
+        self.assertEqual(frames, answer_frames(synthetic_answer(seconds=1.0), server_vad=False))
+        self.assertEqual(len(frames), 10)
+        message = json.loads(frames[0])
+        self.assertEqual(message["type"], "mic-audio-data")
+        self.assertEqual(len(message["audio"]), 1600)
+
+class TestServerMeasurement(unittest.TestCase):
+    @unittest.skipUnless(os.path.exists("/proc/self/stat"), "needs /proc")
+    def test_own_process(self):
+        self.assertEqual(process_tree(os.getpid())[0], os.getpid())
+        self.assertGreater(cpu_seconds(os.getpid()), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.open_llm_vtuber.mcpp.mcp_client import MCPClient, _PooledSession
+from src.open_llm_vtuber.mcpp.server_registry import ServerRegistry
+
+class FakeSession:
+    def __init__(self, client):
+        self.client = client
+
+    async def call_tool(self, tool_name, tool_args):
+        self.client.active += 1
+        self.client.peak = max(self.client.peak, self.client.active)
+        try:
+            await asyncio.sleep(tool_args.get("delay", 0.01))
+        finally:
+            self.client.active -= 1
+        return SimpleNamespace(isError=False, content=[SimpleNamespace(type="text", text=tool_name)])
+
+class FakePoolClient(MCPClient):
+    """MCPClient whose sessions are in-process, optionally failing to start."""
+
+    def __init__(self, registry, failures=0):
+        super().__init__(registry)
+        self.failures = failures
+        self.started = 0
+        self.active = 0
+        self.peak = 0
+
+    async def _start_session(self, server_name):
+        await asyncio.sleep(0.01)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("server did not start")
+        self.started += 1
+        task = asyncio.create_task(self._closing.wait())
+        self._session_tasks.add(task)
+        task.add_done_callback(self._session_tasks.discard)
+        return _PooledSession(session=FakeSession(self), task=task)
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "mcp_servers.json")
+        with open(path, "w") as f:
+            json.dump(
+                {"mcp_servers": {"fake": {"command": "fake", "args": [], "max_sessions": 2}}}, f
+            )
+        self.registry = ServerRegistry(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_concurrent_calls_share_the_pool(self):
+        async def run():
+            client = FakePoolClient(self.registry)
+            results = await asyncio.gather(
+                *(client.call_tool("fake", f"tool{i}", {}) for i in range(6))
+            )
+            await client.aclose()
+            return client, results
+
+        client, results = asyncio.run(run())
+        texts = [result["content_items"][0]["text"] for result in results]
+        self.assertEqual(texts, [f"tool{i}" for i in range(6)])
+        self.assertEqual(client.started, 2)
+        self.assertEqual(client.peak, 2)
+
+    def test_failed_start_wakes_waiters(self):
+        async def run():
+            client = FakePoolClient(self.registry, failures=2)
+            results = await asyncio.gather(
+                *(client.call_tool("fake", "tool", {}) for _ in range(3)),
+                return_exceptions=True,
+            )
+            await client.aclose()
+            return client, results
+
+        client, results = asyncio.run(run())
+        # The two first starts fail, the third caller gets the freed slot
+        self.assertEqual([isinstance(result, RuntimeError) for result in results], [True, True, False])
+        self.assertEqual(client.started, 1)
+
+    def test_dead_session_frees_its_slot(self):
+        async def run():
+            client = FakePoolClient(self.registry)
+            await client.call_tool("fake", "tool", {})
+            pool = client._pools["fake"]
+            dead = pool.idle[0].task
+            dead.cancel()
+            await asyncio.gather(dead, return_exceptions=True)
+            self.assertNotIn(dead, client._session_tasks)
+
+            await client.call_tool("fake", "tool", {})
+            size = pool.size
+            await client.aclose()
+            return client, size
+
+        client, size = asyncio.run(run())
+        self.assertEqual(client.started, 2)
+        self.assertEqual(size, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+
+import unittest
+import json
+import sys
+import os
+
+import ormsgpack
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.core.chat.message_validation import compile_validators
+from src.app.core.chat.wire_format import decode_message
+from src.open_llm_vtuber.analysis.data_models import NonVerbalData
+
+BEHAVIOR = {
+    "timestamp": 1700000000.5,
+    "gaze_direction": "left",
+    "pose_status": "good",
+    "face_visible": True,
+}
+
+class TestDecodeMessage(unittest.TestCase):
+    def test_text_and_binary_frames(self):
+        message = {"type": "text-input", "text": "hello"}
+        self.assertEqual(decode_message(json.dumps(message)), message)
+        self.assertEqual(decode_message(ormsgpack.packb(message)), message)
+
+    def test_invalid_frames(self):
+        for frame in ("{not json", "[1, 2]", b"\xc1", ormsgpack.packb("text")):
+            with self.assertRaises(ValueError):
+                decode_message(frame)
+
+class TestMessageValidators(unittest.TestCase):
+    def setUp(self):
+        self.validators = compile_validators()
+
+    def test_valid_messages(self):
+        self.assertIsNone(self.validators["text-input"]({"type": "text-input", "text": "hi", "images": []}))
+        # Missing fields are left to the handlers
+        self.assertIsNone(self.validators["fetch-and-set-history"]({"type": "fetch-and-set-history"}))
+
+    def test_invalid_field_type(self):
+        error = self.validators["mic-audio-data"]({"type": "mic-audio-data", "audio": "0.1,0.2"})
+        self.assertIn("'audio'", error)
+
+class TestNonVerbalDataFromPayload(unittest.TestCase):
+    def test_matches_model_validation(self):
+        self.assertEqual(NonVerbalData.from_payload(BEHAVIOR), NonVerbalData(**BEHAVIOR))
+
+    def test_rejects_invalid_payloads(self):
+        invalid = (
+            ("gaze_direction", "behind"),
+            ("gaze_direction", ["up"]),
+            ("pose_status", None),
+            ("pose_status", {"good": 1}),
+            ("face_visible", "yes"),
+            ("timestamp", True),
+        )
+        for field, value in invalid:
+            with self.assertRaises(ValueError):
+                NonVerbalData.from_payload({**BEHAVIOR, field: value})
+        with self.assertRaises(ValueError):
+            NonVerbalData.from_payload({"timestamp": 1.0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,6 @@
 
 import unittest
 from unittest.mock import MagicMock, AsyncMock
-import json
 import sys
 import os
 
@@ -34,7 +33,7 @@ class TestPhaseUpdate(unittest.IsolatedAsyncioTestCase):
 
         # Mock WebSocket
         mock_ws = AsyncMock()
-        mock_ws.send_text = AsyncMock()
+        mock_ws.send_json = AsyncMock()
 
         # 2. Test Payload
         payload = {
@@ -57,8 +56,7 @@ class TestPhaseUpdate(unittest.IsolatedAsyncioTestCase):
         mock_context.agent_engine.set_system.assert_called_with("New Phase System Prompt")
 
         # Client Notified?
-        called_args = mock_ws.send_text.call_args[0][0]
-        response_data = json.loads(called_args)
+        response_data = mock_ws.send_json.call_args[0][0]
 
         self.assertEqual(response_data["type"], "interview-phase-updated")
         self.assertEqual(response_data["phase"], "technical")
@@ -1,7 +1,6 @@
 
 import unittest
 from unittest.mock import MagicMock, AsyncMock, patch
-import json
 import sys
 import os
 
@@ -38,7 +37,7 @@ class TestWebSocketProtocol(unittest.IsolatedAsyncioTestCase):
 
         # Mock WebSocket
         mock_ws = AsyncMock()
-        mock_ws.send_text = AsyncMock()
+        mock_ws.send_json = AsyncMock()
 
         # 2. Test Payload
         payload = {
@@ -63,8 +62,7 @@ class TestWebSocketProtocol(unittest.IsolatedAsyncioTestCase):
         mock_context.load_from_config.assert_called_once()
 
         # Verify Response Sent to Client
-        called_args = mock_ws.send_text.call_args[0][0]
-        response_data = json.loads(called_args)
+        response_data = mock_ws.send_json.call_args[0][0]
 
         self.assertEqual(response_data["type"], "interview-session-created")
         self.assertEqual(response_data["status"], "ready")
@@ -0,0 +1,124 @@
+
+import unittest
+import asyncio
+import json
+import sys
+import os
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.core.chat.send_queue import ConnectionSender, LAGGING_CLOSE_CODE
+from src.app.core.chat.chat_group import broadcast_to_group
+
+class FakeWebSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+        self.close_code = None
+
+    async def send_text(self, data):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+class TestConnectionSender(unittest.TestCase):
+    def test_frames_sent_in_order(self):
+        async def run():
+            ws = FakeWebSocket()
+            sender = ConnectionSender(ws, "a")
+            for i in range(5):
+                await sender.send_text(str(i))
+            await sender.flush()
+            await sender.close()
+            return ws.sent
+
+        self.assertEqual(asyncio.run(run()), ["0", "1", "2", "3", "4"])
+
+    def test_full_queue_drops_oldest_droppable(self):
+        async def run():
+            ws = FakeWebSocket(delay=0.01)
+            sender = ConnectionSender(ws, "a", max_queue=3)
+            sender.send_frame("audio-1", droppable=True)
+            sender.send_frame("text-1")
+            sender.send_frame("audio-2", droppable=True)
+            # Full: audio-1 makes room
+            sender.send_frame("text-2")
+            await sender.flush()
+            await sender.close()
+            return ws.sent, sender.dropped
+
+        sent, dropped = asyncio.run(run())
+        self.assertEqual(sent, ["text-1", "audio-2", "text-2"])
+        self.assertEqual(dropped, 1)
+
+    def test_full_queue_without_droppable_disconnects(self):
+        async def run():
+            ws = FakeWebSocket(delay=0.05)
+            sender = ConnectionSender(ws, "a", max_queue=2)
+            sender.send_frame("1")
+            sender.send_frame("2")
+            accepted = sender.send_frame("3")
+            await asyncio.sleep(0)
+            with self.assertRaises(RuntimeError):
+                await sender.send_text("4")
+            await sender.close()
+            return accepted, ws.close_code
+
+        accepted, close_code = asyncio.run(run())
+        self.assertFalse(accepted)
+        self.assertEqual(close_code, LAGGING_CLOSE_CODE)
+
+    def test_stalled_socket_disconnects(self):
+        async def run():
+            ws = FakeWebSocket(delay=1.0)
+            sender = ConnectionSender(ws, "a", max_lag_s=0.05)
+            await sender.send_text("1")
+            await asyncio.sleep(0.1)
+            await sender.close()
+            return sender.closed, ws.close_code
+
+        closed, close_code = asyncio.run(run())
+        self.assertTrue(closed)
+        self.assertEqual(close_code, LAGGING_CLOSE_CODE)
+
+class TestBroadcast(unittest.TestCase):
+    def test_slow_member_does_not_block_broadcast(self):
+        async def run():
+            slow, fast = FakeWebSocket(delay=0.5), FakeWebSocket()
+            connections = {
+                "slow": ConnectionSender(slow, "slow"),
+                "fast": ConnectionSender(fast, "fast"),
+                "me": ConnectionSender(FakeWebSocket(), "me"),
+            }
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await broadcast_to_group(["slow", "fast", "me"], {"type": "full-text", "text": "hi"}, connections, exclude_uid="me")
+            elapsed = loop.time() - start
+            await connections["fast"].flush()
+            for sender in connections.values():
+                await sender.close()
+            return elapsed, fast.sent, connections["me"].websocket.sent
+
+        elapsed, fast_sent, own_sent = asyncio.run(run())
+        self.assertLess(elapsed, 0.1)
+        self.assertEqual([json.loads(f) for f in fast_sent], [{"type": "full-text", "text": "hi"}])
+        self.assertEqual(own_sent, [])
+
+    def test_plain_websockets_sent_concurrently(self):
+        async def run():
+            connections = {uid: FakeWebSocket(delay=0.1) for uid in ("a", "b", "c")}
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await broadcast_to_group(list(connections), {"type": "control"}, connections)
+            return loop.time() - start, [len(ws.sent) for ws in connections.values()]
+
+        elapsed, counts = asyncio.run(run())
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual(counts, [1, 1, 1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.core.utils.turn_trace import (
+    LatencyHistogram,
+    OTLPFileSink,
+    TurnTracer,
+    current_turn,
+    trace_first_token,
+)
+
+async def tokens():
+    yield {"type": "tool_call_status"}
+    for token in ("Hello", " there", "."):
+        yield token
+
+class TestTurnTracer(unittest.TestCase):
+    def setUp(self):
+        self.tracer = TurnTracer()
+
+    def test_turn_starts_at_end_of_speech(self):
+        vad_start_ns = time.perf_counter_ns()
+        self.tracer.end_of_speech("c1", vad_start_ns)
+        trace = self.tracer.start_turn("c1")
+        self.assertEqual(trace.start_ns, vad_start_ns)
+        self.assertIn("vad.end_of_speech", trace.spans)
+        self.assertIs(self.tracer.get("c1"), trace)
+        # The end of speech is used by one turn only
+        self.assertNotIn("vad.end_of_speech", self.tracer.start_turn("c1").spans)
+
+    def test_marks_are_kept_once_and_relative(self):
+        trace = self.tracer.start_turn("c1")
+        trace.begin("llm")
+        trace.mark("llm.first_sentence", since="llm")
+        first = trace.spans["llm.first_sentence"]
+        trace.mark("llm.first_sentence", since="llm")
+        self.assertEqual(trace.spans["llm.first_sentence"], first)
+        trace.mark("ws.first_payload")
+        trace.mark("playback.start", since="ws.first_payload")
+        self.assertEqual(trace.spans["ws.first_payload"][0], trace.start_ns)
+        self.assertEqual(trace.spans["playback.start"][0], trace.spans["ws.first_payload"][1])
+
+    def test_first_token_marked_in_stream_order(self):
+        async def run():
+            trace = self.tracer.start_turn("c1")
+            self.assertIs(current_turn(), trace)
+            trace.begin("llm")
+            items = [item async for item in trace_first_token(tokens(), trace)]
+            return trace, items
+
+        trace, items = asyncio.run(run())
+        self.assertEqual(items, [{"type": "tool_call_status"}, "Hello", " there", "."])
+        self.assertIn("llm.first_token", trace.spans)
+
+    def test_finish_records_histograms_and_exports(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "traces", "turns.jsonl")
+            self.tracer.sink = OTLPFileSink(path)
+            trace = self.tracer.start_turn("c1")
+            with trace.span("asr"):
+                pass
+            self.tracer.finish(trace)
+            self.tracer.finish(trace)
+            dropped = self.tracer.start_turn("c2")
+            self.tracer.finish(dropped, record=False)
+
+            with open(path) as f:
+                lines = f.readlines()
+        self.assertEqual(len(lines), 1)
+        spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual([span["name"] for span in spans], ["turn", "asr"])
+        self.assertEqual(spans[1]["parentSpanId"], spans[0]["spanId"])
+        self.assertEqual(len(spans[0]["traceId"]), 32)
+        self.assertEqual(self.tracer.histograms["asr"].count, 1)
+        self.assertEqual(self.tracer.histograms["turn"].count, 1)
+        self.assertIsNone(self.tracer.get("c1"))
+        self.assertIsNone(self.tracer.get("c2"))
+
+    def test_render_metrics(self):
+        self.tracer.histograms["asr"].observe(0.2)
+        text = self.tracer.render_metrics()
+        self.assertIn("# TYPE olv_turn_stage_seconds histogram", text)
+        self.assertIn('olv_turn_stage_seconds_bucket{stage="asr",le="0.1"} 0', text)
+        self.assertIn('olv_turn_stage_seconds_bucket{stage="asr",le="0.25"} 1', text)
+        self.assertIn('olv_turn_stage_seconds_bucket{stage="asr",le="+Inf"} 1', text)
+        self.assertIn('olv_turn_stage_seconds_count{stage="asr"} 1', text)
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_bucket_bounds_are_inclusive(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.1, 0.5, 1.0, 4.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.cumulative(), [("0.1", 1), ("1.0", 3), ("+Inf", 4)])
+        self.assertAlmostEqual(histogram.sum, 5.6)
+
+if __name__ == '__main__':
+    unittest.main()
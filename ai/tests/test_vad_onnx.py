@@ -0,0 +1,46 @@
+
+import unittest
+import importlib.util
+import subprocess
+import sys
+import os
+
+import numpy as np
+
+# Add src to path
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(ROOT)
+
+from src.open_llm_vtuber.vad.silero import SileroOnnxModel
+
+# Run in a fresh interpreter, earlier tests may have imported torch already
+NO_TORCH_CHECK = """
+import sys
+from src.open_llm_vtuber.vad.silero import VADEngine
+engine = VADEngine(onnx=True)
+assert list(engine.detect_speech([0.0] * 16000)) == []
+print("torch" in sys.modules)
+"""
+
+@unittest.skipUnless(
+    importlib.util.find_spec("silero_vad") and importlib.util.find_spec("onnxruntime"),
+    "silero_vad and onnxruntime are not installed",
+)
+class TestSileroOnnx(unittest.TestCase):
+    def test_silence_is_not_speech(self):
+        model = SileroOnnxModel()
+        probs = [model(np.zeros(512, dtype=np.float32), 16000) for _ in range(10)]
+        self.assertLess(max(probs), 0.1)
+
+    def test_engine_runs_without_torch(self):
+        result = subprocess.run(
+            [sys.executable, "-c", NO_TORCH_CHECK],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+
+import unittest
+import asyncio
+import base64
+import importlib
+import json
+import sys
+import os
+
+import ormsgpack
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.core.chat.send_queue import ConnectionSender
+from src.app.core.chat.chat_group import broadcast_to_group
+from src.app.core.chat import wire_format
+from src.app.core.chat.wire_format import (
+    JSONWireEncoder,
+    MsgpackWireEncoder,
+    get_wire_encoder,
+    quantize_volumes,
+)
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        pass
+
+AUDIO = b"RIFF....WAVEfmt "
+
+def audio_message():
+    return {
+        "type": "audio",
+        "audio": base64.b64encode(AUDIO).decode("utf-8"),
+        "volumes": [0.0, 0.5, 1.0],
+        "slice_length": 20,
+        "display_text": {"text": "hi"},
+        "actions": None,
+        "forwarded": False,
+    }
+
+class TestWireFormat(unittest.TestCase):
+    def test_quantize_volumes(self):
+        self.assertEqual(quantize_volumes([0.0, 0.5, 1.0, 1.2, -0.1]), bytes([0, 128, 255, 255, 0]))
+
+    def test_unknown_format_falls_back_to_json(self):
+        self.assertIsInstance(get_wire_encoder("xml"), JSONWireEncoder)
+        self.assertIsInstance(get_wire_encoder(None), JSONWireEncoder)
+        self.assertIsInstance(get_wire_encoder("msgpack"), MsgpackWireEncoder)
+
+    def test_msgpack_audio_is_binary(self):
+        encoder = MsgpackWireEncoder()
+        message = encoder.prepare(json.dumps(audio_message()))
+        (decoded,) = ormsgpack.unpackb(encoder.encode([message]))
+        self.assertEqual(decoded["audio"], AUDIO)
+        self.assertEqual(decoded["volumes"], bytes([0, 128, 255]))
+        self.assertEqual(decoded["display_text"], {"text": "hi"})
+
+    def test_json_sender_unchanged(self):
+        async def run():
+            ws = FakeWebSocket()
+            sender = ConnectionSender(ws, "a")
+            await sender.send_text('{"type": "a"}')
+            await sender.send_json({"type": "b"})
+            await sender.flush()
+            await sender.close()
+            return ws.sent
+
+        self.assertEqual(asyncio.run(run()), ['{"type": "a"}', '{"type": "b"}'])
+
+    def test_msgpack_sender_coalesces_one_tick(self):
+        async def run():
+            ws = FakeWebSocket()
+            sender = ConnectionSender(ws, "a", encoder=MsgpackWireEncoder())
+            await sender.send_text(json.dumps({"type": "control", "text": "conversation-chain-start"}))
+            await sender.send_json({"type": "full-text", "text": "Thinking..."})
+            await sender.send_text(json.dumps(audio_message()))
+            await sender.send_json({"type": "backend-synth-complete"})
+            await sender.flush()
+            await sender.close()
+            return [ormsgpack.unpackb(frame) for frame in ws.sent]
+
+        frames = asyncio.run(run())
+        self.assertEqual([[m["type"] for m in frame] for frame in frames], [
+            ["control", "full-text"],
+            ["audio"],
+            ["backend-synth-complete"],
+        ])
+
+    def test_broadcast_to_mixed_formats(self):
+        async def run():
+            json_ws, msgpack_ws = FakeWebSocket(), FakeWebSocket()
+            connections = {
+                "json": ConnectionSender(json_ws, "json"),
+                "msgpack": ConnectionSender(msgpack_ws, "msgpack", encoder=MsgpackWireEncoder()),
+            }
+            message = audio_message()
+            await broadcast_to_group(list(connections), message, connections)
+            for sender in connections.values():
+                await sender.flush()
+                await sender.close()
+            return message, json_ws.sent, msgpack_ws.sent
+
+        message, json_sent, msgpack_sent = asyncio.run(run())
+        # The shared message is not modified by the binary encoder
+        self.assertEqual(message, audio_message())
+        self.assertEqual([json.loads(f) for f in json_sent], [audio_message()])
+        self.assertEqual(ormsgpack.unpackb(msgpack_sent[0])[0]["audio"], AUDIO)
+
+class FakeTTSEngine:
+    async def async_generate_audio(self, text, file_name_no_ext=None):
+        return f"{file_name_no_ext}.wav"
+
+    def remove_file(self, path):
+        pass
+
+class TestAudioPath(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The conversation modules import utils from their old place in
+        # src.open_llm_vtuber, alias it for this test only
+        cls.modules = patch.dict(sys.modules)
+        cls.modules.start()
+        sys.modules["src.open_llm_vtuber.utils"] = importlib.import_module("src.app.core.utils")
+        cls.tts_manager = importlib.import_module("src.open_llm_vtuber.conversations.tts_manager")
+        cls.output_types = importlib.import_module("src.open_llm_vtuber.agent.output_types")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.modules.stop()
+
+    def test_tts_payloads_are_not_reparsed(self):
+        async def run():
+            ws = FakeWebSocket()
+            sender = ConnectionSender(ws, "a", encoder=MsgpackWireEncoder())
+            manager = self.tts_manager.TTSTaskManager()
+            for text in ("Hi.", "How are you?"):
+                await manager.speak(
+                    tts_text=text,
+                    display_text=self.output_types.DisplayText(text=text),
+                    actions=None,
+                    live2d_model=None,
+                    tts_engine=FakeTTSEngine(),
+                    websocket_send=sender.send_json,
+                )
+            await asyncio.gather(*manager.task_list)
+            await manager._payload_queue.join()
+            await sender.flush()
+            manager.clear()
+            await sender.close()
+            return ws.sent
+
+        with patch.object(wire_format, "json", wraps=json) as json_module, patch.object(
+            self.tts_manager, "prepare_audio_payload", lambda **kwargs: audio_message()
+        ):
+            frames = asyncio.run(run())
+        json_module.loads.assert_not_called()
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(ormsgpack.unpackb(frames[0])[0]["audio"], AUDIO)
+
+if __name__ == '__main__':
+    unittest.main()
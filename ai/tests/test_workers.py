@@ -0,0 +1,115 @@
+
+import unittest
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.app.bootstrap.workers import (
+    WORKER_ID_ENV,
+    StickyRouter,
+    affinity_key,
+    new_client_uid,
+    process_memory,
+    worker_of,
+)
+
+async def start_backend(name, received):
+    """HTTP server answering every request with its name."""
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        received.append((name, head.decode("latin-1")))
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(name), name.encode()))
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+async def get(port, target, extra_headers=""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: x\r\nConnection: keep-alive\r\n{extra_headers}\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response.split(b"\r\n\r\n", 1)[1].decode()
+
+class TestAffinity(unittest.TestCase):
+    def test_client_uid_carries_worker(self):
+        with patch.dict(os.environ, {WORKER_ID_ENV: "2"}):
+            uid = new_client_uid()
+        self.assertTrue(uid.startswith("w2-"))
+        self.assertEqual(worker_of(uid, 4), 2)
+
+    def test_foreign_uid_maps_consistently(self):
+        uid = "0b8e6c2e-5a0e-4c4e-9d0e-1f6f2a0c9e11"
+        self.assertEqual(worker_of(uid, 3), worker_of(uid, 3))
+        self.assertLess(worker_of("w7-abc", 3), 3)
+
+    def test_affinity_key_sources(self):
+        self.assertEqual(affinity_key("/interview/report/w1-abc", {}), "w1-abc")
+        self.assertEqual(affinity_key("/client-ws?client_uid=w0-x&wire=json", {}), "w0-x")
+        self.assertEqual(affinity_key("/asr", {"x-client-uid": "w3-y"}), "w3-y")
+        self.assertIsNone(affinity_key("/client-ws", {}))
+
+class TestProcessMemory(unittest.TestCase):
+    @unittest.skipUnless(os.path.exists("/proc/self/smaps_rollup"), "needs /proc smaps_rollup")
+    def test_own_memory(self):
+        memory = process_memory(os.getpid())
+        self.assertGreater(memory["rss"], 0)
+        self.assertLessEqual(memory["pss"], memory["rss"])
+
+    def test_missing_process(self):
+        self.assertEqual(process_memory(-1), {})
+
+class TestStickyRouter(unittest.TestCase):
+    def test_routes_by_client_uid(self):
+        async def run():
+            received = []
+            backends = [await start_backend(f"worker-{i}", received) for i in range(2)]
+            ports = [b.sockets[0].getsockname()[1] for b in backends]
+            router = StickyRouter("127.0.0.1", 0, ports)
+            await router.start()
+            port = router.server.sockets[0].getsockname()[1]
+            try:
+                bodies = [
+                    await get(port, "/interview/report/w1-abc"),
+                    await get(port, "/interview/report/w0-def"),
+                    await get(port, "/asr", "X-Client-Uid: w1-abc\r\n"),
+                ]
+            finally:
+                await router.close()
+                for backend in backends:
+                    backend.close()
+            return bodies, received, router.active
+
+        bodies, received, active = asyncio.run(run())
+        self.assertEqual(bodies, ["worker-1", "worker-0", "worker-1"])
+        # Keep-alive is replaced, so every request is routed on its own
+        for _, head in received:
+            self.assertIn("Connection: close", head)
+            self.assertNotIn("keep-alive", head)
+        self.assertEqual(active, [0, 0])
+
+    def test_unreachable_worker_returns_502(self):
+        async def run():
+            probe = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+            dead_port = probe.sockets[0].getsockname()[1]
+            probe.close()
+            await probe.wait_closed()
+            router = StickyRouter("127.0.0.1", 0, [dead_port])
+            await router.start()
+            port = router.server.sockets[0].getsockname()[1]
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(b"GET / HTTP/1.1\r\nHost: x\r\n\r\n")
+                return await reader.read()
+            finally:
+                await router.close()
+
+        self.assertTrue(asyncio.run(run()).startswith(b"HTTP/1.1 502"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,96 +1,89 @@
 import asyncio
+import hashlib
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 import feedparser
 from supabase import create_client, Client
-import requests
 
-from src.shared.config import RSS_FEEDS, SUPABASE_URL, SUPABASE_KEY, TAG_REQUEST_DELAY_MS
+from src.shared.config import RSS_FEEDS, SUPABASE_URL, SUPABASE_KEY, FEED_PARSE_WORKERS
 from src.shared.database import normalize_url, normalize_title, create_summary, extract_thumbnail
-from src.shared.tagger import generate_tags_for_article, base_tags_from_feed_category
+from src.shared.tagger import BatchTagger, base_tags_from_feed_category
+from src.shared.feed_state import FeedStateStore
+from src.shared.dedup_index import DedupIndex
+from src.apps.tech_blog.fetcher import HostLimiter, create_client as create_http_client, fetch_feed
+from src.apps.tech_blog.thumbnails import ThumbnailResolver
+from src.apps.tech_blog.writer import ArticleWriter
 
 # Initialize Supabase
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-def get_existing_data():
-    print("📋 Checking existing data...")
-    url_set = set()
-    author_title_map = {}
-
-    all_data = []
-    has_more = True
-    offset = 0
-    page_size = 1000
-
+def get_dedup_index():
+    print("📋 Syncing dedup index with existing data...")
+    dedup_index = DedupIndex()
     try:
-        while has_more:
-            response = supabase.table("blogs").select("external_url, title, author, published_at").range(offset, offset + page_size - 1).execute()
-            data = response.data
-
-            if data:
-                all_data.extend(data)
-                print(f"   Loaded: {len(all_data)} articles")
-                if len(data) < page_size:
-                    has_more = False
-                else:
-                    offset += page_size
-            else:
-                has_more = False
-
-        print(f"✅ Loaded total {len(all_data)} articles")
-
-        for item in all_data:
-            # Normalized URL
-            if item.get("external_url"):
-                url_set.add(normalize_url(item["external_url"]))
-
-            # Author + Title map
-            if item.get("title") and item.get("author"):
-                key = f"{item['author']}:{item['title']}"
-                author_title_map[key] = item
-
-        return url_set, author_title_map
+        synced = dedup_index.sync(supabase)
+        print(f"✅ Synced {synced} new articles since last crawl")
     except Exception as e:
-        print(f"❌ Error fetching existing data: {e}")
-        return set(), {}
+        # Still usable, just missing the rows added since the last sync
+        print(f"❌ Error syncing existing data: {e}")
+    return dedup_index
 
-def is_duplicate(article, url_set, author_title_map):
+def is_duplicate(article, dedup_index):
     # 1. URL Check
-    if article["external_url"] in url_set:
+    if dedup_index.contains_url(article["external_url"]):
         return True, "URL duplicate"
 
     # 2. Author + Title Check
-    key = f"{article['author']}:{article['title']}"
-    if key in author_title_map:
+    if dedup_index.contains_author_title(article["author"], article["title"]):
         return True, "Author+Title duplicate"
 
     return False, None
 
-def parse_feed(feed_config):
+def entry_date(entry):
+    if hasattr(entry, "published_parsed") and entry.published_parsed:
+        return datetime(*entry.published_parsed[:6])
+    if hasattr(entry, "updated_parsed") and entry.updated_parsed:
+        return datetime(*entry.updated_parsed[:6])
+    return None
+
+def parse_feed(feed_config, content, feed_state=None):
+    """Parse a feed body into articles, skipping entries seen in earlier crawls.
+
+    An entry is skipped if its URL was seen before, or if it is dated before
+    the high-water mark of the feed.
+
+    Returns (articles, seen) where seen holds the newest entry date and the
+    URLs of all entries, to update the feed state with.
+    """
     print(f"📡 Parsing feed: {feed_config['name']}...")
+    feed_state = feed_state or {}
+    seen_urls = set(feed_state.get("seen_urls", []))
+    high_water = feed_state.get("high_water")
+    seen = {"high_water": None, "seen_urls": []}
     try:
-        # Use requests to get content first to handle headers often required
-        headers = {
-             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        resp = requests.get(feed_config['url'], headers=headers, timeout=20)
-        resp.raise_for_status()
-
-        feed = feedparser.parse(resp.content)
+        feed = feedparser.parse(content)
         articles = []
+        skipped = 0
 
         for entry in feed.entries:
             if not getattr(entry, "link", None):
                 continue
 
             normalized_url = normalize_url(entry.link)
+            date = entry_date(entry)
+            seen["seen_urls"].append(normalized_url)
+            if date:
+                seen["high_water"] = max(seen["high_water"] or "", date.isoformat())
+
+            if normalized_url in seen_urls or (date and high_water and date.isoformat() < high_water):
+                skipped += 1
+                continue
 
             # PubDate
-            pub_date = datetime.now()
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                 pub_date = datetime(*entry.published_parsed[:6])
-            elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                 pub_date = datetime(*entry.updated_parsed[:6])
+            pub_date = date or datetime.now()
 
             # Summary
             summary = create_summary(
@@ -99,8 +92,8 @@ def parse_feed(feed_config):
                 entry
             )
 
-            # Thumbnail
-            thumbnail_url = extract_thumbnail(entry, feed_config)
+            # Thumbnail, web-scraped ones are resolved later for new articles only
+            thumbnail_url = extract_thumbnail(entry, feed_config, scrape_web=False)
 
             article = {
                 "title": (entry.get("title") or "No Title").strip(),
@@ -115,82 +108,149 @@ def parse_feed(feed_config):
             }
             articles.append(article)
 
-        print(f"✅ {feed_config['name']}: Parsed {len(articles)} articles")
-        return articles
+        print(f"✅ {feed_config['name']}: Parsed {len(articles)} new articles ({skipped} seen before)")
+        return articles, seen
     except Exception as e:
         print(f"❌ Failed to parse {feed_config['name']}: {e}")
-        return []
-
-def insert_articles(articles, url_set, author_title_map, feed_name):
-    if not articles:
-        return 0, 0
-
-    new_articles = []
-    duplicate_count = 0
-
-    for article in articles:
-        is_dup, reason = is_duplicate(article, url_set, author_title_map)
-        if is_dup:
-            duplicate_count += 1
-            # print(f"   Duplicate ({reason}): {article['title'][:30]}...")
-        else:
-            # Generate AI Tags if needed
-            if not article["tags"]:
-                ai_tags = generate_tags_for_article(article)
-                if ai_tags:
-                    article["tags"] = list(set(article["tags"] + ai_tags))[:8]
-
-                # Rate Limiting for AI API
-                if TAG_REQUEST_DELAY_MS > 0:
-                     time.sleep(TAG_REQUEST_DELAY_MS / 1000.0)
-
-            new_articles.append(article)
-
-            # Update memory immediately
-            url_set.add(article["external_url"])
-            key = f"{article['author']}:{article['title']}"
-            author_title_map[key] = article
-
-            # Progress Log
-            print(f"   👉 [{len(new_articles)}] Tagged & Ready: {article['title'][:40]}...")
-
+        return [], None
+
+@dataclass
+class CrawlContext:
+    """Resources shared by all feeds of a crawl."""
+    client: object
+    limiter: HostLimiter
+    parse_pool: ThreadPoolExecutor
+    writer: ArticleWriter
+    dedup_index: DedupIndex
+    state_store: FeedStateStore
+    thumbnails: ThumbnailResolver
+    tagger: BatchTagger
+
+async def tag_articles(articles, tagger):
+    # AI tags only for articles without tags from the feed category
+    untagged = [a for a in articles if not a["tags"]]
+    if not untagged:
+        return
+    for article, ai_tags in zip(untagged, await tagger.tag_articles(untagged)):
+        if ai_tags:
+            article["tags"] = list(set(article["tags"] + ai_tags))[:8]
+
+async def crawl_feed(feed, ctx, stats=None):
+    """Crawl one feed. Returns (processed, written, duplicates).
+
+    If a stats dict is given, it receives the fetch latency (fetch_s) and the
+    outcome: failed, not_modified, unchanged or updated.
+    """
+    stats = stats if stats is not None else {}
+    state_store = ctx.state_store
+    feed_state = state_store.get(feed["url"])
+    fetch_start = time.monotonic()
+    response = await fetch_feed(ctx.client, feed, ctx.limiter, feed_state)
+    stats["fetch_s"] = time.monotonic() - fetch_start
+    if response is None:
+        stats["outcome"] = "failed"
+        return 0, 0, 0
+    if response.status_code == 304:
+        stats["outcome"] = "not_modified"
+        return 0, 0, 0
+
+    content = response.content
+    content_hash = hashlib.sha256(content).hexdigest()
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_hash": content_hash,
+    }
+    if content_hash == feed_state.get("content_hash"):
+        # Server ignores conditional requests, but the body is the same
+        print(f"📝 [{feed['name']}] Unchanged since last crawl.")
+        state_store.update(feed["url"], **validators)
+        stats["outcome"] = "unchanged"
+        return 0, 0, 0
+
+    loop = asyncio.get_running_loop()
+    articles, seen = await loop.run_in_executor(ctx.parse_pool, parse_feed, feed, content, feed_state)
+    if seen is None:
+        stats["outcome"] = "failed"
+        return 0, 0, 0
+    stats["outcome"] = "updated"
+
+    # Only scrape thumbnails and tag articles that will be inserted
+    new_articles = [a for a in articles if not is_duplicate(a, ctx.dedup_index)[0]]
+    duplicates = len(articles) - len(new_articles)
     if not new_articles:
-        print(f"📝 [{feed_name}] All {duplicate_count} articles are duplicates.")
-        return 0, duplicate_count
-
-    try:
-        # Insert into Supabase
-        response = supabase.table("blogs").insert(new_articles).execute()
-        # In supabase-py v2, insert returns response object. response.data is the list of inserted rows.
-        inserted_count = len(response.data) if response.data else len(new_articles)
-
-        print(f"✅ [{feed_name}] Inserted {inserted_count} new articles ({duplicate_count} duplicates)")
-        return inserted_count, duplicate_count
-    except Exception as e:
-        print(f"❌ [{feed_name}] DB Insert failed: {e}")
-        return 0, duplicate_count
+        print(f"📝 [{feed['name']}] All {duplicates} articles are duplicates.")
+        state_store.update(feed["url"], **validators, **seen)
+        return len(articles), 0, duplicates
+
+    await ctx.thumbnails.resolve(new_articles, feed["name"])
+    await tag_articles(new_articles, ctx.tagger)
+
+    written, batch_duplicates, failed = await ctx.writer.write(new_articles, feed["name"])
+    duplicates += batch_duplicates
+
+    # Only advance the state if every new article made it in, so failed ones are retried
+    if not failed:
+        state_store.update(feed["url"], **validators, **seen)
+    return len(articles), written, duplicates
+
+@asynccontextmanager
+async def open_crawl_context():
+    """Set up the resources shared by feed crawls, and save/close them on exit."""
+    dedup_index = await asyncio.to_thread(get_dedup_index)
+    print(f"📊 Existing articles: {len(dedup_index)}")
+
+    state_store = FeedStateStore()
+
+    # Parsing is CPU-bound, threads keep the event loop fetching meanwhile
+    with ThreadPoolExecutor(max_workers=FEED_PARSE_WORKERS) as parse_pool:
+        async with create_http_client() as client:
+            ctx = CrawlContext(
+                client=client,
+                limiter=HostLimiter(),
+                parse_pool=parse_pool,
+                writer=ArticleWriter(supabase, dedup_index),
+                dedup_index=dedup_index,
+                state_store=state_store,
+                thumbnails=ThumbnailResolver(client),
+                tagger=BatchTagger(),
+            )
+            try:
+                yield ctx
+            finally:
+                await ctx.writer.close()
+                state_store.save()
+                ctx.tagger.cache.save()
+                dedup_index.close()
+
+async def crawl_tech_blogs(feeds):
+    """Fetch all feeds concurrently over one connection pool, parse each in a
+    worker thread as it arrives and hand its new articles to the batch writer."""
+    async with open_crawl_context() as ctx:
+        outcomes = await asyncio.gather(
+            *[crawl_feed(feed, ctx) for feed in feeds], return_exceptions=True
+        )
+
+    # One failing feed must not lose the results of the others
+    results = []
+    for feed, outcome in zip(feeds, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"❌ [{feed['name']}] Crawl failed: {outcome!r}")
+            continue
+        results.append(outcome)
+
+    total_processed = sum(r[0] for r in results)
+    total_new = sum(r[1] for r in results)
+    total_dup = sum(r[2] for r in results)
+    return total_processed, total_new, total_dup
 
 def run_tech_blog_crawler():
     print(f"📊 Starting crawl for {len(RSS_FEEDS)} feeds...")
+    start = time.monotonic()
 
-    url_set, author_title_map = get_existing_data()
-    print(f"📊 Existing articles: {len(url_set)}")
-
-    total_new = 0
-    total_dup = 0
-    total_processed = 0
-
-    for feed in RSS_FEEDS:
-        articles = parse_feed(feed)
-        inserted, duplicates = insert_articles(articles, url_set, author_title_map, feed["name"])
-
-        total_new += inserted
-        total_dup += duplicates
-        total_processed += len(articles)
-
-        time.sleep(1) # Interval between feeds
+    total_processed, total_new, total_dup = asyncio.run(crawl_tech_blogs(RSS_FEEDS))
 
-    print("\n🎉 RSS Crawling Completed!")
+    print(f"\n🎉 RSS Crawling Completed in {time.monotonic() - start:.1f}s!")
     print(f"📊 Total processed: {total_processed}")
     print(f"✨ Newly saved: {total_new}")
     print(f"🔄 Duplicates found: {total_dup}")
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from src.shared.config import (
+    RSS_FEEDS,
+    DAEMON_MIN_POLL_S,
+    DAEMON_MAX_POLL_S,
+    DAEMON_DEFAULT_POLL_S,
+    DAEMON_SYNC_INTERVAL_S,
+    CRAWLER_STATUS_HOST,
+    CRAWLER_STATUS_PORT,
+)
+from src.apps.tech_blog.crawler import supabase, crawl_feed, open_crawl_context
+
+# Poll interval multipliers: poll more often while a feed publishes, back off while it doesn't
+SPEED_UP = 0.5
+SLOW_DOWN = 1.5
+# Spread the first crawls so the daemon doesn't start with a burst
+STARTUP_SPREAD_S = 30
+
+
+class CrawlerDaemon:
+    """Long-running tech-blog crawler.
+
+    Keeps the HTTP connection pool, dedup index, writer and caches warm
+    between runs, and crawls each feed on its own adaptive schedule. Run
+    statistics are served as JSON on http://CRAWLER_STATUS_HOST:CRAWLER_STATUS_PORT/status.
+    """
+
+    def __init__(self, feeds=None, host=CRAWLER_STATUS_HOST, port=CRAWLER_STATUS_PORT):
+        self.feeds = feeds or RSS_FEEDS
+        self.host = host
+        self.port = port
+        self.scheduler = AsyncIOScheduler()
+        self.ctx = None
+        self.started_at = None
+        self.stats = {
+            feed["url"]: {
+                "name": feed["name"],
+                "url": feed["url"],
+                "runs": 0,
+                "errors": 0,
+                "last_run": None,
+                "last_outcome": None,
+                "last_error": None,
+                "last_fetch_s": None,
+                "avg_fetch_s": None,
+                "last_new": 0,
+                "total_new": 0,
+                "poll_interval_s": None,
+                "next_run": None,
+            }
+            for feed in self.feeds
+        }
+
+    async def run(self):
+        self.started_at = datetime.now()
+        async with open_crawl_context() as ctx:
+            self.ctx = ctx
+            server = await asyncio.start_server(self._handle_status, self.host, self.port)
+            print(f"🛰️ Crawler daemon started, status on http://{self.host}:{self.port}/status")
+
+            for feed in self.feeds:
+                interval = ctx.state_store.get(feed["url"]).get("poll_interval_s", DAEMON_DEFAULT_POLL_S)
+                self.stats[feed["url"]]["poll_interval_s"] = interval
+                self._schedule(feed, random.uniform(0, STARTUP_SPREAD_S))
+            self.scheduler.add_job(self._sync, "interval", seconds=DAEMON_SYNC_INTERVAL_S, id="sync")
+            self.scheduler.start()
+
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                self.scheduler.shutdown(wait=False)
+                self.ctx = None
+                print("🛑 Crawler daemon stopped.")
+
+    def _schedule(self, feed, delay_s):
+        run_date = datetime.now() + timedelta(seconds=delay_s)
+        self.stats[feed["url"]]["next_run"] = run_date.isoformat()
+        # The next run is only scheduled by this one, so a run that starts late
+        # (busy loop, suspended host) must still run rather than be dropped
+        self.scheduler.add_job(
+            self._run_feed, "date", run_date=run_date, args=[feed],
+            id=feed["url"], replace_existing=True,
+            misfire_grace_time=None, coalesce=True,
+        )
+
+    async def _run_feed(self, feed):
+        stats = self.stats[feed["url"]]
+        run_stats = {}
+        written = 0
+        try:
+            _, written, _ = await crawl_feed(feed, self.ctx, run_stats)
+            if run_stats.get("outcome") == "failed":
+                stats["errors"] += 1
+                stats["last_error"] = "fetch or parse failed"
+        except Exception as e:
+            print(f"❌ [{feed['name']}] Crawl failed: {e}")
+            run_stats["outcome"] = "failed"
+            stats["errors"] += 1
+            stats["last_error"] = str(e)
+
+        stats["runs"] += 1
+        stats["last_run"] = datetime.now().isoformat()
+        stats["last_outcome"] = run_stats.get("outcome")
+        stats["last_new"] = written
+        stats["total_new"] += written
+        if run_stats.get("fetch_s") is not None:
+            stats["last_fetch_s"] = round(run_stats["fetch_s"], 3)
+            previous = stats["avg_fetch_s"]
+            stats["avg_fetch_s"] = stats["last_fetch_s"] if previous is None else round(
+                0.8 * previous + 0.2 * stats["last_fetch_s"], 3
+            )
+
+        interval = self._next_interval(stats["poll_interval_s"], run_stats.get("outcome"), written)
+        stats["poll_interval_s"] = interval
+        self.ctx.state_store.update(feed["url"], poll_interval_s=interval)
+        self._schedule(feed, interval)
+
+    @staticmethod
+    def _next_interval(interval, outcome, written):
+        if outcome == "updated" and written > 0:
+            interval *= SPEED_UP
+        else:
+            # Also backs off failing feeds
+            interval *= SLOW_DOWN
+        return int(min(DAEMON_MAX_POLL_S, max(DAEMON_MIN_POLL_S, interval)))
+
+    async def _sync(self):
+        """Persist state and pull rows other writers added to the DB."""
+        self.ctx.state_store.save()
+        self.ctx.tagger.cache.save()
+        try:
+            synced = await asyncio.to_thread(self.ctx.dedup_index.sync, supabase)
+            if synced:
+                print(f"📋 Synced {synced} articles into the dedup index")
+        except Exception as e:
+            print(f"❌ Error syncing dedup index: {e}")
+
+    def status(self):
+        feeds = list(self.stats.values())
+        return {
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "uptime_s": round((datetime.now() - self.started_at).total_seconds()) if self.started_at else 0,
+            "totals": {
+                "runs": sum(f["runs"] for f in feeds),
+                "errors": sum(f["errors"] for f in feeds),
+                "new_items": sum(f["total_new"] for f in feeds),
+            },
+            "feeds": feeds,
+        }
+
+    async def _handle_status(self, reader, writer):
+        try:
+            request_line = (await asyncio.wait_for(reader.readline(), timeout=5)).decode("latin-1")
+            parts = request_line.split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/status":
+                status, body = "200 OK", json.dumps(self.status(), ensure_ascii=False)
+            else:
+                status, body = "404 Not Found", json.dumps({"error": "not found"})
+            payload = body.encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode("latin-1") + payload
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def run_tech_blog_daemon(port=CRAWLER_STATUS_PORT):
+    try:
+        asyncio.run(CrawlerDaemon(port=port).run())
+    except KeyboardInterrupt:
+        pass
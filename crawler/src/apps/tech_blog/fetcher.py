@@ -0,0 +1,130 @@
+import asyncio
+import random
+import time
+from urllib.parse import urlparse
+
+import httpx
+
+from src.shared.config import (
+    FEED_FETCH_CONCURRENCY,
+    FEED_PER_HOST_LIMIT,
+    FEED_HOST_DELAY_MS,
+    FEED_FETCH_TIMEOUT_S,
+    FEED_FETCH_RETRIES,
+    FEED_RETRY_BASE_MS,
+)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# Statuses worth retrying, anything else is a permanent failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HostLimiter:
+    """Politeness limits per host: at most `limit` requests in flight and
+    at least `delay_ms` between the starts of two requests."""
+
+    def __init__(self, limit=FEED_PER_HOST_LIMIT, delay_ms=FEED_HOST_DELAY_MS):
+        self.limit = limit
+        self.delay = delay_ms / 1000.0
+        self._semaphores = {}
+        self._locks = {}
+        self._last_start = {}
+
+    def slot(self, url):
+        host = urlparse(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.limit)
+            self._locks[host] = asyncio.Lock()
+        return _HostSlot(self, host)
+
+
+class _HostSlot:
+    def __init__(self, limiter, host):
+        self.limiter = limiter
+        self.host = host
+
+    async def __aenter__(self):
+        limiter = self.limiter
+        await limiter._semaphores[self.host].acquire()
+        # Space out request starts to the same host
+        async with limiter._locks[self.host]:
+            wait = limiter._last_start.get(self.host, 0) + limiter.delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            limiter._last_start[self.host] = time.monotonic()
+
+    async def __aexit__(self, *exc):
+        self.limiter._semaphores[self.host].release()
+
+
+def create_client():
+    """Shared client for all feed requests, so connections are pooled and reused."""
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=httpx.Timeout(FEED_FETCH_TIMEOUT_S),
+        limits=httpx.Limits(
+            max_connections=FEED_FETCH_CONCURRENCY,
+            max_keepalive_connections=FEED_FETCH_CONCURRENCY,
+        ),
+        follow_redirects=True,
+    )
+
+
+def _retry_delay(attempt, response=None):
+    # Honor Retry-After when given in seconds, else exponential backoff with jitter
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+    return FEED_RETRY_BASE_MS / 1000.0 * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+
+def conditional_headers(feed_state):
+    headers = {}
+    if feed_state.get("etag"):
+        headers["If-None-Match"] = feed_state["etag"]
+    if feed_state.get("last_modified"):
+        headers["If-Modified-Since"] = feed_state["last_modified"]
+    return headers
+
+
+async def fetch_feed(client, feed_config, limiter, feed_state=None):
+    """Download one feed, retrying transient errors with backoff.
+
+    With a feed_state from the last crawl, the request is conditional and
+    an unchanged feed comes back as a bodiless 304 response.
+
+    Returns the response (200 or 304), or None if the feed could not be fetched.
+    """
+    url = feed_config["url"]
+    headers = conditional_headers(feed_state or {})
+    for attempt in range(FEED_FETCH_RETRIES + 1):
+        response = None
+        try:
+            async with limiter.slot(url):
+                start = time.monotonic()
+                response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                print(f"📡 [{feed_config['name']}] Not modified ({time.monotonic() - start:.2f}s)")
+                return response
+            if response.status_code not in RETRY_STATUSES:
+                response.raise_for_status()
+                print(f"📡 [{feed_config['name']}] Fetched {len(response.content)} bytes in {time.monotonic() - start:.2f}s")
+                return response
+            error = f"HTTP {response.status_code}"
+        except httpx.HTTPStatusError as e:
+            print(f"❌ [{feed_config['name']}] Fetch failed: HTTP {e.response.status_code}")
+            return None
+        except httpx.TransportError as e:
+            error = f"{type(e).__name__}: {e}"
+
+        if attempt == FEED_FETCH_RETRIES:
+            print(f"❌ [{feed_config['name']}] Fetch failed after {attempt + 1} attempts: {error}")
+            return None
+        delay = _retry_delay(attempt, response)
+        print(f"⚠️ [{feed_config['name']}] {error}, retrying in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
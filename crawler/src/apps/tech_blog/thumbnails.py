@@ -0,0 +1,88 @@
+import asyncio
+import re
+from collections import OrderedDict
+
+import httpx
+
+from src.shared.config import (
+    THUMBNAIL_PER_HOST_LIMIT,
+    THUMBNAIL_HOST_DELAY_MS,
+    THUMBNAIL_TIMEOUT_S,
+    THUMBNAIL_CACHE_SIZE,
+)
+from src.shared.database import extract_meta_image, needs_web_thumbnail
+from src.apps.tech_blog.fetcher import HostLimiter
+
+HEAD_END = re.compile(rb"</head\s*>|<body[\s>]", re.IGNORECASE)
+# Give up looking for </head> after this much, some pages inline huge scripts
+MAX_HEAD_BYTES = 512 * 1024
+
+
+class ThumbnailResolver:
+    """Scrapes article pages for og:image thumbnails, concurrently.
+
+    Reads each page only up to the end of its <head>, where the meta images
+    are, and caches results by URL, failures included.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.limiter = HostLimiter(limit=THUMBNAIL_PER_HOST_LIMIT, delay_ms=THUMBNAIL_HOST_DELAY_MS)
+        self._cache = OrderedDict()
+
+    async def resolve(self, articles, blog_name="Web"):
+        """Set thumbnail_url of the articles that need web scraping.
+
+        Articles keep their feed thumbnail when the page has no meta image.
+        """
+        targets = [a for a in articles if needs_web_thumbnail(a["external_url"])]
+        if not targets:
+            return
+
+        print(f"🔍 [{blog_name} Thumbnail] Scraping {len(targets)} pages...")
+        images = await asyncio.gather(*[self.fetch(a["external_url"], blog_name) for a in targets])
+        for article, image in zip(targets, images):
+            if image:
+                article["thumbnail_url"] = image
+
+    async def fetch(self, url, blog_name="Web"):
+        if url in self._cache:
+            self._cache.move_to_end(url)
+            return self._cache[url]
+
+        image = None
+        try:
+            async with self.limiter.slot(url):
+                head = await self._read_head(url, blog_name)
+            if head is not None:
+                image = await asyncio.to_thread(extract_meta_image, head)
+                if not image:
+                    print(f"❌ [{blog_name} Thumbnail] No meta image found: {url}")
+        except (httpx.HTTPError, httpx.InvalidURL, httpx.StreamError, ValueError) as e:
+            # A bad link fails its own article only, not the whole feed
+            print(f"❌ [{blog_name} Thumbnail] Web fetch failed: {e!r}")
+            # Don't cache transient failures
+            return None
+
+        self._cache[url] = image
+        if len(self._cache) > THUMBNAIL_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return image
+
+    async def _read_head(self, url, blog_name):
+        async with self.client.stream("GET", url, timeout=THUMBNAIL_TIMEOUT_S) as response:
+            if response.status_code != 200:
+                print(f"❌ [{blog_name} Thumbnail] HTTP Error {response.status_code}: {url}")
+                return None
+
+            head = b""
+            async for chunk in response.aiter_bytes():
+                # Look a little before the new chunk in case the tag was split
+                search_from = max(0, len(head) - 16)
+                head += chunk
+                match = HEAD_END.search(head, search_from)
+                if match:
+                    return head[:match.start()]
+                if len(head) >= MAX_HEAD_BYTES:
+                    break
+            return head
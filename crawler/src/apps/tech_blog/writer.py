@@ -0,0 +1,159 @@
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+
+from src.shared.config import DB_WRITE_BATCH_SIZE, DB_FLUSH_INTERVAL_S, CRAWLER_STATE_DIR
+from src.shared.dedup_index import author_title_key
+
+
+class ArticleWriter:
+    """Buffers new articles across feeds and writes them in batches.
+
+    A batch is flushed when it reaches `batch_size` articles or has waited
+    `flush_interval_s`. Rows are upserted on external_url, so a conflicting
+    row is skipped instead of failing the batch. If a batch still fails, its
+    rows are retried one by one and the ones that fail again are appended to
+    failed_articles.jsonl in the state dir.
+
+    Articles are added to the dedup index once they are in the DB.
+    """
+
+    def __init__(self, supabase, dedup_index, batch_size=DB_WRITE_BATCH_SIZE,
+                 flush_interval_s=DB_FLUSH_INTERVAL_S, failures_path=None):
+        self.supabase = supabase
+        self.dedup_index = dedup_index
+        self.batch_size = batch_size
+        self.flush_interval_s = flush_interval_s
+        self.failures_path = failures_path or os.path.join(CRAWLER_STATE_DIR, "failed_articles.jsonl")
+
+        # Pending articles, each with the feed name and the future of its feed's write
+        self._buffer = []
+        self._pending_keys = set()
+        self._oldest = None
+        self._flush_lock = asyncio.Lock()
+        self._timer = None
+
+    async def write(self, articles, feed_name):
+        """Queue a feed's articles and wait until they are written.
+
+        Returns (written, duplicates, failed). Duplicates are articles already
+        queued by another feed or already in the DB.
+        """
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_periodically())
+
+        loop = asyncio.get_running_loop()
+        result = {"written": 0, "duplicates": 0, "failed": 0}
+        queued = []
+        for article in articles:
+            keys = (article["external_url"], author_title_key(article["author"], article["title"]))
+            if keys[0] in self._pending_keys or keys[1] in self._pending_keys:
+                result["duplicates"] += 1
+                continue
+            self._pending_keys.update(keys)
+            queued.append(article)
+
+        if not queued:
+            return result["written"], result["duplicates"], result["failed"]
+
+        done = loop.create_future()
+        remaining = {"count": len(queued)}
+        for article in queued:
+            self._buffer.append((article, feed_name, result, remaining, done))
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        await done
+        return result["written"], result["duplicates"], result["failed"]
+
+    async def flush(self):
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                self._oldest = time.monotonic() if self._buffer else None
+
+                try:
+                    statuses = await asyncio.to_thread(self._write_batch, [item[0] for item in batch])
+                except Exception as e:
+                    print(f"❌ Batch write of {len(batch)} articles failed: {e}")
+                    statuses = ["failed"] * len(batch)
+
+                for (article, feed_name, result, remaining, done), status in zip(batch, statuses):
+                    result[status] += 1
+                    self._pending_keys.discard(article["external_url"])
+                    self._pending_keys.discard(author_title_key(article["author"], article["title"]))
+                    remaining["count"] -= 1
+                    if remaining["count"] == 0 and not done.done():
+                        print(f"✅ [{feed_name}] Wrote {result['written']} new articles "
+                              f"({result['duplicates']} duplicates, {result['failed']} failed)")
+                        done.set_result(None)
+
+    async def close(self):
+        # Flush first, so a flush the timer has started completes before it is cancelled
+        await self.flush()
+        if self._timer:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval_s / 2)
+            if self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval_s:
+                await self.flush()
+
+    def _upsert(self, rows):
+        # Conflicting URLs are skipped, only inserted rows come back
+        response = (
+            self.supabase.table("blogs")
+            .upsert(rows, on_conflict="external_url", ignore_duplicates=True)
+            .execute()
+        )
+        return {row.get("external_url") for row in response.data or []}
+
+    def _write_batch(self, rows):
+        """Write rows, returning "written", "duplicates" or "failed" for each."""
+        try:
+            inserted = self._upsert(rows)
+            print(f"💾 Upserted batch of {len(rows)} articles ({len(inserted)} new)")
+            return self._finish(rows, inserted, failed=set())
+        except Exception as e:
+            print(f"⚠️ Batch write of {len(rows)} articles failed, retrying one by one: {e}")
+
+        inserted = set()
+        failed = set()
+        for row in rows:
+            try:
+                inserted |= self._upsert([row])
+            except Exception as e:
+                failed.add(row["external_url"])
+                self._record_failure(row, e)
+        return self._finish(rows, inserted, failed)
+
+    def _finish(self, rows, inserted, failed):
+        statuses = []
+        for row in rows:
+            if row["external_url"] in failed:
+                statuses.append("failed")
+            elif row["external_url"] in inserted:
+                statuses.append("written")
+            else:
+                statuses.append("duplicates")
+        # Duplicates are in the DB too, so the index should know them
+        self.dedup_index.add_many([row for row in rows if row["external_url"] not in failed])
+        return statuses
+
+    def _record_failure(self, row, error):
+        print(f"❌ DB write failed for {row['external_url']}: {error}")
+        os.makedirs(os.path.dirname(self.failures_path) or ".", exist_ok=True)
+        with open(self.failures_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "failed_at": datetime.now().isoformat(),
+                "error": str(error),
+                "article": row,
+            }, ensure_ascii=False) + "\n")
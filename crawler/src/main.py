@@ -6,6 +6,7 @@ from dotenv import load_dotenv
 
 # Import crawlers
 from src.apps.tech_blog.crawler import run_tech_blog_crawler
+from src.apps.tech_blog.daemon import run_tech_blog_daemon
 from src.apps.job_post.crawler import crawl_job_description
 from src.apps.dev_event.service import run_dev_event_crawler
 
@@ -19,6 +20,10 @@ def main():
     # Tech Blog
     subparsers.add_parser("tech_blog", help="Run Tech Blog Crawler (RSS)")
 
+    # Tech Blog daemon
+    daemon_parser = subparsers.add_parser("daemon", help="Run Tech Blog Crawler continuously with per-feed schedules")
+    daemon_parser.add_argument("--port", type=int, default=None, help="Port of the local status endpoint")
+
     # Job Post (JD)
     jd_parser = subparsers.add_parser("job_post", help="Run Job Description Crawler")
     jd_parser.add_argument("url", help="URL of the Job Description")
@@ -36,6 +41,12 @@ def main():
         except KeyboardInterrupt:
             pass
 
+    elif args.target == "daemon":
+        if args.port is not None:
+            run_tech_blog_daemon(port=args.port)
+        else:
+            run_tech_blog_daemon()
+
     elif args.target == "job_post":
         result = crawl_job_description(args.url)
         print(result)
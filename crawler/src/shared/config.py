@@ -12,6 +12,39 @@ SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 TAG_REQUEST_DELAY_MS = int(os.getenv("TAG_REQUEST_DELAY_MS", "1000"))
 TAG_RETRY_BASE_MS = int(os.getenv("TAG_RETRY_BASE_MS", "5000"))
+TAG_BATCH_SIZE = int(os.getenv("TAG_BATCH_SIZE", "10"))
+TAG_BATCH_CONCURRENCY = int(os.getenv("TAG_BATCH_CONCURRENCY", "4"))
+TAG_REQUESTS_PER_MINUTE = float(os.getenv("TAG_REQUESTS_PER_MINUTE", "15"))
+
+# Feed fetching
+FEED_FETCH_CONCURRENCY = int(os.getenv("FEED_FETCH_CONCURRENCY", "16"))
+FEED_PER_HOST_LIMIT = int(os.getenv("FEED_PER_HOST_LIMIT", "2"))
+FEED_HOST_DELAY_MS = int(os.getenv("FEED_HOST_DELAY_MS", "500"))
+FEED_FETCH_TIMEOUT_S = float(os.getenv("FEED_FETCH_TIMEOUT_S", "20"))
+FEED_FETCH_RETRIES = int(os.getenv("FEED_FETCH_RETRIES", "3"))
+FEED_RETRY_BASE_MS = int(os.getenv("FEED_RETRY_BASE_MS", "1000"))
+FEED_PARSE_WORKERS = int(os.getenv("FEED_PARSE_WORKERS", "4"))
+
+# Thumbnail scraping
+THUMBNAIL_PER_HOST_LIMIT = int(os.getenv("THUMBNAIL_PER_HOST_LIMIT", "2"))
+THUMBNAIL_HOST_DELAY_MS = int(os.getenv("THUMBNAIL_HOST_DELAY_MS", "300"))
+THUMBNAIL_TIMEOUT_S = float(os.getenv("THUMBNAIL_TIMEOUT_S", "10"))
+THUMBNAIL_CACHE_SIZE = int(os.getenv("THUMBNAIL_CACHE_SIZE", "5000"))
+
+# DB writes
+DB_WRITE_BATCH_SIZE = int(os.getenv("DB_WRITE_BATCH_SIZE", "50"))
+DB_FLUSH_INTERVAL_S = float(os.getenv("DB_FLUSH_INTERVAL_S", "2"))
+
+# Daemon mode
+DAEMON_MIN_POLL_S = int(os.getenv("DAEMON_MIN_POLL_S", "300"))
+DAEMON_MAX_POLL_S = int(os.getenv("DAEMON_MAX_POLL_S", "21600"))
+DAEMON_DEFAULT_POLL_S = int(os.getenv("DAEMON_DEFAULT_POLL_S", "1800"))
+DAEMON_SYNC_INTERVAL_S = int(os.getenv("DAEMON_SYNC_INTERVAL_S", "600"))
+CRAWLER_STATUS_HOST = os.getenv("CRAWLER_STATUS_HOST", "127.0.0.1")
+CRAWLER_STATUS_PORT = int(os.getenv("CRAWLER_STATUS_PORT", "8787"))
+
+# Local state kept between crawls (feed fetch state, dedup index)
+CRAWLER_STATE_DIR = os.getenv("CRAWLER_STATE_DIR", ".crawler_state")
 
 # Validation
 if not SUPABASE_URL or not SUPABASE_KEY:
@@ -4,6 +4,13 @@ from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 import time
 
+# Blogs whose feeds lack usable images, so thumbnails are scraped from the article page
+WEB_SCRAPING_DOMAINS = [
+    "toss.tech", "oliveyoung.tech", "tech.kakao.com", "tech.kakaopay.com",
+    "techblog.woowahan.com", "blog.banksalad.com", "tech.devsisters.com",
+    "d2.naver.com", "techblog.lycorp.co.jp"
+]
+
 def strip_html(html_content):
     if not html_content:
         return ""
@@ -67,19 +74,10 @@ def fetch_thumbnail_from_web(url, blog_name="Web"):
             print(f"❌ [{blog_name} Thumbnail] HTTP Error {response.status_code}: {url}")
             return None
 
-        soup = BeautifulSoup(response.content, "lxml")
-
-        # og:image
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            print(f"✅ [{blog_name} Thumbnail] Extracted from Web: {og_image['content']}")
-            return og_image["content"]
-
-        # twitter:image
-        twitter_image = soup.find("meta", name="twitter:image")
-        if twitter_image and twitter_image.get("content"):
-             print(f"✅ [{blog_name} Thumbnail] Extracted from Twitter Meta: {twitter_image['content']}")
-             return twitter_image["content"]
+        image = extract_meta_image(response.content)
+        if image:
+            print(f"✅ [{blog_name} Thumbnail] Extracted from Web: {image}")
+            return image
 
         print(f"❌ [{blog_name} Thumbnail] No meta image found: {url}")
         return None
@@ -87,25 +85,40 @@ def fetch_thumbnail_from_web(url, blog_name="Web"):
         print(f"❌ [{blog_name} Thumbnail] Web fetch failed: {e}")
         return None
 
-def extract_thumbnail(entry, feed_config=None):
-    # Web Scraping Blogs list
-    web_scraping_domains = [
-        "toss.tech", "oliveyoung.tech", "tech.kakao.com", "tech.kakaopay.com",
-        "techblog.woowahan.com", "blog.banksalad.com", "tech.devsisters.com",
-        "d2.naver.com", "techblog.lycorp.co.jp"
-    ]
+def extract_meta_image(html):
+    """Find the og:image or twitter:image of a page. The <head> alone is enough."""
+    soup = BeautifulSoup(html, "lxml")
+
+    # og:image
+    og_image = soup.find("meta", property="og:image")
+    if og_image and og_image.get("content"):
+        return og_image["content"]
+
+    # twitter:image
+    twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
+    if twitter_image and twitter_image.get("content"):
+        return twitter_image["content"]
+
+    return None
+
+def needs_web_thumbnail(link):
+    return any(domain in link for domain in WEB_SCRAPING_DOMAINS)
+
+def extract_thumbnail(entry, feed_config=None, scrape_web=True):
+    """Find the thumbnail of a feed entry.
 
+    With scrape_web=False the article page is never fetched, callers resolve
+    those thumbnails themselves (see needs_web_thumbnail).
+    """
     link = entry.get("link", "")
 
     # Check if scraping is needed
-    for domain in web_scraping_domains:
-        if domain in link:
-            blog_name = feed_config.get("name", "Unknown") if feed_config else "Unknown"
-            print(f"🔍 [{blog_name} Thumbnail] Attempting web scraping: {link}")
-            thumb = fetch_thumbnail_from_web(link, blog_name)
-            if thumb:
-                return thumb
-            break
+    if scrape_web and needs_web_thumbnail(link):
+        blog_name = feed_config.get("name", "Unknown") if feed_config else "Unknown"
+        print(f"🔍 [{blog_name} Thumbnail] Attempting web scraping: {link}")
+        thumb = fetch_thumbnail_from_web(link, blog_name)
+        if thumb:
+            return thumb
 
     # 1. Enclosure
     if "enclosures" in entry:
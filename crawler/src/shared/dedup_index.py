@@ -0,0 +1,127 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+from src.shared.config import CRAWLER_STATE_DIR
+from src.shared.database import normalize_url
+
+PAGE_SIZE = 1000
+# Ids below the watermark re-read on each sync. A SERIAL id is taken when a
+# row is inserted but only visible once its transaction commits, so a row
+# with a lower id than the watermark can still show up after a sync.
+RESCAN_WINDOW = 1000
+
+
+def _digest(key):
+    # 16 bytes per key keeps the index compact, collisions are negligible
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def author_title_key(author, title):
+    return f"{author}:{title}"
+
+
+class DedupIndex:
+    """Local, persistent index of articles already in the `blogs` table.
+
+    Stores digests of normalized URLs and author:title keys in SQLite, and
+    the highest `blogs.id` synced so far. Each crawl only pulls the rows added
+    since then, plus a window of ids below it for rows committed late, instead
+    of loading the whole table into memory.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CRAWLER_STATE_DIR, "dedup_index.sqlite3")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Used from worker threads, writes are serialized by the lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS urls (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS author_titles (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    @property
+    def watermark(self):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'last_id'").fetchone()
+        return int(row[0]) if row else 0
+
+    def sync(self, supabase):
+        """Pull rows added to `blogs` since the last sync. Returns the number of new rows."""
+        watermark = self.watermark
+        last_id = max(0, watermark - RESCAN_WINDOW)
+        synced = 0
+        while True:
+            response = (
+                supabase.table("blogs")
+                .select("id, external_url, title, author")
+                .gt("id", last_id)
+                .order("id")
+                .limit(PAGE_SIZE)
+                .execute()
+            )
+            rows = response.data or []
+            if not rows:
+                break
+
+            self._add_rows(rows, normalize=True)
+            last_id = rows[-1]["id"]
+            new_rows = sum(1 for row in rows if row["id"] > watermark)
+            if last_id > watermark:
+                watermark = last_id
+                with self._lock, self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_id', ?)", (str(last_id),)
+                    )
+            if new_rows:
+                synced += new_rows
+                print(f"   Synced: {synced} articles")
+            if len(rows) < PAGE_SIZE:
+                break
+        return synced
+
+    def contains_url(self, url):
+        return self._contains("urls", url)
+
+    def contains_author_title(self, author, title):
+        return self._contains("author_titles", author_title_key(author, title))
+
+    def add_many(self, articles):
+        """Add articles that were just inserted into the DB. URLs must be normalized already."""
+        self._add_rows(articles, normalize=False)
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def reset(self):
+        """Drop everything, so the next sync reloads the whole table."""
+        with self._lock, self._conn:
+            for table in ("urls", "author_titles", "meta"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self):
+        self._conn.close()
+
+    def _contains(self, table, key):
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT 1 FROM {table} WHERE digest = ?", (_digest(key),)
+            ).fetchone() is not None
+
+    def _add_rows(self, rows, normalize):
+        urls = []
+        author_titles = []
+        for row in rows:
+            if row.get("external_url"):
+                url = normalize_url(row["external_url"]) if normalize else row["external_url"]
+                urls.append((_digest(url),))
+            if row.get("title") and row.get("author"):
+                author_titles.append((_digest(author_title_key(row["author"], row["title"])),))
+
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO urls (digest) VALUES (?)", urls)
+            self._conn.executemany("INSERT OR IGNORE INTO author_titles (digest) VALUES (?)", author_titles)
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+
+from src.shared.config import CRAWLER_STATE_DIR
+
+# Entry URLs remembered per feed, enough to cover a feed's full window
+MAX_SEEN_URLS = 300
+
+
+class FeedStateStore:
+    """Persistent fetch state per feed URL, kept in a JSON file between crawls.
+
+    Each state holds the validators for conditional requests (etag,
+    last_modified), a hash of the last body, the newest entry date seen
+    (high_water) and the URLs of recently seen entries (seen_urls).
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CRAWLER_STATE_DIR, "feed_state.json")
+        self._states = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._states = json.load(f)
+        except FileNotFoundError:
+            self._states = {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read feed state, starting fresh: {e}")
+            self._states = {}
+
+    def get(self, feed_url):
+        return self._states.get(feed_url, {})
+
+    def update(self, feed_url, **fields):
+        state = self._states.setdefault(feed_url, {})
+        if "seen_urls" in fields:
+            # Newest first, so the oldest fall off when capped
+            merged = list(dict.fromkeys(fields["seen_urls"] + state.get("seen_urls", [])))
+            fields["seen_urls"] = merged[:MAX_SEEN_URLS]
+        if fields.get("high_water") and state.get("high_water"):
+            fields["high_water"] = max(fields["high_water"], state["high_water"])
+        state.update({k: v for k, v in fields.items() if v is not None})
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Write to a temp file first so a crash never leaves a truncated state
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._states, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
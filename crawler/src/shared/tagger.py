@@ -1,9 +1,27 @@
+import asyncio
+import hashlib
+import json
 import os
+import re
 import time
 import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
-from src.shared.config import GEMINI_API_KEY, TAG_RETRY_BASE_MS
+from src.shared.config import (
+    GEMINI_API_KEY, TAG_RETRY_BASE_MS, TAG_BATCH_SIZE, TAG_BATCH_CONCURRENCY,
+    TAG_REQUESTS_PER_MINUTE, CRAWLER_STATE_DIR,
+)
+
+GEMINI_MODEL = "gemini-2.5-flash"
+
+SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+}
+
+_model = None
 
 ALLOWED_TAGS = [
     # Frontend
@@ -51,28 +69,29 @@ Allowed List: {allowed}
 Output Format: Comma-separated list only. No extra text.
 """.strip()
 
+def get_model():
+    """The Gemini model client, configured once and reused for all requests."""
+    global _model
+    if _model is None:
+        genai.configure(api_key=GEMINI_API_KEY)
+        _model = genai.GenerativeModel(GEMINI_MODEL)
+    return _model
+
+def is_rate_limit_error(error):
+    error_msg = str(error)
+    return "429" in error_msg or "quota" in error_msg.lower()
+
 def generate_with_gemini(prompt, retry_count=0):
     if not GEMINI_API_KEY:
         print("⚠️ GEMINI_API_KEY is missing via config.")
         return ""
 
     try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel("gemini-2.5-flash")
-
-        response = model.generate_content(
-            prompt,
-            safety_settings={
-                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-            }
-        )
+        response = get_model().generate_content(prompt, safety_settings=SAFETY_SETTINGS)
         return response.text
     except Exception as e:
         error_msg = str(e)
-        if "429" in error_msg or "quota" in error_msg.lower():
+        if is_rate_limit_error(e):
             if retry_count < 3:
                 wait_time = (2 ** retry_count) * TAG_RETRY_BASE_MS / 1000.0
                 print(f"⏳ Rate Limit hit. Retrying in {wait_time}s... (Attempt {retry_count + 1}/3)")
@@ -85,32 +104,82 @@ def generate_with_gemini(prompt, retry_count=0):
         return ""
 
 
+# keyword -> (tag, weight). Keywords match whole words only, so "go" doesn't
+# match "google" and "ai" doesn't match "email". Ambiguous English words get a
+# low weight and only count when repeated, e.g. in both title and summary.
+KEYWORD_RULES = {
+    "react": ("react", 1.0), "리액트": ("react", 1.0),
+    "next.js": ("nextjs", 1.0), "nextjs": ("nextjs", 1.0),
+    "vue": ("frontend", 1.0), "angular": ("frontend", 1.0), "프론트엔드": ("frontend", 1.0),
+    "javascript": ("javascript", 1.0), "자바스크립트": ("javascript", 1.0),
+    "typescript": ("typescript", 1.0), "타입스크립트": ("typescript", 1.0), "css": ("css", 1.0),
+    "spring": ("spring", 0.4), "spring boot": ("spring", 1.0), "스프링": ("spring", 1.0),
+    "java": ("java", 1.0), "kotlin": ("backend", 1.0),
+    "node.js": ("nodejs", 1.0), "nodejs": ("nodejs", 1.0), "express": ("nodejs", 0.4),
+    "nestjs": ("nestjs", 1.0), "python": ("python", 1.0), "파이썬": ("python", 1.0),
+    "django": ("python", 1.0), "fastapi": ("python", 1.0),
+    "go": ("go", 0.4), "golang": ("go", 1.0), "rust": ("backend", 0.4), "백엔드": ("backend", 1.0),
+    "aws": ("cloud", 1.0), "azure": ("cloud", 1.0), "gcp": ("cloud", 1.0), "클라우드": ("cloud", 1.0),
+    "docker": ("docker", 1.0), "도커": ("docker", 1.0),
+    "k8s": ("kubernetes", 1.0), "kubernetes": ("kubernetes", 1.0), "쿠버네티스": ("kubernetes", 1.0),
+    "ci/cd": ("cicd", 1.0), "jenkins": ("cicd", 1.0), "github actions": ("cicd", 1.0),
+    "ai": ("ai", 1.0), "인공지능": ("ai", 1.0), "llm": ("llm", 1.0), "gpt": ("genai", 1.0),
+    "machine learning": ("ai-ml", 1.0), "머신러닝": ("ai-ml", 1.0),
+    "design": ("design", 0.4), "디자인": ("design", 0.4), "ux": ("ui/ux", 1.0), "ui": ("ui/ux", 1.0),
+    "career": ("career", 1.0), "커리어": ("career", 1.0), "interview": ("career", 0.4),
+    "면접": ("career", 1.0), "채용": ("career", 1.0), "salary": ("career", 1.0),
+    "startup": ("business", 1.0), "스타트업": ("business", 1.0),
+    "agile": ("culture", 1.0), "scrum": ("culture", 1.0), "애자일": ("culture", 1.0),
+}
+
+class KeywordTagger:
+    """Local keyword tagger, used when the AI API is unavailable.
+
+    All keywords are compiled into one regex, so an article is scanned once.
+    Each tag is scored by the weights of its keyword hits, title hits
+    counting double, and tags scoring at least `min_score` are kept.
+    """
+
+    def __init__(self, rules=None, title_weight=2.0, min_score=1.0, max_tags=5):
+        self.rules = {k.lower(): v for k, v in (rules or KEYWORD_RULES).items()}
+        self.title_weight = title_weight
+        self.min_score = min_score
+        self.max_tags = max_tags
+        # Longest first, so "spring boot" wins over "spring"
+        alternation = "|".join(re.escape(k) for k in sorted(self.rules, key=len, reverse=True))
+        # Only ASCII letters/digits break a match, so Korean keywords still match before particles
+        self.pattern = re.compile(rf"(?<![a-z0-9])(?:{alternation})(?![a-z0-9])")
+
+    def tag(self, title, summary=""):
+        scores = {}
+        for text, weight in ((title, self.title_weight), (summary, 1.0)):
+            for match in self.pattern.finditer((text or "").lower()):
+                tag, keyword_weight = self.rules[match.group()]
+                scores[tag] = scores.get(tag, 0.0) + keyword_weight * weight
+
+        ranked = sorted(
+            (tag for tag, score in scores.items() if score >= self.min_score),
+            key=lambda tag: -scores[tag],
+        )
+        return ranked[:self.max_tags]
+
+    def tag_many(self, articles):
+        """Tag a batch of article dicts (title, summary), returning a tag list for each."""
+        return [self.tag(a.get("title", ""), a.get("summary", "")) for a in articles]
+
+_keyword_tagger = KeywordTagger()
+
 def generate_tags_fallback(title, summary, author):
     """
-    Simple keyword matching fallback when AI API fails.
+    Keyword matching fallback when AI API fails.
+    """
+    return _keyword_tagger.tag(title, summary)
+
+def generate_tags_fallback_batch(articles):
+    """
+    Keyword tags for many articles at once, needs no API.
     """
-    combined_text = (title + " " + summary).lower()
-    found_tags = []
-
-    keyword_map = {
-        "react": "react", "next": "nextjs", "vue": "frontend", "angular": "frontend",
-        "javascript": "javascript", "typescript": "typescript", "css": "css",
-        "spring": "spring", "java": "java", "node": "nodejs", "express": "nodejs",
-        "nest": "nestjs", "python": "python", "django": "python", "fastapi": "python",
-        "go": "go", "golang": "go", "rust": "backend",
-        "aws": "cloud", "azure": "cloud", "gcp": "cloud", "docker": "docker", "k8s": "kubernetes",
-        "kubernetes": "kubernetes", "ci/cd": "cicd", "jenkins": "cicd", "github actions": "cicd",
-        "ai": "ai", "llm": "llm", "gpt": "genai", "machine learning": "ai-ml",
-        "design": "design", "ux": "ui/ux", "ui": "ui/ux",
-        "career": "career", "interview": "career", "salary": "career",
-        "startup": "business", "agile": "culture", "scrum": "culture"
-    }
-
-    for keyword, tag in keyword_map.items():
-        if keyword in combined_text:
-            found_tags.append(tag)
-
-    return merge_and_dedupe(found_tags)[:5]
+    return _keyword_tagger.tag_many(articles)
 
 def generate_tags_for_article(article):
     """
@@ -146,6 +215,163 @@ def generate_tags_for_article(article):
         print(f"❌ Error generating tags: {e}")
         return []
 
+# ======== Batch tagging ========
+
+class TokenBucket:
+    """Async rate limiter allowing `rate_per_minute` requests, with bursts up to `capacity`."""
+
+    def __init__(self, rate_per_minute, capacity=1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class TagCache:
+    """AI tags by article content hash, kept in a JSON file between crawls."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CRAWLER_STATE_DIR, "tag_cache.json")
+        self._tags = {}
+        self._dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._tags = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read tag cache, starting fresh: {e}")
+
+    @staticmethod
+    def content_hash(article):
+        content = "\n".join([article.get("author", ""), article.get("title", ""), article.get("summary", "")])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, article):
+        return self._tags.get(self.content_hash(article))
+
+    def set(self, article, tags):
+        self._tags[self.content_hash(article)] = tags
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._tags, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+def build_batch_prompt(articles):
+    allowed = ", ".join(ALLOWED_TAGS)
+    listing = "\n".join(
+        f"{i}. Title: {a.get('title', '')} | Author/Blog: {a.get('author', '')} | Summary: {a.get('summary', '')}"
+        for i, a in enumerate(articles)
+    )
+    return f"""
+You are a concise tagger for a tech blog aggregator.
+Articles:
+{listing}
+
+Task: For each article, choose 3-6 tags that best describe it from the allowed list.
+Allowed List: {allowed}
+
+Output Format: JSON array only, one object per article: [{{"id": <article number>, "tags": ["tag", ...]}}]
+""".strip()
+
+def parse_batch_response(text, count):
+    """Map the JSON response back to the articles. Returns a list of tag lists, None where missing."""
+    results = [None] * count
+    try:
+        items = json.loads(text)
+    except (TypeError, ValueError):
+        print(f"⚠️ Batch tagging returned invalid JSON: {str(text)[:80]}...")
+        return results
+
+    for item in items if isinstance(items, list) else []:
+        if not isinstance(item, dict) or not isinstance(item.get("tags"), list):
+            continue
+        index = item.get("id")
+        # Models sometimes quote the article numbers
+        if isinstance(index, str) and index.strip().isdigit():
+            index = int(index)
+        if isinstance(index, int) and not isinstance(index, bool) and 0 <= index < count:
+            filtered = [tag for tag in merge_and_dedupe(item["tags"]) if tag in ALLOWED_TAGS]
+            results[index] = filtered[:6] or None
+    return results
+
+async def generate_batch_with_gemini(prompt, retry_count=0):
+    try:
+        response = await get_model().generate_content_async(
+            prompt,
+            safety_settings=SAFETY_SETTINGS,
+            generation_config={"response_mime_type": "application/json"},
+        )
+        return response.text
+    except Exception as e:
+        if is_rate_limit_error(e) and retry_count < 3:
+            wait_time = (2 ** retry_count) * TAG_RETRY_BASE_MS / 1000.0
+            print(f"⏳ Rate Limit hit. Retrying batch in {wait_time}s... (Attempt {retry_count + 1}/3)")
+            await asyncio.sleep(wait_time)
+            return await generate_batch_with_gemini(prompt, retry_count + 1)
+        print(f"❌ Gemini batch request failed: {e}")
+        return ""
+
+class BatchTagger:
+    """Tags many articles with few requests: N articles per prompt, batches run
+    concurrently under a shared rate limit, and results are cached by content."""
+
+    def __init__(self, batch_size=TAG_BATCH_SIZE, concurrency=TAG_BATCH_CONCURRENCY,
+                 requests_per_minute=TAG_REQUESTS_PER_MINUTE, cache=None):
+        self.batch_size = batch_size
+        self.bucket = TokenBucket(requests_per_minute)
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.cache = cache or TagCache()
+
+    async def tag_articles(self, articles):
+        """Returns a tag list for each article, in order."""
+        results = [self.cache.get(a) for a in articles]
+        misses = [i for i, tags in enumerate(results) if tags is None]
+
+        if misses and GEMINI_API_KEY:
+            batches = [misses[i:i + self.batch_size] for i in range(0, len(misses), self.batch_size)]
+            batch_results = await asyncio.gather(*[
+                self._tag_batch([articles[i] for i in batch]) for batch in batches
+            ])
+            for batch, tags_list in zip(batches, batch_results):
+                for i, tags in zip(batch, tags_list):
+                    if tags:
+                        results[i] = tags
+                        self.cache.set(articles[i], tags)
+        elif misses:
+            print("⚠️ GEMINI_API_KEY missing - using fallback.")
+
+        # Whatever the API couldn't tag gets keyword tags, which are not cached
+        untagged = [i for i, tags in enumerate(results) if tags is None]
+        for i, tags in zip(untagged, generate_tags_fallback_batch([articles[i] for i in untagged])):
+            results[i] = tags
+        return results
+
+    async def _tag_batch(self, batch):
+        async with self.semaphore:
+            await self.bucket.acquire()
+            print(f"🏷️ Tagging batch of {len(batch)} articles...")
+            text = await generate_batch_with_gemini(build_batch_prompt(batch))
+        return parse_batch_response(text, len(batch)) if text else [None] * len(batch)
+
 def base_tags_from_feed_category(category):
     if not category:
         return []
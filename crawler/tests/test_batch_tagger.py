@@ -0,0 +1,100 @@
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.shared.tagger import TagCache, TokenBucket, parse_batch_response
+
+class TestParseBatchResponse(unittest.TestCase):
+    def test_maps_tags_by_id(self):
+        text = json.dumps([
+            {"id": 1, "tags": ["React", "frontend", "react", "not-allowed"]},
+            {"id": 0, "tags": ["python"]},
+        ])
+        self.assertEqual(parse_batch_response(text, 3), [["python"], ["react", "frontend"], None])
+
+    def test_string_ids(self):
+        text = json.dumps([{"id": "0", "tags": ["go"]}, {"id": " 1 ", "tags": ["docker"]}])
+        self.assertEqual(parse_batch_response(text, 2), [["go"], ["docker"]])
+
+    def test_bad_items_are_skipped(self):
+        text = json.dumps([
+            {"id": 5, "tags": ["go"]},
+            {"id": -1, "tags": ["go"]},
+            {"id": True, "tags": ["go"]},
+            {"id": "x", "tags": ["go"]},
+            {"id": 0, "tags": "go"},
+            {"id": 1, "tags": ["not-allowed"]},
+            "go",
+        ])
+        self.assertEqual(parse_batch_response(text, 2), [None, None])
+
+    def test_invalid_json(self):
+        self.assertEqual(parse_batch_response("not json", 2), [None, None])
+        self.assertEqual(parse_batch_response(json.dumps({"id": 0}), 1), [None])
+
+class TestTagCache(unittest.TestCase):
+    def test_round_trip_by_content(self):
+        article = {"author": "Toss", "title": "React 19", "summary": "..."}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state", "tag_cache.json")
+            cache = TagCache(path)
+            self.assertIsNone(cache.get(article))
+            cache.set(article, ["react"])
+            cache.save()
+
+            reloaded = TagCache(path)
+            self.assertEqual(reloaded.get(dict(article)), ["react"])
+            self.assertIsNone(reloaded.get({**article, "summary": "changed"}))
+
+    def test_save_only_when_dirty(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tag_cache.json")
+            TagCache(path).save()
+            self.assertFalse(os.path.exists(path))
+
+    def test_corrupt_file_starts_fresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tag_cache.json")
+            with open(path, "w") as f:
+                f.write("{not json")
+            self.assertIsNone(TagCache(path).get({"title": "x"}))
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        async def run():
+            bucket = TokenBucket(rate_per_minute=600, capacity=2)
+            start = time.monotonic()
+            for _ in range(4):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        # Two tokens up front, then one every 0.1s
+        elapsed = asyncio.run(run())
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertLess(elapsed, 0.5)
+
+    def test_concurrent_acquires_are_serialized(self):
+        async def run():
+            bucket = TokenBucket(rate_per_minute=1200, capacity=1)
+            times = []
+
+            async def take():
+                await bucket.acquire()
+                times.append(time.monotonic())
+
+            await asyncio.gather(*(take() for _ in range(3)))
+            return times
+
+        times = asyncio.run(run())
+        self.assertGreaterEqual(times[2] - times[0], 0.09)
+
+if __name__ == '__main__':
+    unittest.main()
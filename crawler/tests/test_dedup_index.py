@@ -0,0 +1,117 @@
+
+import unittest
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.shared import dedup_index
+from src.shared.dedup_index import DedupIndex
+
+class FakeQuery:
+    """The chain of the supabase query builder used by DedupIndex.sync."""
+
+    def __init__(self, client):
+        self.client = client
+        self.last_id = None
+        self.size = None
+
+    def select(self, columns):
+        return self
+
+    def gt(self, column, value):
+        self.last_id = value
+        return self
+
+    def order(self, column):
+        return self
+
+    def limit(self, size):
+        self.size = size
+        return self
+
+    def execute(self):
+        self.client.queries.append(self.last_id)
+        rows = [row for row in self.client.rows if row["id"] > self.last_id]
+        return SimpleNamespace(data=rows[:self.size])
+
+class FakeSupabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def table(self, name):
+        return FakeQuery(self)
+
+def blog(id, url, title="Title", author="Toss"):
+    return {"id": id, "external_url": url, "title": f"{title} {id}", "author": author}
+
+class TestDedupIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "dedup_index.sqlite3")
+        self.index = DedupIndex(self.path)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_sync_pages_and_advances_watermark(self):
+        supabase = FakeSupabase([blog(i, f"https://toss.tech/{i}") for i in range(1, 6)])
+        with mock.patch.object(dedup_index, "PAGE_SIZE", 2):
+            self.assertEqual(self.index.sync(supabase), 5)
+        self.assertEqual(supabase.queries, [0, 2, 4])
+        self.assertEqual(self.index.watermark, 5)
+        self.assertEqual(len(self.index), 5)
+        self.assertTrue(self.index.contains_url("https://toss.tech/3"))
+        self.assertTrue(self.index.contains_author_title("Toss", "Title 3"))
+
+    def test_next_sync_only_pulls_new_rows(self):
+        supabase = FakeSupabase([blog(i, f"https://toss.tech/{i}") for i in range(1, 5)])
+        self.index.sync(supabase)
+        supabase.rows.append(blog(7, "https://toss.tech/7"))
+        supabase.queries.clear()
+
+        with mock.patch.object(dedup_index, "RESCAN_WINDOW", 2):
+            self.assertEqual(self.index.sync(supabase), 1)
+        self.assertEqual(supabase.queries, [2])
+        self.assertEqual(self.index.watermark, 7)
+
+    def test_rows_committed_late_are_picked_up(self):
+        # Id 2 was taken first but committed after id 3 had been synced
+        supabase = FakeSupabase([blog(1, "https://toss.tech/1"), blog(3, "https://toss.tech/3")])
+        self.index.sync(supabase)
+        supabase.rows.insert(1, blog(2, "https://toss.tech/2"))
+
+        self.assertEqual(self.index.sync(supabase), 0)
+        self.assertTrue(self.index.contains_url("https://toss.tech/2"))
+        self.assertEqual(self.index.watermark, 3)
+
+    def test_watermark_persists(self):
+        self.index.sync(FakeSupabase([blog(3, "https://toss.tech/3")]))
+        self.index.close()
+        self.index = DedupIndex(self.path)
+        self.assertEqual(self.index.watermark, 3)
+        self.assertTrue(self.index.contains_url("https://toss.tech/3"))
+
+    def test_reset_forgets_the_watermark(self):
+        self.index.sync(FakeSupabase([blog(3, "https://toss.tech/3")]))
+        self.index.reset()
+        self.assertEqual(self.index.watermark, 0)
+        self.assertFalse(self.index.contains_url("https://toss.tech/3"))
+
+    def test_sync_normalizes_urls(self):
+        self.index.sync(FakeSupabase([blog(1, "https://toss.tech/a?utm_source=rss")]))
+        self.assertTrue(self.index.contains_url("https://toss.tech/a"))
+
+    def test_add_many_keeps_the_watermark(self):
+        self.index.add_many([{"external_url": "https://toss.tech/new", "title": "New", "author": "Toss"}])
+        self.assertTrue(self.index.contains_url("https://toss.tech/new"))
+        self.assertEqual(self.index.watermark, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+
+import unittest
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.shared.tagger import KeywordTagger
+
+class TestKeywordTagger(unittest.TestCase):
+    def setUp(self):
+        self.tagger = KeywordTagger()
+
+    def test_whole_words_only(self):
+        self.assertEqual(self.tagger.tag("How Google scales email delivery"), [])
+        self.assertEqual(self.tagger.tag("Building an AI assistant"), ["ai"])
+        self.assertEqual(self.tagger.tag("Golang generics in practice"), ["go"])
+
+    def test_punctuation_inside_keywords(self):
+        self.assertEqual(self.tagger.tag("Next.js and Node.js"), ["nextjs", "nodejs"])
+        self.assertEqual(self.tagger.tag("Our CI/CD pipeline"), ["cicd"])
+
+    def test_korean_keywords_before_particles(self):
+        self.assertEqual(self.tagger.tag("쿠버네티스를 도입하며"), ["kubernetes"])
+
+    def test_longest_keyword_wins(self):
+        # "spring boot" scores fully, a lone "spring" is ambiguous
+        self.assertEqual(self.tagger.tag("Migrating to Spring Boot 3"), ["spring"])
+        self.assertEqual(self.tagger.tag("", "Spring cleaning of our backlog"), [])
+
+    def test_weak_keywords_need_repeats(self):
+        # Weight 0.4: once in the title scores 0.8, title and summary 1.2
+        self.assertEqual(self.tagger.tag("Go at scale"), [])
+        self.assertEqual(self.tagger.tag("Go at scale", "Why we chose go"), ["go"])
+
+    def test_ranked_by_score_and_capped(self):
+        tagger = KeywordTagger(max_tags=2)
+        tags = tagger.tag("Docker and Python", "python, docker, docker, aws")
+        self.assertEqual(tags, ["docker", "python"])
+
+    def test_tag_many(self):
+        articles = [{"title": "React hooks"}, {"title": "Plain", "summary": "Kubernetes"}]
+        self.assertEqual(self.tagger.tag_many(articles), [["react"], ["kubernetes"]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,9 @@
+-- 크롤러가 external_url 기준으로 upsert 할 수 있도록 유니크 인덱스 추가
+
+-- 기존 중복 URL은 가장 먼저 저장된 글만 남기고 제거
+DELETE FROM blogs a
+USING blogs b
+WHERE a.external_url = b.external_url
+  AND a.id > b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_blogs_external_url_unique ON blogs(external_url);